@@ -0,0 +1,32 @@
+import asyncio
+import functools
+import inspect
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, List, Mapping, Tuple
+
+
+# Shared (read-only) tool callables mapping for agents without any tools.
+_EMPTY_TOOL_CALLABLES: Mapping[str, Callable] = MappingProxyType({})
+
+
+async def _invoke_tool(tool_callable: Callable, args: dict) -> Any:
+    """
+    Invokes a tool (function) with the given arguments.
+    Coroutine functions are awaited directly, whereas regular callables are run in the default executor
+    so that they don't block the event loop.
+    """
+    if inspect.iscoroutinefunction(tool_callable):
+        return await tool_callable(**args)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(tool_callable, **args))
+
+
+async def _invoke_tools(calls: Iterable[Tuple[Callable, dict]]) -> List[Any]:
+    """
+    Invokes multiple tools (functions) concurrently.
+    The outputs are returned in the same order as the given (callable, args) pairs.
+    """
+    return await asyncio.gather(
+        *[_invoke_tool(tool_callable, args) for tool_callable, args in calls]
+    )
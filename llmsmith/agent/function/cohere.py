@@ -1,7 +1,6 @@
 try:
     import cohere
     from cohere import ChatRequestToolResultsItem
-    from cohere.types.tool import Tool
     from cohere.types.tool_call import ToolCall
     from cohere.types.chat_message import ChatMessage
     from cohere.types.non_streamed_chat_response import NonStreamedChatResponse
@@ -10,13 +9,17 @@ except ImportError:
         "The 'cohere' library is required to use Cohere LLMs. You can install it with `pip install \"llmsmith[cohere]\"`"
     )
 
+import functools
 import logging
-from typing import Callable, List
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Union
 
 from llmsmith.agent.errors import MaxTurnsReachedException
+from llmsmith.agent.function.base import _EMPTY_TOOL_CALLABLES, _invoke_tools
 from llmsmith.agent.tool.cohere import CohereTool
 from llmsmith.task.base import Task
 from llmsmith.task.models import ChatResponse, TaskInput, TaskOutput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.cohere import BaseCohereChat
 from llmsmith.task.textgen.options.cohere import CohereTextGenOptions
 
@@ -39,9 +42,11 @@ class CohereFunctionAgent(Task[str, str]):
     :param llm_options: A dictionary of options to pass to the Cohere LLM.
     :type llm_options: :class:`llmsmith.task.textgen.options.cohere.CohereTextGenOptions`, optional
     :param tools: List of tools (functions) which can be used by the Cohere LLMs. Each tool contains both the declaration and the actual callable.
-    :type tools: :class:`llmsmith.agent.tool.cohere.CohereTool`
+    :type tools: :class:`llmsmith.agent.tool.cohere.CohereTool`, optional
     :param max_turns: Maximum number of turns allowed in the agent loop. Defaults to 5.
     :type max_turns: str
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty or if max_turns is less than 1.
     """
 
@@ -50,8 +55,9 @@ class CohereFunctionAgent(Task[str, str]):
         name: str,
         llm: cohere.AsyncClient,
         llm_options: CohereTextGenOptions,
-        tools: List[CohereTool] = [],
+        tools: Union[List[CohereTool], None] = None,
         max_turns: int = 5,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         super().__init__(name)
 
@@ -60,20 +66,16 @@ class CohereFunctionAgent(Task[str, str]):
 
         self._chat = BaseCohereChat(llm, llm_options)
         self.max_turns = max_turns
-
-        # Convert to Tool class if declaration is of dict type
-        for tool in tools:
-            if isinstance(tool.declaration, dict):
-                tool.declaration = Tool(
-                    name=tool.declaration.get("name"),
-                    description=tool.declaration.get("description"),
-                    parameter_definitions=tool.declaration.get("parameter_definitions"),
-                )
-
-        self.llm_tools = [tool.declaration for tool in tools]
-        self._tool_callables: dict[str, Callable] = {
-            tool.declaration.name: tool.callable for tool in tools
-        }
+        self._response_cache = response_cache
+
+        if not tools:
+            self.llm_tools = []
+            self._tool_callables: Mapping[str, Callable] = _EMPTY_TOOL_CALLABLES
+        else:
+            self.llm_tools = [tool.declaration for tool in tools]
+            self._tool_callables: Mapping[str, Callable] = MappingProxyType(
+                {tool.declaration.name: tool.callable for tool in tools}
+            )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -97,10 +99,27 @@ class CohereFunctionAgent(Task[str, str]):
         func_results: List[ChatRequestToolResultsItem] = []
         chat_hist: List[ChatMessage] = []
 
+        chat = self._chat.chat
+        llm_tools = self.llm_tools
+        tool_callables = self._tool_callables
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if (
+            self._response_cache is not None
+            and self._chat.llm_options.get("temperature") == 0
+        ):
+            chat = functools.partial(
+                self._response_cache.cached_chat,
+                chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
+
         for turn in range(self.max_turns):
-            chat_response: ChatResponse = await self._chat.chat(
+            chat_response: ChatResponse = await chat(
                 message=llm_input_content,
-                tools=self.llm_tools,
+                tools=llm_tools,
                 tool_results=func_results or None,
                 chat_history=chat_hist or None,
             )
@@ -111,21 +130,26 @@ class CohereFunctionAgent(Task[str, str]):
 
             # Exit condition: If no function calls are required.
             if not func_calls:
-                log.debug(
-                    f"CohereFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        f"CohereFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
+                    )
                 return TaskOutput(
                     content=chat_response.text,
                     raw_output=chat_response.raw_output,
                 )
 
-            log.debug(
-                f"CohereFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
+            if debug_enabled:
+                log.debug(
+                    f"CohereFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
+                )
+
+            # Execute functions (tools) concurrently
+            func_outputs = await _invoke_tools(
+                (tool_callables[func.name], func.args) for func in func_calls.values()
             )
 
-            # Execute functions (tools)
-            for _, func in func_calls.items():
-                func_output = self._tool_callables[func.name](**func.args)
+            for func, func_output in zip(func_calls.values(), func_outputs):
                 tool_call = ToolCall(name=func.name, parameters=func.args)
                 func_results.append(
                     {"call": tool_call, "outputs": [{"answer": func_output}]}
@@ -2,7 +2,6 @@ try:
     from google.ai.generativelanguage_v1beta.types import (
         Part,
         FunctionCall,
-        FunctionDeclaration,
         FunctionResponse,
         Tool,
     )
@@ -12,14 +11,22 @@ except ImportError:
         "The 'google.generativeai' library is required to use Gemini LLMs. You can install it with `pip install \"llmsmith[gemini]\"`"
     )
 
+import functools
+import itertools
 import logging
-from typing import Callable, List
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Union
 from llmsmith.agent.errors import MaxTurnsReachedException
+from llmsmith.agent.function.base import _invoke_tools
 from llmsmith.agent.tool.gemini import GeminiTool
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.gemini import BaseGeminiChat
-from llmsmith.task.textgen.options.gemini import GeminiTextGenOptions
+from llmsmith.task.textgen.options.gemini import (
+    GeminiTextGenOptions,
+    get_temperature,
+)
 
 
 log = logging.getLogger(__name__)
@@ -40,9 +47,11 @@ class GeminiFunctionAgent(Task[str, str]):
     :param llm_options: A dictionary of options to pass to the Gemini LLM.
     :type llm_options: :class:`llmsmith.task.textgen.options.gemini.GeminiTextGenOptions`, optional
     :param tools: List of tools (functions) which can be used by the Gemini LLMs. Each tool contains both the declaration and the actual callable.
-    :type tools: :class:`llmsmith.agent.tool.gemini.GeminiTool`
+    :type tools: :class:`llmsmith.agent.tool.gemini.GeminiTool`, optional
     :param max_turns: Maximum number of turns allowed in the agent loop. Defaults to 5.
     :type max_turns: str
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty or if max_turns is less than 1.
     """
 
@@ -51,21 +60,20 @@ class GeminiFunctionAgent(Task[str, str]):
         name: str,
         llm: GenerativeModel,
         llm_options: GeminiTextGenOptions,
-        tools: List[GeminiTool] = [],
+        tools: Union[List[GeminiTool], None] = None,
         max_turns: int = 5,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         super().__init__(name)
 
+        tools = tools or []
+
         if max_turns <= 0:
             raise ValueError("max_turns should be 1 or above")
 
         self._chat = BaseGeminiChat(llm, llm_options)
         self.max_turns = max_turns
-
-        # Convert to FunctionDeclaration if declaration is of dict type
-        for tool in tools:
-            if isinstance(tool.declaration, dict):
-                tool.declaration = FunctionDeclaration(tool.declaration)
+        self._response_cache = response_cache
 
         function_declarations = [tool.declaration for tool in tools]
         self.llm_tools = (
@@ -73,9 +81,9 @@ class GeminiFunctionAgent(Task[str, str]):
             if function_declarations
             else None
         )
-        self._tool_callables: dict[str, Callable] = {
-            tool.declaration.name: tool.callable for tool in tools
-        }
+        self._tool_callables: Mapping[str, Callable] = MappingProxyType(
+            {tool.declaration.name: tool.callable for tool in tools}
+        )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -98,52 +106,78 @@ class GeminiFunctionAgent(Task[str, str]):
         llm_input_content: str = task_input.content
         messages_payload: List[dict] = [{"role": "user", "parts": [llm_input_content]}]
 
+        chat = self._chat.chat
+        llm_tools = self.llm_tools
+        tool_callables = self._tool_callables
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if (
+            self._response_cache is not None
+            and get_temperature(self._chat.llm_options) == 0
+        ):
+            chat = functools.partial(
+                self._response_cache.cached_chat,
+                chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
+
         for turn in range(self.max_turns):
-            chat_response = await self._chat.chat(
-                messages_payload=messages_payload, tools=self.llm_tools
+            chat_response = await chat(
+                messages_payload=messages_payload, tools=llm_tools
             )
 
             func_calls = chat_response.function_calls or {}
 
             # Exit condition: If no function calls are required.
             if not func_calls:
-                log.debug(
-                    f"GeminiFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        f"GeminiFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
+                    )
                 return TaskOutput(
                     content=chat_response.text,
                     raw_output=chat_response.raw_output,
                 )
 
-            log.debug(
-                f"GeminiFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
+            if debug_enabled:
+                log.debug(
+                    f"GeminiFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
+                )
+
+            # Execute functions (tools) concurrently
+            func_outputs = await _invoke_tools(
+                (tool_callables[func.name], func.args) for func in func_calls.values()
             )
 
-            for _, func in func_calls.items():
-                func_output = self._tool_callables[func.name](**func.args)
-                messages_payload.append(
-                    {
-                        "role": "function",
-                        "parts": [
-                            Part(
-                                function_call=FunctionCall(
-                                    name=func.name, args=func.args
+            # Add both the function call and its response for each tool in a single extend
+            messages_payload.extend(
+                itertools.chain.from_iterable(
+                    (
+                        {
+                            "role": "function",
+                            "parts": [
+                                Part(
+                                    function_call=FunctionCall(
+                                        name=func.name, args=func.args
+                                    )
                                 )
-                            )
-                        ],
-                    }
-                )
-                messages_payload.append(
-                    {
-                        "role": "function",
-                        "parts": [
-                            Part(
-                                function_response=FunctionResponse(
-                                    name=func.name, response={"result": func_output}
+                            ],
+                        },
+                        {
+                            "role": "function",
+                            "parts": [
+                                Part(
+                                    function_response=FunctionResponse(
+                                        name=func.name, response={"result": func_output}
+                                    )
                                 )
-                            )
-                        ],
-                    }
+                            ],
+                        },
+                    )
+                    for func, func_output in zip(func_calls.values(), func_outputs)
                 )
+            )
 
         raise MaxTurnsReachedException()
@@ -5,16 +5,20 @@ except ImportError:
         "The 'groq' library is required to use LLMs in Groq. You can install it with `pip install \"llmsmith[groq]\"`"
     )
 
-import json
+import functools
 import logging
-from typing import Callable, List
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Union
 
 from llmsmith.agent.errors import MaxTurnsReachedException
+from llmsmith.agent.function.base import _EMPTY_TOOL_CALLABLES, _invoke_tools
 from llmsmith.agent.tool.groq import GroqTool
 from llmsmith.task.base import Task
 from llmsmith.task.models import ChatResponse, TaskInput, TaskOutput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.groq import BaseGroqChat
 from llmsmith.task.textgen.options.groq import GroqTextGenOptions
+from llmsmith.utils import json_dumps
 
 
 log = logging.getLogger(__name__)
@@ -35,9 +39,11 @@ class GroqFunctionAgent(Task[str, str]):
     :param llm_options: A dictionary of options to pass to the LLM in Groq.
     :type llm_options: :class:`llmsmith.task.textgen.options.groq.GroqTextGenOptions`, optional
     :param tools: List of tools (functions) which can be used by the LLMs in Groq. Each tool contains both the declaration and the actual callable.
-    :type tools: :class:`llmsmith.agent.tool.groq.GroqTool`
+    :type tools: :class:`llmsmith.agent.tool.groq.GroqTool`, optional
     :param max_turns: Maximum number of turns allowed in the agent loop. Defaults to 5.
     :type max_turns: str
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty or if max_turns is less than 1.
     """
 
@@ -46,8 +52,9 @@ class GroqFunctionAgent(Task[str, str]):
         name: str,
         llm: groq.AsyncGroq,
         llm_options: GroqTextGenOptions,
-        tools: List[GroqTool] = [],
+        tools: Union[List[GroqTool], None] = None,
         max_turns: int = 5,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         super().__init__(name)
 
@@ -56,12 +63,20 @@ class GroqFunctionAgent(Task[str, str]):
 
         self._chat = BaseGroqChat(llm, llm_options)
         self.max_turns = max_turns
-        self.llm_tools = [tool.declaration for tool in tools] if tools else None
-        self._tool_callables: dict[str, Callable] = {
-            tool.declaration["function"]["name"]: tool.callable
-            for tool in tools
-            if tool.declaration["type"] == "function"
-        }
+        self._response_cache = response_cache
+
+        if not tools:
+            self.llm_tools = None
+            self._tool_callables: Mapping[str, Callable] = _EMPTY_TOOL_CALLABLES
+        else:
+            self.llm_tools = [tool.declaration for tool in tools]
+            self._tool_callables: Mapping[str, Callable] = MappingProxyType(
+                {
+                    tool.declaration["function"]["name"]: tool.callable
+                    for tool in tools
+                    if tool.declaration["type"] == "function"
+                }
+            )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -83,57 +98,79 @@ class GroqFunctionAgent(Task[str, str]):
 
         llm_input_content: str = task_input.content
         messages_payload: List[dict] = [{"role": "user", "content": llm_input_content}]
+        # System prompt is added upfront, so that it stays in the payload even when the response is served from the cache
+        self._chat._add_system_prompt(messages_payload)
+
+        chat = self._chat.chat
+        llm_tools = self.llm_tools
+        tool_callables = self._tool_callables
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if (
+            self._response_cache is not None
+            and self._chat.llm_options.get("temperature") == 0
+        ):
+            chat = functools.partial(
+                self._response_cache.cached_chat,
+                chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
 
         for turn in range(self.max_turns):
-            chat_response: ChatResponse = await self._chat.chat(
+            chat_response: ChatResponse = await chat(
                 messages_payload=messages_payload,
-                tools=self.llm_tools,
+                tools=llm_tools,
             )
 
             func_calls = chat_response.function_calls or {}
 
             # Exit condition: If no function calls are required.
             if not func_calls:
-                log.debug(
-                    f"GroqFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        f"GroqFunctionAgent turn-{turn+1} | Exiting agent loop with text output: {chat_response.text}"
+                    )
                 return TaskOutput(
                     content=chat_response.text,
                     raw_output=chat_response.raw_output,
                 )
 
-            log.debug(
-                f"GroqFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
-            )
+            if debug_enabled:
+                log.debug(
+                    f"GroqFunctionAgent turn-{turn+1} | Function call required: {func_calls}"
+                )
+
+            func_call_items = list(func_calls.items())
 
             # Add required function calls in the messages payload required for the next LLM call
-            messages_payload.append(
+            tool_calls: List[dict] = [
                 {
-                    "role": "assistant",
-                    "tool_calls": [
-                        {
-                            "id": tool_id,
-                            "function": {
-                                "name": func.name,
-                                "arguments": json.dumps(func.args),
-                            },
-                            "type": "function",
-                        }
-                        for tool_id, func in func_calls.items()
-                    ],
+                    "id": tool_id,
+                    "function": {
+                        "name": func.name,
+                        "arguments": json_dumps(func.args),
+                    },
+                    "type": "function",
                 }
+                for tool_id, func in func_call_items
+            ]
+            messages_payload.append({"role": "assistant", "tool_calls": tool_calls})
+
+            # Execute functions (tools) concurrently
+            func_outputs = await _invoke_tools(
+                (tool_callables[func.name], func.args) for _, func in func_call_items
             )
 
-            # Execute functions (tools)
-            for tool_id, func in func_calls.items():
-                func_output = self._tool_callables[func.name](**func.args)
-                messages_payload.append(
-                    {
-                        "tool_call_id": tool_id,
-                        "role": "tool",
-                        "name": func.name,
-                        "content": str(func_output),
-                    }
-                )
+            messages_payload.extend(
+                {
+                    "tool_call_id": tool_id,
+                    "role": "tool",
+                    "name": func.name,
+                    "content": str(func_output),
+                }
+                for (tool_id, func), func_output in zip(func_call_items, func_outputs)
+            )
 
         raise MaxTurnsReachedException()
@@ -1,17 +1,20 @@
 try:
     import openai
+    from openai.lib.streaming import AsyncAssistantStreamManager
     from openai.types.beta import Assistant, Thread
-    from openai.types.beta.threads import Run
+    from openai.types.beta.threads import Message, Run
 except ImportError:
     raise ImportError(
         "The 'openai' library is required to use OpenAI LLMs. You can install it with `pip install \"llmsmith[openai]\"`"
     )
 
-import json
 import logging
-from typing import Callable, List
+import sys
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Tuple, Union
 
 from llmsmith.agent.errors import MaxTurnsReachedException
+from llmsmith.agent.function.base import _invoke_tools
 from llmsmith.agent.function.options.openai import (
     OpenAIAssistantOptions,
     _create_assistant_options_dict,
@@ -20,6 +23,7 @@ from llmsmith.agent.tool.openai import OpenAIAssistantTool
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
 from llmsmith.task.textgen.errors import TextGenFailedException
+from llmsmith.utils import json_loads
 
 
 log = logging.getLogger(__name__)
@@ -40,7 +44,7 @@ class OpenAIFunctionAgent(Task[str, str]):
     :param assistant: The OpenAI assistant.
     :type assistant: :class:`openai.types.beta.Assistant`
     :param tools: List of tools (file search, code interpreter, functions) which can be used by the OpenAI LLMs. Tools of `function` type should have the actual callable too.
-    :type tools: List[:class:`llmsmith.agent.tool.openai.OpenAIAssistantTool`]
+    :type tools: List[:class:`llmsmith.agent.tool.openai.OpenAIAssistantTool`], optional
     :param max_turns: Maximum number of turns allowed in the agent loop. Defaults to 5.
     :type max_turns: str
     :raises ValueError: If the name is empty or if max_turns is less than 1.
@@ -51,11 +55,13 @@ class OpenAIFunctionAgent(Task[str, str]):
         name: str,
         llm: openai.AsyncOpenAI,
         assistant: Assistant,
-        tools: List[OpenAIAssistantTool] = [],
+        tools: Union[List[OpenAIAssistantTool], None] = None,
         max_turns: int = 5,
     ) -> None:
         super().__init__(name)
 
+        tools = tools or []
+
         if max_turns <= 0:
             raise ValueError("max_turns should be 1 or above")
 
@@ -64,11 +70,13 @@ class OpenAIFunctionAgent(Task[str, str]):
         self._assistant = assistant
         self.max_turns = max_turns
 
-        self._tool_callables: dict[str, Callable] = {
-            tool.declaration["function"]["name"]: tool.callable
-            for tool in tools
-            if tool.declaration["type"] == "function"
-        }
+        self._tool_callables: Mapping[str, Callable] = MappingProxyType(
+            {
+                sys.intern(tool.declaration["function"]["name"]): tool.callable
+                for tool in tools
+                if tool.declaration["type"] == "function"
+            }
+        )
 
     @classmethod
     async def create(
@@ -76,7 +84,7 @@ class OpenAIFunctionAgent(Task[str, str]):
         name: str,
         llm: openai.AsyncOpenAI,
         assistant_options: OpenAIAssistantOptions,
-        tools: List[OpenAIAssistantTool] = [],
+        tools: Union[List[OpenAIAssistantTool], None] = None,
         max_turns: int = 5,
     ):
         """
@@ -89,7 +97,7 @@ class OpenAIFunctionAgent(Task[str, str]):
         :param assistant_options: A dictionary of options to pass to the OpenAI assistant.
         :type assistant_options: :class:`llmsmith.agent.function.options.openai.OpenAIAssistantOptions`, optional
         :param tools: List of tools (file search, code interpreter, functions) which can be used by the OpenAI LLMs. Tools of `function` type should have the actual callable too.
-        :type tools: List[:class:`llmsmith.agent.tool.openai.OpenAIAssistantTool`]
+        :type tools: List[:class:`llmsmith.agent.tool.openai.OpenAIAssistantTool`], optional
         :param max_turns: Maximum number of turns allowed in the agent loop. Defaults to 5.
         :type max_turns: str
         :raises ValueError: If the name is empty or if max_turns is less than 1.
@@ -135,33 +143,29 @@ class OpenAIFunctionAgent(Task[str, str]):
             thread_id=thread.id, role="user", content=llm_input_content
         )
 
-        run: Run = await self.llm.beta.threads.runs.create_and_poll(
+        run_stream: AsyncAssistantStreamManager = self.llm.beta.threads.runs.stream(
             thread_id=thread.id,
             assistant_id=self._assistant.id,
         )
 
+        tool_callables = self._tool_callables
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
         for turn in range(self.max_turns):
-            messages = await self.llm.beta.threads.messages.list(
-                thread_id=thread.id,
-                run_id=run.id,
-                order="desc",
-                limit=1,
-            )
+            run, message = await self.__consume_run_stream(run_stream)
 
             # exit agent with the LLM response if no function calls are required
             if run.status == "completed":
-                assistant_res: str = next(
-                    (
-                        content.text.value
-                        for content in messages.data[0].content
-                        if content.type == "text"
-                    ),
-                    None,
-                )
-
-                log.debug(
-                    f"OpenAIFunctionAgent turn-{turn+1} | Exiting agent loop with text output: f{assistant_res}"
-                )
+                assistant_res: Union[str, None] = None
+                for content in message.content if message else []:
+                    if content.type == "text":
+                        assistant_res = content.text.value
+                        break
+
+                if debug_enabled:
+                    log.debug(
+                        f"OpenAIFunctionAgent turn-{turn+1} | Exiting agent loop with text output: f{assistant_res}"
+                    )
 
                 return TaskOutput(
                     content=assistant_res,
@@ -170,25 +174,28 @@ class OpenAIFunctionAgent(Task[str, str]):
 
             # requires function calls. Call the functions and send their outputs to the LLM.
             if run.status == "requires_action":
-                func_tool_outputs = []
-
-                log.debug(
-                    f"OpenAIFunctionAgent turn-{turn+1} | Function call required: {run.required_action.submit_tool_outputs.tool_calls}"
-                )
+                tool_calls = run.required_action.submit_tool_outputs.tool_calls
 
-                for tool in run.required_action.submit_tool_outputs.tool_calls:
-                    args = (
-                        json.loads(tool.function.arguments)
-                        if tool.function.arguments
-                        else {}
+                if debug_enabled:
+                    log.debug(
+                        f"OpenAIFunctionAgent turn-{turn+1} | Function call required: {tool_calls}"
                     )
-                    func_output = self._tool_callables[tool.function.name](**args)
 
-                    func_tool_outputs.append(
-                        {"tool_call_id": tool.id, "output": str(func_output)}
+                # Execute functions (tools) concurrently
+                func_outputs = await _invoke_tools(
+                    (
+                        tool_callables[func.name],
+                        json_loads(func.arguments) if func.arguments else {},
                     )
+                    for func in (tool.function for tool in tool_calls)
+                )
+
+                func_tool_outputs = [
+                    {"tool_call_id": tool.id, "output": str(func_output)}
+                    for tool, func_output in zip(tool_calls, func_outputs)
+                ]
 
-                run = await self.llm.beta.threads.runs.submit_tool_outputs_and_poll(
+                run_stream = self.llm.beta.threads.runs.submit_tool_outputs_stream(
                     thread_id=thread.id, run_id=run.id, tool_outputs=func_tool_outputs
                 )
 
@@ -196,9 +203,10 @@ class OpenAIFunctionAgent(Task[str, str]):
 
             # Handle errors
             else:
-                log.debug(
-                    f"OpenAIFunctionAgent turn-{turn+1} | Exiting agent loop due to error | run status: f{run.status}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        f"OpenAIFunctionAgent turn-{turn+1} | Exiting agent loop due to error | run status: f{run.status}"
+                    )
 
                 if run.status == "failed":
                     log.error(
@@ -212,6 +220,30 @@ class OpenAIFunctionAgent(Task[str, str]):
 
         raise MaxTurnsReachedException()
 
+    async def __consume_run_stream(
+        self, run_stream: AsyncAssistantStreamManager
+    ) -> Tuple[Run, Union[Message, None]]:
+        """
+        Consumes the events of a run stream until the run is completed or paused (for tool calls).
+        Returns the latest state of the run along with the last message completed in the run, if any.
+        """
+        run: Union[Run, None] = None
+        message: Union[Message, None] = None
+
+        async with run_stream as stream:
+            async for event in stream:
+                if event.event == "thread.message.completed":
+                    message = event.data
+                elif isinstance(event.data, Run):
+                    run = event.data
+
+        if not run:
+            raise TextGenFailedException(
+                "Failed to generate text", failure_reason="OPENAI__UNKNOWN_ERR"
+            )
+
+        return run, message
+
     def __failure_reason(self, run: Run) -> str:
         if run.status == "cancelled":
             return "OPENAI__RUN_CANCELLED"
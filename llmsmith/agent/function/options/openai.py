@@ -39,18 +39,21 @@ class OpenAIAssistantOptions(TypedDict):
     timeout: Union[float, None]
 
 
+# Option keys which are passed as-is to the OpenAI client.
+_ASSISTANT_OPT_KEYS = tuple(
+    attr for attr in OpenAIAssistantOptions.__annotations__ if attr != "system_prompt"
+)
+
+
 def _create_assistant_options_dict(options: OpenAIAssistantOptions = {}) -> dict:
     if not options:
         options = {}
 
-    opt = {
-        attr: options.get(attr)
-        for attr in OpenAIAssistantOptions.__annotations__
-        if attr not in ["system_prompt"]
-    }
+    opt = {attr: options.get(attr) for attr in _ASSISTANT_OPT_KEYS}
 
-    if options.get("system_prompt"):
-        opt["instructions"] = options.get("system_prompt")
+    system_prompt = options.get("system_prompt")
+    if system_prompt:
+        opt["instructions"] = system_prompt
 
     if not opt.get("model"):
         opt["model"] = "gpt-4-turbo"
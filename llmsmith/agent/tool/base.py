@@ -0,0 +1,35 @@
+from typing import Callable, Generic, TypeVar, Union
+
+
+T = TypeVar("T")
+
+
+class BaseTool(Generic[T]):
+    """
+    Base class for the tool wrappers, which hold both the tool (function) declaration and the actual callable.
+    Provider specific wrappers subclass `BaseTool` with their own declaration type.
+
+    :param declaration: Tool declaration to be passed into the LLM client.
+    :type declaration: T
+    :param callable: Actual function (callable). Can be a coroutine function too.
+    :type callable: :class:`typing.Callable`
+    :raises ValueError: If the declaration or the callable is missing.
+    """
+
+    __slots__ = ("declaration", "callable")
+
+    def __init__(self, declaration: T, callable: Union[Callable, None]) -> None:
+        self._validate(declaration, callable)
+
+        self.declaration: T = declaration
+        self.callable: Union[Callable, None] = callable
+
+    @classmethod
+    def _validate(cls, declaration: T, callable: Union[Callable, None]):
+        """
+        Validates the tool declaration and callable.
+
+        :raises ValueError: If the declaration or the callable is missing.
+        """
+        if not declaration or not callable:
+            raise ValueError("Both 'declaration' and 'callable' params are mandatory")
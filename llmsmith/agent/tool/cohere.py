@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Union
 
 
 try:
@@ -8,20 +8,30 @@ except ImportError:
         "The 'cohere' library is required to use Cohere LLMs. You can install it with `pip install \"llmsmith[cohere]\"`"
     )
 
+from llmsmith.agent.tool.base import BaseTool
 
-class CohereTool:
+
+class CohereTool(BaseTool[Tool]):
     """
     Wrapper for both function declaration and the actual callable to be used in Cohere chat APIs.
 
-    :param declaration: Function declaration to be passed into Cohere client.
-    :type declaration: :class:`cohere.types.tool.Tool`
-    :param callable: Actual function (callable)
+    :param declaration: Function declaration to be passed into Cohere client. Declarations of dict type are converted to :class:`cohere.types.tool.Tool`.
+    :type declaration: :class:`cohere.types.tool.Tool` or dict
+    :param callable: Actual function (callable). Can be a coroutine function too.
     :type callable: :class:`typing.Callable`
     """
 
-    def __init__(self, declaration: Tool, callable: Callable) -> None:
-        if not declaration or not callable:
-            raise ValueError("Both 'declaration' and 'callable' params are mandatory")
+    __slots__ = ()
+
+    def __init__(self, declaration: Union[Tool, dict], callable: Callable) -> None:
+        self._validate(declaration, callable)
+
+        # Convert to Tool class if declaration is of dict type
+        if isinstance(declaration, dict):
+            declaration = Tool(
+                name=declaration.get("name"),
+                description=declaration.get("description"),
+                parameter_definitions=declaration.get("parameter_definitions"),
+            )
 
-        self.declaration: Tool = declaration
-        self.callable: Callable = callable
+        super().__init__(declaration, callable)
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, Union
 
 
 try:
@@ -8,20 +8,28 @@ except ImportError:
         "The 'google.generativeai' library is required to use Gemini LLMs. You can install it with `pip install \"llmsmith[gemini]\"`"
     )
 
+from llmsmith.agent.tool.base import BaseTool
 
-class GeminiTool:
+
+class GeminiTool(BaseTool[FunctionDeclaration]):
     """
     Wrapper for both function declaration and the actual callable to be used in Gemini LLMs.
 
-    :param declaration: Function declaration to be passed into Gemini client.
-    :type declaration: :class:`google.ai.generativelanguage_v1beta.types.FunctionDeclaration`
-    :param callable: Actual function (callable)
+    :param declaration: Function declaration to be passed into Gemini client. Declarations of dict type are converted to :class:`google.ai.generativelanguage_v1beta.types.FunctionDeclaration`.
+    :type declaration: :class:`google.ai.generativelanguage_v1beta.types.FunctionDeclaration` or dict
+    :param callable: Actual function (callable). Can be a coroutine function too.
     :type callable: :class:`typing.Callable`
     """
 
-    def __init__(self, declaration: FunctionDeclaration, callable: Callable) -> None:
-        if not declaration or not callable:
-            raise ValueError("Both 'declaration' and 'callable' params are mandatory")
+    __slots__ = ()
+
+    def __init__(
+        self, declaration: Union[FunctionDeclaration, dict], callable: Callable
+    ) -> None:
+        self._validate(declaration, callable)
+
+        # Convert to FunctionDeclaration if declaration is of dict type
+        if isinstance(declaration, dict):
+            declaration = FunctionDeclaration(declaration)
 
-        self.declaration: FunctionDeclaration = declaration
-        self.callable: Callable = callable
+        super().__init__(declaration, callable)
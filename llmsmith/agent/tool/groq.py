@@ -1,6 +1,3 @@
-from typing import Callable
-
-
 try:
     from groq.types.chat.completion_create_params import Tool
 except ImportError:
@@ -8,20 +5,17 @@ except ImportError:
         "The 'groq' library is required to use LLMs in Groq. You can install it with `pip install \"llmsmith[groq]\"`"
     )
 
+from llmsmith.agent.tool.base import BaseTool
 
-class GroqTool:
+
+class GroqTool(BaseTool[Tool]):
     """
     Wrapper for both function declaration and the actual callable to be used in chat completion APIs.
 
     :param declaration: Function declaration to be passed into Groq client.
     :type declaration: :class:`groq.types.chat.completion_create_params.Tool`
-    :param callable: Actual function (callable)
+    :param callable: Actual function (callable). Can be a coroutine function too.
     :type callable: :class:`typing.Callable`
     """
 
-    def __init__(self, declaration: Tool, callable: Callable) -> None:
-        if not declaration or not callable:
-            raise ValueError("Both 'declaration' and 'callable' params are mandatory")
-
-        self.declaration: Tool = declaration
-        self.callable: Callable = callable
+    __slots__ = ()
@@ -9,8 +9,10 @@ except ImportError:
         "The 'openai' library is required to use OpenAI LLMs. You can install it with `pip install \"llmsmith[openai]\"`"
     )
 
+from llmsmith.agent.tool.base import BaseTool
 
-class OpenAIChatTool:
+
+class OpenAIChatTool(BaseTool[FunctionDefinition]):
     """
     Wrapper for both function declaration and the actual callable to be used in chat completion APIs.
 
@@ -20,25 +22,25 @@ class OpenAIChatTool:
     :type callable: :class:`typing.Callable`
     """
 
-    def __init__(self, declaration: FunctionDefinition, callable: Callable) -> None:
-        if not declaration or not callable:
-            raise ValueError("Both 'declaration' and 'callable' params are mandatory")
-
-        self.declaration: FunctionDefinition = declaration
-        self.callable: Callable = callable
+    __slots__ = ()
 
 
-class OpenAIAssistantTool:
+class OpenAIAssistantTool(BaseTool[AssistantToolParam]):
     """
     Wrapper for both tool declaration and the actual callable (required for function tools) to be used in assistant APIs.
 
     :param declaration: Function declaration to be passed into OpenAI client.
     :type declaration: :class:`openai.types.shared_params.FunctionDefinition`
-    :param callable: Actual function (callable) if tool is of `function` type
+    :param callable: Actual function (callable) if tool is of `function` type. Can be a coroutine function too.
     :type callable: :class:`typing.Callable`, optional
     """
 
-    def __init__(self, declaration: AssistantToolParam, callable: Callable) -> None:
+    __slots__ = ()
+
+    @classmethod
+    def _validate(
+        cls, declaration: AssistantToolParam, callable: Union[Callable, None]
+    ):
         if not declaration:
             raise ValueError("'declaration' param is mandatory")
 
@@ -46,6 +48,3 @@ class OpenAIAssistantTool:
             raise ValueError(
                 "'callable' param is mandatory for tools of `function` type"
             )
-
-        self.declaration: AssistantToolParam = declaration
-        self.callable: Union[Callable, None] = callable
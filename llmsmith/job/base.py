@@ -1,17 +1,23 @@
+import re
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Generic, List, TypeVar, Union
+from typing import Any, Generic, List, Set, Tuple, TypeVar, Union
 
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
 
 
-@dataclass
+# Matches the placeholders (like {{root}} or {{task-name.output}}) in the input template
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{([^}]+)\}\}")
+
+
 class JobMemory:
     """
     JobMemory is a key-value store which stores the input and output values for the tasks (:class:`llmsmith.task.base.Task`) present in the job.
     """
 
+    __slots__ = ("inputs", "outputs")
+
     def __init__(self) -> None:
         self.inputs: dict[str, TaskInput] = {}
         self.outputs: dict[str, TaskOutput] = {}
@@ -48,9 +54,7 @@ class JobMemory:
         :return: input value passed to the task. Returns `None` if the key is not available in the memory
         :rtype: :class:`llmsmith.task.models.TaskInput`
         """
-        if key not in self.inputs:
-            return None
-        return self.inputs[key]
+        return self.inputs.get(key)
 
     def get_task_output(self, key: str) -> Union[TaskOutput, None]:
         """
@@ -61,9 +65,7 @@ class JobMemory:
         :return: output value returned by the task. Returns `None` if the key is not available in the memory
         :rtype: :class:`llmsmith.task.models.TaskOutput`
         """
-        if key not in self.outputs:
-            return None
-        return self.outputs[key]
+        return self.outputs.get(key)
 
 
 class _JobTask:
@@ -78,9 +80,29 @@ class _JobTask:
     """
 
     def __init__(self, task: Task, input_template: str) -> None:
+        if input_template is None:
+            input_template = "{{root}}"
+
         self.task = task
         self.input_template = input_template
 
+        # Task names are interned, since they are used as keys in the job memory
+        self._task_name: str = sys.intern(task.name())
+
+        # The template is parsed only once, into literal text and placeholder segments.
+        self._template_segments: List[
+            Tuple[str, Union[str, None], Union[str, None]]
+        ] = [
+            (segment, None, None) if idx % 2 == 0 else self._parse_placeholder(segment)
+            for idx, segment in enumerate(_PLACEHOLDER_PATTERN.split(input_template))
+            if segment
+        ]
+
+        # Templates with only the root placeholder are resolved without looking up the job memory
+        self._is_root_only_template = self._template_segments == [
+            ("{{root}}", "root", None)
+        ]
+
     async def execute(self, user_input: str, memory: JobMemory):
         """
         Executes the task and stores the input and output values in the job memory.
@@ -92,15 +114,18 @@ class _JobTask:
         :param memory: The job memory to store task input and output.
         :type memory: :class:`llmsmith.task.base.JobMemory`
         """
-        input_updated_with_placeholders = self._replace_input_template_placeholders(
-            user_input, memory
-        )
+        if self._is_root_only_template:
+            input_updated_with_placeholders = user_input
+        else:
+            input_updated_with_placeholders = self._replace_input_template_placeholders(
+                user_input, memory
+            )
 
         task_input = TaskInput(content=input_updated_with_placeholders)
 
-        memory.add_task_input(key=self.task.name(), task_input=task_input)
+        memory.add_task_input(key=self._task_name, task_input=task_input)
         task_output = await self.task.execute(task_input)
-        memory.add_task_output(key=self.task.name(), task_output=task_output)
+        memory.add_task_output(key=self._task_name, task_output=task_output)
 
     def task_name(self) -> str:
         """
@@ -109,7 +134,28 @@ class _JobTask:
         :return: The name of the task.
         :rtype: str
         """
-        return self.task.name()
+        return self._task_name
+
+    @classmethod
+    def _parse_placeholder(
+        cls, placeholder: str
+    ) -> Tuple[str, Union[str, None], Union[str, None]]:
+        """
+        Parses a placeholder (without the enclosing braces) into a template segment.
+        Each segment is a tuple of (text, source, task name), where source is one of
+        `root`, `inputs` or `outputs` and is `None` for literal text.
+        """
+        text = f"{{{{{placeholder}}}}}"
+
+        if placeholder == "root":
+            return (text, "root", None)
+
+        task_name, _, field = placeholder.rpartition(".")
+        if not task_name or field not in ("input", "output"):
+            # Unknown placeholders are left as is
+            return (text, None, None)
+
+        return (text, f"{field}s", sys.intern(task_name))
 
     def _replace_input_template_placeholders(
         self, user_input: str, memory: JobMemory
@@ -118,15 +164,18 @@ class _JobTask:
         Utility method for replacing the placeholders in the input template with the
         corresponding values picked from the job memory.
         """
-        updated_input = self.input_template.replace("{{root}}", user_input)
-
-        for key, inp in memory.inputs.items():
-            updated_input = updated_input.replace(f"{{{{{key}.input}}}}", inp.content)
-
-        for key, out in memory.outputs.items():
-            updated_input = updated_input.replace(f"{{{{{key}.output}}}}", out.content)
+        values = []
+        for text, source, task_name in self._template_segments:
+            if source is None:
+                values.append(text)
+            elif source == "root":
+                values.append(user_input)
+            else:
+                # Placeholders without any matching value in the memory are left as is
+                value = getattr(memory, source).get(task_name)
+                values.append(text if value is None else value.content)
 
-        return updated_input
+        return "".join(values)
 
 
 T = TypeVar("T")
@@ -141,6 +190,7 @@ class Job(Generic[T, U], ABC):
 
     def __init__(self) -> None:
         self._tasks: List[_JobTask] = []
+        self._task_names: Set[str] = set()
         self._memory: JobMemory = JobMemory()
 
     @abstractmethod
@@ -175,25 +225,20 @@ class Job(Generic[T, U], ABC):
         """
         return self._memory.get_task_output(key)
 
-    @classmethod
-    def _validate_task_names(cls, tasks: List[_JobTask]):
+    def _add_job_task(self, job_task: _JobTask):
         """
-        Checks for tasks with duplicate names in the job.
+        Adds a task to the job after checking for duplicate task names.
 
-        :param tasks: The list of tasks.
-        :type tasks: List[_JobTask]
-        :raises ValueError: If a duplicate task name is found.
+        :param job_task: The task to be added.
+        :type job_task: _JobTask
+        :raises ValueError: If a task with the same name is already present in the job.
         """
-        task_name_counts = {}
-        for task in tasks:
-            task_name_counts[task.task_name()] = (
-                task_name_counts.get(task.task_name(), 0) + 1
-            )
+        task_name = job_task.task_name()
+        if task_name in self._task_names:
+            raise ValueError(f"Duplicate task name '{task_name}' present in the job")
 
-            if task_name_counts[task.task_name()] > 1:
-                raise ValueError(
-                    f"Duplicate task name '{task.task_name()}' present in the job"
-                )
+        self._task_names.add(task_name)
+        self._tasks.append(job_task)
 
     @classmethod
     def _validate_task_types(cls, tasks: List[Any]):
@@ -116,10 +116,8 @@ class SequentialJob(Job):
         :returns: Self
         :rtype: :class:`llmsmith.job.job.SequentialJob`
         """
-        chain_task = _JobTask(task=task, input_template=input_template)
-        self._tasks.append(chain_task)
         self._validate_task_types([task])
-        self._validate_task_names(self._tasks)
+        self._add_job_task(_JobTask(task=task, input_template=input_template))
 
         return self
 
@@ -208,20 +206,31 @@ class ConcurrentJob(Job):
         :returns: Self
         :rtype: :class:`llmsmith.job.job.ConcurrentJob`
         """
-        chain_task = _JobTask(task=task, input_template="{{root}}")
-        self._tasks.append(chain_task)
         self._validate_task_types([task])
-        self._validate_task_names(self._tasks)
+        self._add_job_task(_JobTask(task=task, input_template="{{root}}"))
 
         return self
 
     async def run(self, user_input: T):
         """
-        Run the tasks concurrently.
+        Run the tasks concurrently. If any of the tasks fails, the remaining tasks are cancelled (and waited for)
+        and the exception raised by the failed task is propagated.
 
         :param user_input: The initial input for the job
         :type user_input: T
         """
-        await asyncio.gather(
-            *[task.execute(user_input, self._memory) for task in self._tasks]
-        )
+        running_tasks = [
+            asyncio.ensure_future(task.execute(user_input, self._memory))
+            for task in self._tasks
+        ]
+
+        try:
+            await asyncio.gather(*running_tasks)
+        except BaseException:
+            # Same cancellation behaviour as `asyncio.TaskGroup` (Python 3.11+),
+            # but without wrapping the original exception in an `ExceptionGroup`.
+            # Cancelled tasks are awaited, so that none of them are running (or writing to the job memory) once this returns.
+            for running_task in running_tasks:
+                running_task.cancel()
+            await asyncio.gather(*running_tasks, return_exceptions=True)
+            raise
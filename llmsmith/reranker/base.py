@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -20,3 +21,30 @@ class Reranker(ABC):
         :rtype: List[str]
         """
         pass
+
+    async def rerank_many(
+        self, queries: List[str], docs_list: List[List[str]]
+    ) -> List[List[str]]:
+        """
+        Rerank multiple sets of documents concurrently, each against its own query
+        (like the documents retrieved for each of the reformulated queries).
+
+        :param queries: queries used to retrieve documents from vector DB.
+        :type queries: List[str]
+        :param docs_list: list of documents retrieved from vector DB for each query.
+        :type docs_list: List[List[str]]
+        :raises ValueError: If the number of queries and document lists don't match.
+        :return: reranked documents for each query, in the same order as the queries.
+        :rtype: List[List[str]]
+        """
+        if len(queries) != len(docs_list):
+            raise ValueError("Number of queries and document lists should be same")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.rerank(query=query, docs=docs)
+                    for query, docs in zip(queries, docs_list)
+                )
+            )
+        )
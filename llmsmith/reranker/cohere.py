@@ -1,5 +1,7 @@
+import asyncio
+import functools
 import logging
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 from llmsmith.reranker.base import Reranker
 from llmsmith.reranker.options.cohere import CohereRerankerOptions, _rerank_options_dict
@@ -27,15 +29,30 @@ class CohereReranker(Reranker):
     :type client: :class:`cohere.AsyncClient`
     :param options: A dictionary of options to pass to the rerank method of Cohere client.
     :type options: :class:`llmsmith.reranker.options.cohere.CohereRerankerOptions`, optional
+    :param max_concurrency: Maximum number of concurrent rerank requests to Cohere (including the ones made by
+        :meth:`rerank_many`). No limit is applied if set to `None`.
+    :type max_concurrency: int, optional
+    :raises ValueError: If `max_concurrency` is less than 1.
     """
 
     def __init__(
         self,
         client: cohere.AsyncClient,
         options: Union[CohereRerankerOptions, None] = None,
+        max_concurrency: Union[int, None] = None,
     ) -> None:
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency should be 1 or above")
+
         self.client = client
         self._options = options or {}
+        # Options are same for every request, hence computed only once
+        self._rerank_options: dict = _rerank_options_dict(self._options)
+        self._max_concurrency = max_concurrency
+        # Semaphore is created lazily, so that it is bound to the running event loop
+        self._semaphore: Union[asyncio.Semaphore, None] = None
+        # Rerank requests which are in progress, keyed by (query, docs)
+        self._in_flight: Dict[Tuple[str, Tuple[str, ...]], asyncio.Future] = {}
 
     async def rerank(self, query: str, docs: List[str]) -> List[str]:
         """
@@ -48,7 +65,37 @@ class CohereReranker(Reranker):
         :returns: Reranked documents returned by Cohere.
         :rtype: List[str]
         """
-        return await self.__rerank_docs(query, docs)
+        if not all(isinstance(doc, str) for doc in docs):
+            return await self.__rerank_docs(query, docs)
+
+        # Concurrent requests with the same query and documents share a single Cohere API call
+        key = (query, tuple(docs))
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self.__rerank_docs(query, docs))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(functools.partial(self._on_rerank_done, key))
+
+        # Shielded, so that cancelling one of the callers doesn't cancel the shared request
+        return list(await asyncio.shield(in_flight))
+
+    async def warmup(self):
+        """
+        Opens a connection to Cohere API ahead of the first rerank request (like during the app startup),
+        so that the first rerank request doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        A cheap API key check is used for this.
+        """
+        await self.client.check_api_key()
+
+    def _on_rerank_done(
+        self, key: Tuple[str, Tuple[str, ...]], in_flight: asyncio.Future
+    ):
+        self._in_flight.pop(key, None)
+
+        # All the callers may have been cancelled (the request is shielded), hence the exception is retrieved here.
+        # Otherwise, asyncio logs it as never retrieved.
+        if not in_flight.cancelled():
+            in_flight.exception()
 
     async def __rerank_docs(
         self, query: str, docs: List[Union[str, RerankRequestDocumentsItemText]]
@@ -64,19 +111,31 @@ class CohereReranker(Reranker):
         :rtype: List[Union[str, :class:`cohere.types.rerank_request_documents_item.RerankRequestDocumentsItemText`]]
         """
 
-        rerank_options: dict = _rerank_options_dict(self._options)
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        rerank_options: dict = self._rerank_options
 
-        log.debug(f"CohereReranker input docs: {docs}")
+        if debug_enabled:
+            log.debug(f"CohereReranker input docs: {docs}")
 
-        rerank_res: RerankResponse = await self.client.rerank(
-            query=query, documents=docs, **rerank_options
-        )
+        if self._max_concurrency is None:
+            rerank_res: RerankResponse = await self.client.rerank(
+                query=query, documents=docs, **rerank_options
+            )
+        else:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        reranked_docs: List[Union[str, RerankRequestDocumentsItemText]] = []
+            async with self._semaphore:
+                rerank_res: RerankResponse = await self.client.rerank(
+                    query=query, documents=docs, **rerank_options
+                )
 
-        for each in rerank_res.results:
-            reranked_docs.append(docs[each.index])
+        reranked_docs: List[Union[str, RerankRequestDocumentsItemText]] = [
+            docs[each.index] for each in rerank_res.results
+        ]
 
-        log.debug(f"CohereReranker reranked docs: {reranked_docs}")
+        if debug_enabled:
+            log.debug(f"CohereReranker reranked docs: {reranked_docs}")
 
         return reranked_docs
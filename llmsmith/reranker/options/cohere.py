@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import List, TypedDict, Union
 
 try:
@@ -25,13 +26,26 @@ class CohereRerankerOptions(TypedDict):
     request_options: Union[RequestOptions, None]
 
 
+# Default value (`None`) for every rerank option, except the model.
+_DEFAULT_RERANK_OPTIONS = MappingProxyType(
+    {
+        **dict.fromkeys(CohereRerankerOptions.__annotations__),
+        "model": "rerank-english-v2.0",
+    }
+)
+
+
 def _rerank_options_dict(options: CohereRerankerOptions = {}) -> dict:
-    if not options:
-        options = {}
+    opt = dict(_DEFAULT_RERANK_OPTIONS)
 
-    opt = {attr: options.get(attr) for attr in CohereRerankerOptions.__annotations__}
+    if options:
+        opt.update(
+            (attr, value)
+            for attr, value in options.items()
+            if attr in _DEFAULT_RERANK_OPTIONS
+        )
 
-    if not opt.get("model"):
-        opt["model"] = "rerank-english-v2.0"
+    if not opt["model"]:
+        opt["model"] = _DEFAULT_RERANK_OPTIONS["model"]
 
     return opt
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+import asyncio
+from typing import Generic, List, TypeVar
 
 from llmsmith.task.models import TaskInput, TaskOutput
 
@@ -45,3 +46,22 @@ class Task(Generic[T, U], ABC):
         :rtype: str
         """
         return self._name
+
+
+async def _execute_concurrently(
+    task: Task[T, U], task_inputs: List[TaskInput[T]], max_concurrency: int
+) -> List[TaskOutput[U]]:
+    """
+    Executes the task for all the inputs concurrently, with at most `max_concurrency` executions in progress at a time.
+    The outputs are returned in the same order as the inputs.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency should be 1 or above")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _execute(task_input: TaskInput[T]) -> TaskOutput[U]:
+        async with semaphore:
+            return await task.execute(task_input)
+
+    return await asyncio.gather(*[_execute(task_input) for task_input in task_inputs])
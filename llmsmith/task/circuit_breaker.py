@@ -0,0 +1,127 @@
+import logging
+import time
+from typing import Tuple, Type, TypeVar
+
+from llmsmith.task.base import Task
+from llmsmith.task.errors import CircuitBreakerOpenException
+from llmsmith.task.models import TaskInput, TaskOutput
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+class CircuitBreakerTask(Task[T, U]):
+    """
+    Wrapper on top of a task, which stops calling the task (fails fast) after repeated failures.
+
+    * The circuit is closed initially, and the task is executed as usual.
+    * After `failure_threshold` consecutive failures, the circuit is opened. While it is open, executing the task
+      raises :class:`llmsmith.task.errors.CircuitBreakerOpenException` without calling the LLM (or DB).
+    * Once `reset_timeout` seconds have passed, a single trial execution is allowed. The circuit is closed again
+      if the trial succeeds, otherwise it stays open for another `reset_timeout` seconds.
+
+    Retries with exponential backoff are not done here, since the LLM clients (like OpenAI, Anthropic and Groq)
+    already retry the transient failures (like rate limits and server errors) before raising an error.
+
+    .. code-block:: python
+
+        text_gen_task = CircuitBreakerTask(
+            name="openai-answer-generator",
+            task=OpenAITextGenTask(name="openai", llm=llm),
+            failure_exceptions=(openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError),
+        )
+
+    :param name: The name of the task.
+    :type name: str
+    :param task: The task to be executed.
+    :type task: :class:`llmsmith.task.base.Task`
+    :param failure_threshold: Number of consecutive failures after which the circuit is opened. Defaults to 5.
+    :type failure_threshold: int, optional
+    :param reset_timeout: Time (in seconds) for which the circuit stays open. Defaults to 30.
+    :type reset_timeout: float, optional
+    :param failure_exceptions: Exceptions which are counted as failures. Defaults to all exceptions.
+    :type failure_exceptions: Tuple[Type[Exception], ...], optional
+    :raises ValueError: If the name is empty, or if any of the other params fails validation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        task: Task[T, U],
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        failure_exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    ) -> None:
+        super().__init__(name)
+
+        if not task:
+            raise ValueError("Task ('task') is required")
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold should be 1 or above")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout should be above 0")
+
+        self._task = task
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_exceptions = failure_exceptions
+
+        self._failure_count = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Returns `True` if the circuit is open.
+        """
+        return self._opened_at is not None
+
+    async def execute(self, task_input: TaskInput[T]) -> TaskOutput[U]:
+        """
+        Executes the wrapped task if the circuit is closed (or if a trial execution is due).
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput`
+        :raises CircuitBreakerOpenException: If the circuit is open.
+        :returns: The output of the task.
+        :rtype: :class:`llmsmith.task.models.TaskOutput`
+        """
+        is_trial = False
+
+        if self._opened_at is not None:
+            retry_after = self._opened_at + self.reset_timeout - time.monotonic()
+            if retry_after > 0 or self._trial_in_progress:
+                raise CircuitBreakerOpenException(
+                    f"Circuit breaker is open for task '{self.name()}'",
+                    retry_after=max(retry_after, 0),
+                )
+
+            is_trial = True
+            self._trial_in_progress = True
+
+        try:
+            task_output = await self._task.execute(task_input)
+        except self.failure_exceptions:
+            self._record_failure()
+            raise
+        finally:
+            if is_trial:
+                self._trial_in_progress = False
+
+        self._failure_count = 0
+        self._opened_at = None
+
+        return task_output
+
+    def _record_failure(self):
+        self._failure_count += 1
+
+        if self._opened_at is not None or self._failure_count >= self.failure_threshold:
+            log.warning(
+                f"Opening circuit breaker for task '{self.name()}' after {self._failure_count} consecutive failures"
+            )
+            self._opened_at = time.monotonic()
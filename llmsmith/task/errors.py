@@ -0,0 +1,6 @@
+class CircuitBreakerOpenException(Exception):
+    """Raised when a task is not executed since its circuit breaker is open, due to repeated failures."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args)
+        self.retry_after = kwargs.get("retry_after")
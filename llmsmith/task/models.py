@@ -7,17 +7,23 @@ T = TypeVar("T")
 
 @dataclass
 class TaskInput(Generic[T]):
+    __slots__ = ("content",)
+
     content: T
 
 
 @dataclass
 class TaskOutput(Generic[T]):
+    __slots__ = ("content", "raw_output")
+
     content: T
     raw_output: Any
 
 
 @dataclass
 class FunctionCall:
+    __slots__ = ("id", "name", "args")
+
     id: str
     name: str
     args: dict[str, Any]
@@ -1,7 +1,90 @@
-from typing import Callable, List, Union
+import asyncio
+from dataclasses import dataclass
+import inspect
+from typing import Awaitable, Callable, List, Union
 
-# Type alias for embedding function
-EmbeddingFunc = Callable[[List[str]], List[List[Union[float, int]]]]
+from llmsmith.task.models import TaskInput
+
+# Type alias for embedding (vector)
+Embedding = List[Union[float, int]]
+
+# Type alias for embedding function. Can be a coroutine function too.
+# The embeddings can also be returned as numpy arrays (which are converted to lists only where the vector database client needs it).
+EmbeddingFunc = Callable[
+    [List[str]], Union[List[Embedding], Awaitable[List[Embedding]]]
+]
+
+
+@dataclass
+class TaskInputWithEmbedding(TaskInput[str]):
+    """
+    Input for the retrievers along with the precomputed embedding of its content.
+    The retrievers use the given embedding instead of calling the embedding function, hence the query
+    can be embedded once and used for retrieving from multiple vector databases.
+
+    .. code-block:: python
+
+        embedding = embedding_func([query])[0]
+        task_input = TaskInputWithEmbedding(content=query, embedding=embedding)
+
+        qdrant_output, pgvector_output = await asyncio.gather(
+            qdrant_retriever.execute(task_input), pgvector_retriever.execute(task_input)
+        )
+
+    :param content: The query.
+    :type content: str
+    :param embedding: Embedding of the query.
+    :type embedding: :class:`llmsmith.task.retrieval.vector.base.Embedding`
+    """
+
+    __slots__ = ("embedding",)
+
+    embedding: Embedding
+
+
+async def _run_embedding_func(
+    embedding_func: EmbeddingFunc, texts: List[str]
+) -> List[Embedding]:
+    """
+    Runs the embedding function without blocking the event loop. Coroutine functions are awaited,
+    whereas the other (blocking) functions are run in a separate thread.
+    """
+    if inspect.iscoroutinefunction(embedding_func):
+        return await embedding_func(texts)
+
+    return await asyncio.to_thread(embedding_func, texts)
+
+
+async def _embed_task_inputs(
+    embedding_func: EmbeddingFunc, task_inputs: List[TaskInput[str]]
+) -> List[Embedding]:
+    """
+    Returns the embeddings of the task inputs, calling the embedding function (once) only for the inputs
+    without a precomputed embedding.
+    """
+    missing: List[str] = [
+        task_input.content
+        for task_input in task_inputs
+        if getattr(task_input, "embedding", None) is None
+    ]
+    computed = iter(
+        await _run_embedding_func(embedding_func, missing) if missing else ()
+    )
+
+    return [
+        task_input.embedding
+        if getattr(task_input, "embedding", None) is not None
+        else next(computed)
+        for task_input in task_inputs
+    ]
+
+
+def _as_list(embedding: Embedding) -> Embedding:
+    """
+    Converts the embedding (like a numpy array) to a list in a single call, so that the vector database clients
+    do not convert (or validate) it element by element. Lists are returned as is.
+    """
+    return embedding.tolist() if hasattr(embedding, "tolist") else embedding
 
 
 def default_doc_processor(docs: List[str]) -> str:
@@ -19,4 +102,4 @@ def default_doc_processor(docs: List[str]) -> str:
     ``
     """
 
-    return "\n---\n".join([doc for doc in docs])
+    return "\n---\n".join(docs)
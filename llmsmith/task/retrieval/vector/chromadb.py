@@ -1,10 +1,17 @@
+import asyncio
+import inspect
 import logging
 from typing import Callable, List
 
 from llmsmith.reranker.base import Reranker
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
-from llmsmith.task.retrieval.vector.base import EmbeddingFunc, default_doc_processor
+from llmsmith.task.retrieval.vector.base import (
+    Embedding,
+    EmbeddingFunc,
+    default_doc_processor,
+)
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 from llmsmith.task.retrieval.vector.options.chromadb import (
     ChromaDBQueryOptions,
     _query_options_dict,
@@ -33,12 +40,17 @@ class BaseChromaDBTask(Task[str, List[str]]):
     :type name: str
     :param collection: The collection to retrieve documents from.
     :type collection: :class:`chromadb.Collection`
-    :param embedding_func: Embedding function
+    :param embedding_func: Embedding function. Wrap it with :class:`llmsmith.task.retrieval.vector.embedding.CachingEmbeddingFunc`
+        to avoid embedding the repeated (and concurrent identical) queries again.
     :type embedding_func: :class:`llmsmith.task.retrieval.vector.base.EmbeddingFunc`
     :param query_options: A dictionary of options to pass to the ChromaDB collection client for querying.
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.chromadb.ChromaDBQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
+    :raises ValueError: If embedding function is missing.
     """
 
     def __init__(
@@ -48,6 +60,7 @@ class BaseChromaDBTask(Task[str, List[str]]):
         embedding_func: EmbeddingFunc,
         query_options: ChromaDBQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -57,37 +70,71 @@ class BaseChromaDBTask(Task[str, List[str]]):
         self.collection = collection
         self.embedding_func = embedding_func
         self.query_options = query_options
+        # Options are same for every request, hence computed only once
+        self._query_options: dict = _query_options_dict(query_options)
         self._reranker = reranker
+        self._embedding_batcher = embedding_batcher
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[List[str]]:
         """
         Executes the task of retrieving documents from the chromadb collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the list of documents from chromadb.
         :rtype: :class:`llmsmith.task.models.TaskOutput[List[str]]`
         """
-        query_options: dict = _query_options_dict(self.query_options)
+        query_options: dict = self._query_options
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"ChromaDB query request: input string: {task_input.content}\n OPTIONS: {query_options}"
+            )
+
+        embedding = getattr(task_input, "embedding", None)
+        if embedding is None and self._embedding_batcher:
+            embedding = await self._embedding_batcher.embed_one(task_input.content)
+
+        if embedding is not None:
+            res: QueryResult = await asyncio.to_thread(
+                self._query_by_embeddings, [embedding], query_options
+            )
+        else:
+            res: QueryResult = await self._run_query(
+                [task_input.content], query_options
+            )
+
+        docs: List[str] = res["documents"][0]
+        if self._reranker:
+            docs = await self._reranker.rerank(query=task_input.content, docs=docs)
+
+        return TaskOutput(content=docs, raw_output=res)
+
+    async def _run_query(self, queries: List[str], query_options: dict) -> QueryResult:
+        if inspect.iscoroutinefunction(self.embedding_func):
+            embeddings = await self.embedding_func(queries)
+        else:
+            # Both the embedding function and the ChromaDB client are blocking,
+            # hence they are run together in a separate thread to avoid blocking the event loop.
+            return await asyncio.to_thread(self._query, queries, query_options)
 
-        log.debug(
-            f"ChromaDB query request: input string: {task_input.content}\n OPTIONS: {query_options}"
+        return await asyncio.to_thread(
+            self._query_by_embeddings, embeddings, query_options
         )
 
-        embeddings = self.embedding_func([task_input.content])
+    def _query(self, queries: List[str], query_options: dict) -> QueryResult:
+        return self._query_by_embeddings(self.embedding_func(queries), query_options)
 
-        res: QueryResult = self.collection.query(
+    def _query_by_embeddings(
+        self, embeddings: List[Embedding], query_options: dict
+    ) -> QueryResult:
+        return self.collection.query(
             query_embeddings=embeddings,
             include=["metadatas", "documents", "distances"],
             **query_options,
         )
 
-        docs = [doc for doc in res["documents"][0]]
-        if self._reranker:
-            docs = await self._reranker.rerank(query=task_input.content, docs=docs)
-
-        return TaskOutput(content=docs, raw_output=res)
-
 
 class ChromaDBRetriever(Task[str, str]):
     """
@@ -97,7 +144,8 @@ class ChromaDBRetriever(Task[str, str]):
     :type name: str
     :param collection: The collection to retrieve documents from.
     :type collection: :class:`chromadb.Collection`
-    :param embedding_func: Embedding function
+    :param embedding_func: Embedding function. Wrap it with :class:`llmsmith.task.retrieval.vector.embedding.CachingEmbeddingFunc`
+        to avoid embedding the repeated (and concurrent identical) queries again.
     :type embedding_func: :class:`llmsmith.task.retrieval.vector.base.EmbeddingFunc`
     :param doc_processing_func: The function to process the query result, defaults to `llmsmith.task.retrieval.vector.base.default_doc_processor`.
     :type doc_processing_func: Callable[[List[str]], str], optional
@@ -105,6 +153,9 @@ class ChromaDBRetriever(Task[str, str]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.chromadb.ChromaDBQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -115,6 +166,7 @@ class ChromaDBRetriever(Task[str, str]):
         doc_processing_func: Callable[[List[str]], str] = default_doc_processor,
         query_options: ChromaDBQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -124,6 +176,7 @@ class ChromaDBRetriever(Task[str, str]):
             embedding_func=embedding_func,
             query_options=query_options,
             reranker=reranker,
+            embedding_batcher=embedding_batcher,
         )
 
         self.doc_processing_func = doc_processing_func
@@ -132,7 +185,8 @@ class ChromaDBRetriever(Task[str, str]):
         """
         Executes the task of retrieving documents from the chromadb collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from chromadb.
         :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
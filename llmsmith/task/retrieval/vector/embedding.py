@@ -0,0 +1,243 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future
+import hashlib
+import inspect
+import threading
+from typing import Dict, List, Set, Tuple, Union
+
+from llmsmith.task.retrieval.vector.base import (
+    Embedding,
+    EmbeddingFunc,
+    _run_embedding_func,
+)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces the texts which are embedded concurrently (like the queries of concurrent retriever executions)
+    into a single embedding function call, so that one embedding API request is made per batch instead of per text.
+
+    The batch is embedded when it is full, or when `max_wait_time` has elapsed since the first text was added to it.
+    Blocking embedding functions are run in a separate thread to avoid blocking the event loop.
+
+    .. code-block:: python
+
+        embedding_batcher = EmbeddingBatcher(embedding_func=embedding_func, max_batch_size=32)
+
+        retriever = QdrantRetriever(
+            name="qdrant-retriever",
+            client=qdrant_client,
+            collection_name="docs",
+            embedding_func=embedding_func,
+            embedded_field_name="text",
+            embedding_batcher=embedding_batcher,
+        )
+
+    :param embedding_func: Embedding function
+    :type embedding_func: :class:`llmsmith.task.retrieval.vector.base.EmbeddingFunc`
+    :param max_batch_size: Maximum number of texts to be embedded in a single call. Defaults to 32.
+    :type max_batch_size: int, optional
+    :param max_wait_time: Maximum time (in seconds) for which a text waits for other texts to fill the batch. Defaults to 0.01.
+    :type max_wait_time: float, optional
+    :raises ValueError: If embedding function is missing, or if any of the other params fails validation.
+    """
+
+    def __init__(
+        self,
+        embedding_func: EmbeddingFunc,
+        max_batch_size: int = 32,
+        max_wait_time: float = 0.01,
+    ) -> None:
+        if not embedding_func:
+            raise ValueError("Embedding function ('embedding_func') is required")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size should be 1 or above")
+        if max_wait_time < 0:
+            raise ValueError("max_wait_time should not be negative")
+
+        self.embedding_func = embedding_func
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+
+        # Texts waiting to be embedded as a batch
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Union[asyncio.TimerHandle, None] = None
+        # Event loop keeps only weak references to the tasks, hence the running batches are referenced here
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed_one(self, text: str) -> Embedding:
+        """
+        Adds the text to the pending batch, and returns its embedding once the batch is embedded.
+
+        :param text: Text to be embedded.
+        :type text: str
+        :returns: Embedding of the text.
+        :rtype: :class:`llmsmith.task.retrieval.vector.base.Embedding`
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_time, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._embed_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            embeddings = await _run_embedding_func(
+                self.embedding_func, [text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(embeddings) != len(batch):
+            error = ValueError(
+                f"Embedding function returned {len(embeddings)} embeddings for {len(batch)} texts"
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+
+class CachingEmbeddingFunc:
+    """
+    Embedding function wrapper, which caches the embeddings of the texts (LRU), so that repeated texts
+    (like the same query in a chat session or an evaluation loop) are not embedded again.
+    Only the texts which are not cached are passed to the wrapped embedding function, in a single call.
+    Concurrent calls with the same (uncached) text share a single embedding, instead of embedding it again.
+
+    The cache is keyed by a hash (BLAKE2b) of the text, hence long texts are not held in memory.
+    It can be used in place of the embedding function in any of the retrievers.
+    Only blocking (non-coroutine) embedding functions can be wrapped.
+
+    .. code-block:: python
+
+        retriever = PgVectorRetriever(
+            name="pgvector-retriever",
+            db_engine=db_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=CachingEmbeddingFunc(embedding_func, maxsize=1024),
+        )
+
+    :param embedding_func: Embedding function to be cached.
+    :type embedding_func: :class:`llmsmith.task.retrieval.vector.base.EmbeddingFunc`
+    :param maxsize: Maximum number of embeddings to be cached. Defaults to 1024.
+    :type maxsize: int, optional
+    :raises ValueError: If embedding function is missing or is a coroutine function, or if `maxsize` is less than 1.
+    """
+
+    def __init__(self, embedding_func: EmbeddingFunc, maxsize: int = 1024) -> None:
+        if not embedding_func:
+            raise ValueError("Embedding function ('embedding_func') is required")
+        if inspect.iscoroutinefunction(embedding_func):
+            raise ValueError(
+                "Coroutine embedding functions ('embedding_func') can't be cached"
+            )
+        if maxsize <= 0:
+            raise ValueError("maxsize should be 1 or above")
+
+        self.embedding_func = embedding_func
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+
+        self._cache: OrderedDict[bytes, Embedding] = OrderedDict()
+        # Embeddings which are being computed, keyed by the text hash
+        self._in_flight: Dict[bytes, Future] = {}
+        # Embedding functions are usually called from worker threads (like the ones used by `EmbeddingBatcher`)
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: List[str]) -> List[Embedding]:
+        keys = [self._key(text) for text in texts]
+        embeddings: Dict[bytes, Embedding] = {}
+        in_flight: Dict[bytes, Future] = {}
+        missing: Dict[bytes, str] = {}
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in embeddings or key in in_flight or key in missing:
+                    continue
+
+                embedding = self._cache.get(key)
+                if embedding is not None:
+                    self._cache.move_to_end(key)
+                    embeddings[key] = embedding
+                elif key in self._in_flight:
+                    in_flight[key] = self._in_flight[key]
+                else:
+                    missing[key] = text
+
+            futures: Dict[bytes, Future] = {key: Future() for key in missing}
+            self._in_flight.update(futures)
+
+            self.hits += len(embeddings) + len(in_flight)
+            self.misses += len(missing)
+
+        if missing:
+            # Lock is not held while computing the embeddings, so that other threads are not blocked.
+            # Other calls with the same texts wait for this computation (using the in-flight futures).
+            try:
+                computed = self.embedding_func(list(missing.values()))
+                if len(computed) != len(missing):
+                    raise ValueError(
+                        f"Embedding function returned {len(computed)} embeddings for {len(missing)} texts"
+                    )
+            except BaseException as e:
+                with self._lock:
+                    for key, future in futures.items():
+                        self._in_flight.pop(key, None)
+                        future.set_exception(e)
+                raise
+
+            with self._lock:
+                for key, embedding in zip(missing, computed):
+                    embeddings[key] = embedding
+                    self._cache[key] = embedding
+                    self._cache.move_to_end(key)
+                    self._in_flight.pop(key, None)
+                    futures[key].set_result(embedding)
+
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        for key, future in in_flight.items():
+            embeddings[key] = future.result()
+
+        return [embeddings[key] for key in keys]
+
+    def clear(self):
+        """
+        Removes all the cached embeddings.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    @classmethod
+    def _key(cls, text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
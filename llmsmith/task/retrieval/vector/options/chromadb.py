@@ -22,8 +22,12 @@ class ChromaDBQueryOptions(TypedDict):
     where_document: WhereDocument
 
 
+# Option names are resolved once, instead of reading the annotations for every query
+_QUERY_OPT_KEYS = tuple(ChromaDBQueryOptions.__annotations__)
+
+
 def _query_options_dict(options: ChromaDBQueryOptions) -> dict:
-    opt = {attr: options.get(attr) for attr in ChromaDBQueryOptions.__annotations__}
+    opt = {attr: options.get(attr) for attr in _QUERY_OPT_KEYS}
 
     if not opt.get("n_results"):
         opt["n_results"] = 10
@@ -25,8 +25,12 @@ class PgVectorQueryOptions(TypedDict):
     distance_function: Literal["l2", "cosine"]
 
 
+# Option names are resolved once, instead of reading the annotations for every query
+_QUERY_OPT_KEYS = tuple(PgVectorQueryOptions.__annotations__)
+
+
 def _query_options_dict(options: PgVectorQueryOptions) -> dict:
-    opt = {attr: options.get(attr) for attr in PgVectorQueryOptions.__annotations__}
+    opt = {attr: options.get(attr) for attr in _QUERY_OPT_KEYS}
 
     if not opt.get("limit"):
         opt["limit"] = 10
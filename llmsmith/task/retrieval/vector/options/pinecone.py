@@ -24,8 +24,12 @@ class PineconeQueryOptions(TypedDict):
     sparse_vector: Union[SparseValues, Dict[str, Union[List[float], List[int]]], None]
 
 
+# Option names are resolved once, instead of reading the annotations for every query
+_QUERY_OPT_KEYS = tuple(PineconeQueryOptions.__annotations__)
+
+
 def _query_options_dict(options: PineconeQueryOptions) -> dict:
-    opt = {attr: options.get(attr) for attr in PineconeQueryOptions.__annotations__}
+    opt = {attr: options.get(attr) for attr in _QUERY_OPT_KEYS}
 
     if not opt.get("top_k"):
         opt["top_k"] = 10
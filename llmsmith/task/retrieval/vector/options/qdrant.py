@@ -20,6 +20,19 @@ class QdrantQueryOptions(TypedDict):
     Refer below links for more info.
 
     * https://python-client.qdrant.tech/qdrant_client.async_qdrant_client
+
+    For collections with quantization enabled, the search can be done on the quantized vectors
+    (and rescored using the original vectors) with the `search_params` option. Searching on quantized
+    vectors is faster, at the cost of a slight loss in accuracy (which is mostly recovered by rescoring).
+
+    .. code-block:: python
+
+        query_options = QdrantQueryOptions(
+            limit=10,
+            search_params=SearchParams(
+                quantization=QuantizationSearchParams(ignore=False, rescore=True)
+            ),
+        )
     """
 
     query_filter: Union[Filter, None]
@@ -33,8 +46,12 @@ class QdrantQueryOptions(TypedDict):
     timeout: Union[int, None]
 
 
+# Option names are resolved once, instead of reading the annotations for every query
+_QUERY_OPT_KEYS = tuple(QdrantQueryOptions.__annotations__)
+
+
 def _query_options_dict(options: QdrantQueryOptions) -> dict:
-    opt = {attr: options.get(attr) for attr in QdrantQueryOptions.__annotations__}
+    opt = {attr: options.get(attr) for attr in _QUERY_OPT_KEYS}
     opt["with_payload"] = True
 
     if not opt.get("limit"):
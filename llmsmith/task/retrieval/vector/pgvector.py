@@ -1,13 +1,19 @@
+import asyncio
 import logging
-from typing import Callable, List
+from typing import Callable, List, Tuple, Union
 
-from sqlalchemy import Select
-from sqlalchemy.sql.elements import BindParameter
+from sqlalchemy import CompoundSelect, Select
 
 from llmsmith.reranker.base import Reranker
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
-from llmsmith.task.retrieval.vector.base import EmbeddingFunc, default_doc_processor
+from llmsmith.task.retrieval.vector.base import (
+    EmbeddingFunc,
+    _embed_task_inputs,
+    _run_embedding_func,
+    default_doc_processor,
+)
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 from llmsmith.task.retrieval.vector.options.pgvector import (
     PgVectorQueryOptions,
     _query_options_dict,
@@ -20,7 +26,15 @@ try:
     from sqlalchemy import text
     from sqlalchemy.engine.cursor import CursorResult
     from sqlalchemy.sql import ColumnElement
-    from sqlalchemy.sql.expression import select, table
+    from sqlalchemy.sql.expression import (
+        TableClause,
+        bindparam,
+        column,
+        literal_column,
+        select,
+        table,
+        union_all,
+    )
 except ImportError:
     raise ImportError(
         "'sqlalchemy', 'psycopg' and 'pgvector' libraries are required to use PgVector. You can install it with `pip install \"llmsmith[pgvector]\"`"
@@ -31,7 +45,12 @@ log = logging.getLogger(__name__)
 
 # Default options for querying a PgVector supported table.
 default_options: PgVectorQueryOptions = PgVectorQueryOptions(limit=10)
-supported_distance_functions = ["l2", "cosine"]
+# pgvector comparator methods for each of the supported distance functions
+_distance_comparators = {"l2": "l2_distance", "cosine": "cosine_distance"}
+supported_distance_functions = frozenset(_distance_comparators)
+# Extra columns selected while querying for multiple inputs at once, to split (and order) the rows per input
+_QUERY_IDX_COLNAME = "_llmsmith_query_idx"
+_DISTANCE_COLNAME = "_llmsmith_distance"
 
 
 class BasePgVectorTask(Task[str, List[str]]):
@@ -54,6 +73,10 @@ class BasePgVectorTask(Task[str, List[str]]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.pgvector.PgVectorQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
+    :raises ValueError: If any of the required params is missing, or if the distance function is not supported.
     """
 
     def __init__(
@@ -66,6 +89,7 @@ class BasePgVectorTask(Task[str, List[str]]):
         embedding_func: EmbeddingFunc,
         query_options: PgVectorQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -82,55 +106,223 @@ class BasePgVectorTask(Task[str, List[str]]):
         self._table_name = table_name
         self._text_column = text_colname
         self._embedding_column = embedding_colname
+        # Lightweight table construct, so that the distance operators of pgvector can be used on the embedding column
+        self._table: TableClause = table(
+            table_name, column(embedding_colname, Vector), column(text_colname)
+        )
         self.embedding_func = embedding_func
         self.query_options = query_options
+        # Options are same for every request, hence computed only once
+        self._query_options: dict = _query_options_dict(query_options)
         self._reranker = reranker
+        self._embedding_batcher = embedding_batcher
+        # Query is same for every request (except the query embedding, which is bound during execution),
+        # hence built only once
+        self._select_stmt: Select = self._build_select_stmt(self._query_options)
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[List[str]]:
         """
         Executes the task of retrieving documents from the PgVector backed table.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the list of documents from pgvector backed table.
         :rtype: :class:`llmsmith.task.models.TaskOutput[List[str]]`
         """
-        query_options: dict = _query_options_dict(self.query_options)
+        query_options: dict = self._query_options
 
-        log.debug(
-            f"PgVector query request: input string: {task_input.content}\n OPTIONS: {query_options}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"PgVector query request: input string: {task_input.content}\n OPTIONS: {query_options}"
+            )
+
+        embedding = getattr(task_input, "embedding", None)
+        if embedding is not None:
+            embeddings = [embedding]
+        elif self._embedding_batcher:
+            embeddings = [await self._embedding_batcher.embed_one(task_input.content)]
+        else:
+            embeddings = await _run_embedding_func(
+                self.embedding_func, [task_input.content]
+            )
+
+        async with self._db_engine.connect() as conn:
+            rows: CursorResult = await conn.execute(
+                self._select_stmt, {"embedding_val": embeddings[0]}
+            )
+            records, docs = self._records_and_docs(rows)
+
+        if self._reranker and docs:
+            docs = await self._reranker.rerank(query=task_input.content, docs=docs)
+
+        return TaskOutput(content=docs, raw_output=records)
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[List[str]]]:
+        """
+        Executes the task of retrieving documents from the PgVector backed table for multiple inputs at once.
+        All the inputs (without a precomputed embedding) are embedded in a single embedding function call, and queried in a single
+        statement (`UNION ALL` of the per-input queries), hence a single DB round trip is made for all the inputs.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[List[str]]`]
+        """
+        if not task_inputs:
+            return []
+
+        query_options: dict = self._query_options
+        queries: List[str] = [task_input.content for task_input in task_inputs]
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"PgVector batch query request: input strings: {queries}\n OPTIONS: {query_options}"
+            )
+
+        embeddings = await _embed_task_inputs(self.embedding_func, task_inputs)
+
+        async with self._db_engine.connect() as conn:
+            rows: CursorResult = await conn.execute(
+                self._build_batch_select_stmt(len(embeddings)),
+                {
+                    f"embedding_val_{idx}": embedding
+                    for idx, embedding in enumerate(embeddings)
+                },
+            )
+            records_list, docs_list = self._records_and_docs_per_query(
+                rows, len(embeddings)
+            )
+
+        if self._reranker:
+            # Queries without any documents are not reranked
+            rerank_idxs = [idx for idx, docs in enumerate(docs_list) if docs]
+            reranked_docs_list = await self._reranker.rerank_many(
+                [queries[idx] for idx in rerank_idxs],
+                [docs_list[idx] for idx in rerank_idxs],
+            )
+            for idx, docs in zip(rerank_idxs, reranked_docs_list):
+                docs_list[idx] = docs
+
+        return [
+            TaskOutput(content=docs, raw_output=records)
+            for docs, records in zip(docs_list, records_list)
+        ]
+
+    def _records_and_docs(self, rows: CursorResult) -> Tuple[List[dict], List[str]]:
+        """
+        Returns the rows as records (dicts), along with the documents (text column value) in them, in a single pass.
+        """
+        records: List[dict] = []
+        docs: List[str] = []
+        for row in rows:
+            # Row mapping is a view, hence the dict is created only once per row
+            row_mapping = row._mapping
+            records.append(dict(row_mapping))
+            docs.append(row_mapping.get(self._text_column))
+
+        return records, docs
 
-        embeddings = self.embedding_func([task_input.content])
+    def _records_and_docs_per_query(
+        self, rows: CursorResult, num_queries: int
+    ) -> Tuple[List[List[dict]], List[List[str]]]:
+        """
+        Splits the rows returned for multiple queries (see :meth:`_build_batch_select_stmt`) by the query index,
+        and returns the records (without the extra columns) and the documents of each query.
+        """
+        records_list: List[List[dict]] = [[] for _ in range(num_queries)]
+        docs_list: List[List[str]] = [[] for _ in range(num_queries)]
+        for row in rows:
+            row_mapping = row._mapping
+            query_idx: int = row_mapping[_QUERY_IDX_COLNAME]
+            records_list[query_idx].append(
+                {
+                    key: value
+                    for key, value in row_mapping.items()
+                    if key != _QUERY_IDX_COLNAME and key != _DISTANCE_COLNAME
+                }
+            )
+            docs_list[query_idx].append(row_mapping.get(self._text_column))
 
-        dist_func = query_options.get("distance_function")
-        if dist_func not in supported_distance_functions:
+        return records_list, docs_list
+
+    def _build_select_stmt(
+        self,
+        query_options: dict,
+        embedding_param: str = "embedding_val",
+        query_idx: Union[int, None] = None,
+    ) -> Select:
+        # Distance function is validated (and resolved) only once, while building the statement
+        comparator_name = _distance_comparators.get(
+            query_options.get("distance_function")
+        )
+        if comparator_name is None:
             raise ValueError("distance_function only supports 'l2' or 'cosine'")
-        dist_func_op = "<=>" if dist_func == "cosine" else "<->"
 
-        stmt: Select = select(text("*")).select_from(table(self._table_name))
+        distance_comparator = getattr(
+            self._table.c[self._embedding_column], comparator_name
+        )
+        distance = distance_comparator(
+            bindparam(embedding_param, type_=Vector, required=True)
+        )
+
+        stmt: Select = select(text("*"))
+        if query_idx is not None:
+            stmt = stmt.add_columns(
+                literal_column(str(query_idx)).label(_QUERY_IDX_COLNAME),
+                distance.label(_DISTANCE_COLNAME),
+            )
+        stmt = stmt.select_from(self._table)
 
         # apply where clauses if any
         if query_options.get("where") is not None:
             filters: ColumnElement[bool] = query_options.get("where")
             stmt = stmt.filter(filters)
 
-        stmt = stmt.order_by(
-            text(f"{self._embedding_column} {dist_func_op} :embedding_val").bindparams(
-                BindParameter(key="embedding_val", value=embeddings[0], type_=Vector)
+        return stmt.order_by(distance).limit(query_options.get("limit"))
+
+    def _build_batch_select_stmt(self, num_queries: int) -> CompoundSelect:
+        """
+        Builds a single statement for querying multiple embeddings (bound as `embedding_val_<query index>`).
+        The per-query statements are combined using `UNION ALL`, and the rows are tagged with the query index.
+        Rows are ordered by the query index and the distance, since `UNION ALL` doesn't guarantee the order of the rows.
+        """
+        return union_all(
+            *(
+                self._build_select_stmt(
+                    self._query_options, f"embedding_val_{idx}", query_idx=idx
+                )
+                for idx in range(num_queries)
             )
-        ).limit(query_options.get("limit"))
+        ).order_by(
+            literal_column(_QUERY_IDX_COLNAME), literal_column(_DISTANCE_COLNAME)
+        )
 
-        docs: List[str] = []
-        async with self._db_engine.connect() as conn:
-            rows: CursorResult = await conn.execute(stmt)
-            records = [row._asdict() for row in rows]
-            docs = [rec.get(self._text_column) for rec in records]
+    async def warmup(self, connections: int = 1):
+        """
+        Opens connections to Postgres DB ahead of the first execution (like during the app startup), and releases them
+        to the connection pool of the engine. The first executions can then reuse these connections, instead of
+        waiting for the connection setup (TCP and TLS handshakes, authentication).
 
-        if self._reranker and docs:
-            docs = await self._reranker.rerank(query=task_input.content, docs=docs)
+        The connection pool is owned by the engine, hence tasks sharing the same engine share the warmed up connections too.
+        Pool size can be configured while creating the engine (`create_async_engine(url, pool_size=10, max_overflow=10)`).
 
-        return TaskOutput(content=docs, raw_output=records)
+        :param connections: Number of connections to be opened. Should not exceed the pool size of the engine,
+            since the overflowing connections are closed once released. Defaults to 1.
+        :type connections: int, optional
+        :raises ValueError: If `connections` is less than 1.
+        """
+        if connections <= 0:
+            raise ValueError("connections should be 1 or above")
+
+        async def _connect():
+            async with self._db_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        # Connections are opened concurrently, so that each of them is a separate pooled connection
+        await asyncio.gather(*(_connect() for _ in range(connections)))
 
 
 class PgVectorRetriever(Task[str, str]):
@@ -155,6 +347,9 @@ class PgVectorRetriever(Task[str, str]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.pgvector.PgVectorQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -168,6 +363,7 @@ class PgVectorRetriever(Task[str, str]):
         doc_processing_func: Callable[[List[str]], str] = default_doc_processor,
         query_options: PgVectorQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -180,6 +376,7 @@ class PgVectorRetriever(Task[str, str]):
             embedding_func=embedding_func,
             query_options=query_options,
             reranker=reranker,
+            embedding_batcher=embedding_batcher,
         )
         self.doc_processing_func = doc_processing_func
 
@@ -187,7 +384,8 @@ class PgVectorRetriever(Task[str, str]):
         """
         Executes the task of retrieving documents from the PgVector backed table.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from sqlalchemy.
         :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
@@ -196,3 +394,38 @@ class PgVectorRetriever(Task[str, str]):
 
         processed_res: str = self.doc_processing_func(task_res.content)
         return TaskOutput(content=processed_res, raw_output=task_res.raw_output)
+
+    async def warmup(self, connections: int = 1):
+        """
+        Opens connections to Postgres DB ahead of the first execution (like during the app startup), and releases them
+        to the connection pool of the engine. See :meth:`BasePgVectorTask.warmup`.
+
+        :param connections: Number of connections to be opened. Should not exceed the pool size of the engine. Defaults to 1.
+        :type connections: int, optional
+        :raises ValueError: If `connections` is less than 1.
+        """
+        await self._task.warmup(connections)
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[str]]:
+        """
+        Executes the task of retrieving documents from the PgVector backed table for multiple inputs at once.
+        See :meth:`BasePgVectorTask.execute_many`.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        task_results: List[TaskOutput[List[str]]] = await self._task.execute_many(
+            task_inputs
+        )
+
+        return [
+            TaskOutput(
+                content=self.doc_processing_func(task_res.content),
+                raw_output=task_res.raw_output,
+            )
+            for task_res in task_results
+        ]
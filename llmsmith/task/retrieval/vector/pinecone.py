@@ -1,10 +1,19 @@
+import asyncio
+import inspect
 import logging
 from typing import Callable, List
 
 from llmsmith.reranker.base import Reranker
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
-from llmsmith.task.retrieval.vector.base import EmbeddingFunc, default_doc_processor
+from llmsmith.task.retrieval.vector.base import (
+    EmbeddingFunc,
+    _as_list,
+    _embed_task_inputs,
+    _run_embedding_func,
+    default_doc_processor,
+)
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 from llmsmith.task.retrieval.vector.options.pinecone import (
     PineconeQueryOptions,
     _query_options_dict,
@@ -41,6 +50,9 @@ class BasePineconeTask(Task[str, List[str]]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.pinecone.PineconeQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -51,6 +63,7 @@ class BasePineconeTask(Task[str, List[str]]):
         text_field_name: str,
         query_options: PineconeQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -58,30 +71,48 @@ class BasePineconeTask(Task[str, List[str]]):
             raise ValueError("Embedding function ('embedding_func') is required")
 
         self.index = index
+        # Async index clients (like `IndexAsyncio` in newer Pinecone SDKs) are awaited directly,
+        # whereas the blocking ones are run in a separate thread to avoid blocking the event loop.
+        self._is_async_index: bool = inspect.iscoroutinefunction(index.query)
         self.embedding_func = embedding_func
         self.text_field_name = text_field_name
         self.query_options = query_options
+        # Options are same for every request, hence computed only once
+        self._query_options: dict = _query_options_dict(query_options)
         self._reranker = reranker
+        self._embedding_batcher = embedding_batcher
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[List[str]]:
         """
         Executes the task of retrieving documents from the Pinecone collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from Pinecone.
         :rtype: :class:`llmsmith.task.models.TaskOutput[List[str]]`
         """
-        query_options: dict = _query_options_dict(self.query_options)
+        query_options: dict = self._query_options
 
-        log.debug(
-            f"Pinecone query request: input string: {task_input.content}\n OPTIONS: {query_options}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Pinecone query request: input string: {task_input.content}\n OPTIONS: {query_options}"
+            )
 
-        embeddings = self.embedding_func([task_input.content])
+        embedding = getattr(task_input, "embedding", None)
+        if embedding is not None:
+            embeddings = [embedding]
+        elif self._embedding_batcher:
+            embeddings = [await self._embedding_batcher.embed_one(task_input.content)]
+        else:
+            embeddings = await _run_embedding_func(
+                self.embedding_func, [task_input.content]
+            )
 
-        res: QueryResponse = self.index.query(
-            vector=embeddings, include_metadata=True, **query_options
+        res: QueryResponse = await self._query(
+            vector=[_as_list(embedding) for embedding in embeddings],
+            include_metadata=True,
+            **query_options,
         )
 
         docs = [
@@ -92,6 +123,62 @@ class BasePineconeTask(Task[str, List[str]]):
 
         return TaskOutput(content=docs, raw_output=res)
 
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[List[str]]]:
+        """
+        Executes the task of retrieving documents from the Pinecone collection for multiple inputs at once.
+        All the inputs (without a precomputed embedding) are embedded in a single embedding function call. Pinecone has no batch query API,
+        hence the index is queried once per input, concurrently.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[List[str]]`]
+        """
+        if not task_inputs:
+            return []
+
+        query_options: dict = self._query_options
+        queries: List[str] = [task_input.content for task_input in task_inputs]
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Pinecone batch query request: input strings: {queries}\n OPTIONS: {query_options}"
+            )
+
+        embeddings = await _embed_task_inputs(self.embedding_func, task_inputs)
+
+        results: List[QueryResponse] = await asyncio.gather(
+            *(
+                self._query(
+                    vector=[_as_list(embedding)], include_metadata=True, **query_options
+                )
+                for embedding in embeddings
+            )
+        )
+
+        docs_list = [
+            [
+                doc.get("metadata", {}).get(self.text_field_name)
+                for doc in res["matches"]
+            ]
+            for res in results
+        ]
+        if self._reranker:
+            docs_list = await self._reranker.rerank_many(queries, docs_list)
+
+        return [
+            TaskOutput(content=docs, raw_output=res)
+            for docs, res in zip(docs_list, results)
+        ]
+
+    async def _query(self, **kwargs) -> QueryResponse:
+        if self._is_async_index:
+            return await self.index.query(**kwargs)
+
+        return await asyncio.to_thread(self.index.query, **kwargs)
+
 
 class PineconeRetriever(Task[str, str]):
     """
@@ -111,6 +198,9 @@ class PineconeRetriever(Task[str, str]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.pinecone.PineconeQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -122,6 +212,7 @@ class PineconeRetriever(Task[str, str]):
         doc_processing_func: Callable[[List[str]], str] = default_doc_processor,
         query_options: PineconeQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -132,6 +223,7 @@ class PineconeRetriever(Task[str, str]):
             text_field_name=text_field_name,
             query_options=query_options,
             reranker=reranker,
+            embedding_batcher=embedding_batcher,
         )
         self.doc_processing_func = doc_processing_func
 
@@ -139,7 +231,8 @@ class PineconeRetriever(Task[str, str]):
         """
         Executes the task of retrieving documents from the Pinecone collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from Pinecone.
         :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
@@ -148,3 +241,27 @@ class PineconeRetriever(Task[str, str]):
 
         processed_res: str = self.doc_processing_func(task_res.content)
         return TaskOutput(content=processed_res, raw_output=task_res.raw_output)
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[str]]:
+        """
+        Executes the task of retrieving documents from the Pinecone collection for multiple inputs at once.
+        See :meth:`BasePineconeTask.execute_many`.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        task_results: List[TaskOutput[List[str]]] = await self._task.execute_many(
+            task_inputs
+        )
+
+        return [
+            TaskOutput(
+                content=self.doc_processing_func(task_res.content),
+                raw_output=task_res.raw_output,
+            )
+            for task_res in task_results
+        ]
@@ -4,7 +4,14 @@ from typing import Callable, List
 from llmsmith.reranker.base import Reranker
 from llmsmith.task.base import Task
 from llmsmith.task.models import TaskInput, TaskOutput
-from llmsmith.task.retrieval.vector.base import EmbeddingFunc, default_doc_processor
+from llmsmith.task.retrieval.vector.base import (
+    EmbeddingFunc,
+    _as_list,
+    _embed_task_inputs,
+    _run_embedding_func,
+    default_doc_processor,
+)
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 from llmsmith.task.retrieval.vector.options.qdrant import (
     QdrantQueryOptions,
     _query_options_dict,
@@ -12,6 +19,7 @@ from llmsmith.task.retrieval.vector.options.qdrant import (
 
 try:
     from qdrant_client import AsyncQdrantClient
+    from qdrant_client.http.models import SearchRequest
     from qdrant_client.conversions.common_types import ScoredPoint
 except ImportError:
     raise ImportError(
@@ -43,6 +51,9 @@ class BaseQdrantTask(Task[str, List[str]]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.qdrant.QdrantQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -54,6 +65,7 @@ class BaseQdrantTask(Task[str, List[str]]):
         embedded_field_name: str,
         query_options: QdrantQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -65,43 +77,142 @@ class BaseQdrantTask(Task[str, List[str]]):
         self.embedding_func = embedding_func
         self.embedded_field_name = embedded_field_name
         self.query_options = query_options
+        # Options are same for every request, hence computed only once
+        self._query_options: dict = _query_options_dict(query_options)
         self._reranker = reranker
+        self._embedding_batcher = embedding_batcher
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[List[str]]:
         """
         Executes the task of retrieving documents from the qdrant collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from Qdrant.
         :rtype: :class:`llmsmith.task.models.TaskOutput[List[str]]`
         """
 
-        query_options: dict = _query_options_dict(self.query_options)
+        query_options: dict = self._query_options
 
-        log.debug(
-            f"Qdrant query request: input string: {task_input.content}\n OPTIONS: {query_options}"
-        )
-        embeddings = self.embedding_func([task_input.content])
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Qdrant query request: input string: {task_input.content}\n OPTIONS: {query_options}"
+            )
+        embedding = getattr(task_input, "embedding", None)
+        if embedding is not None:
+            embeddings = [embedding]
+        elif self._embedding_batcher:
+            embeddings = [await self._embedding_batcher.embed_one(task_input.content)]
+        else:
+            embeddings = await _run_embedding_func(
+                self.embedding_func, [task_input.content]
+            )
 
         res: List[ScoredPoint] = await self.client.search(
             collection_name=self.collection_name,
-            query_vector=embeddings[0],
+            query_vector=_as_list(embeddings[0]),
             **query_options,
         )
 
-        docs = [doc.payload.get(self.embedded_field_name, "") for doc in res]
+        docs = self._docs(res)
 
         if self._reranker:
             docs = await self._reranker.rerank(query=task_input.content, docs=docs)
 
         return TaskOutput(content=docs, raw_output=res)
 
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[List[str]]]:
+        """
+        Executes the task of retrieving documents from the qdrant collection for multiple inputs at once.
+        All the inputs (without a precomputed embedding) are embedded in a single embedding function call, and searched in a single batch search request.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[List[str]]`]
+        """
+        if not task_inputs:
+            return []
+
+        query_options: dict = self._query_options
+        queries: List[str] = [task_input.content for task_input in task_inputs]
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Qdrant batch query request: input strings: {queries}\n OPTIONS: {query_options}"
+            )
+        embeddings = await _embed_task_inputs(self.embedding_func, task_inputs)
+
+        results: List[List[ScoredPoint]] = await self.client.search_batch(
+            collection_name=self.collection_name,
+            requests=[
+                SearchRequest(
+                    vector=_as_list(embedding),
+                    filter=query_options["query_filter"],
+                    params=query_options["search_params"],
+                    limit=query_options["limit"],
+                    offset=query_options["offset"],
+                    with_payload=query_options["with_payload"],
+                    with_vector=query_options["with_vectors"],
+                    score_threshold=query_options["score_threshold"],
+                    shard_key=query_options["shard_key_selector"],
+                )
+                for embedding in embeddings
+            ],
+            consistency=query_options["consistency"],
+            timeout=query_options["timeout"],
+        )
+
+        docs_list = [self._docs(res) for res in results]
+
+        if self._reranker:
+            docs_list = await self._reranker.rerank_many(queries, docs_list)
+
+        return [
+            TaskOutput(content=docs, raw_output=res)
+            for docs, res in zip(docs_list, results)
+        ]
+
+    def _docs(self, res: List[ScoredPoint]) -> List[str]:
+        field_name = self.embedded_field_name
+
+        # Points without payload are returned as empty documents, so that the documents stay aligned with the points
+        return [
+            payload.get(field_name, "") if payload is not None else ""
+            for payload in (point.payload for point in res)
+        ]
+
 
 class QdrantRetriever(Task[str, str]):
     """
     Task for retrieving documents from a collection in Qdrant.
 
+    The client should be created once and shared across the retrievers (and requests), so that the connections
+    are reused. Creating a client per request opens new connections every time.
+    gRPC transport (`prefer_grpc=True`) has lower per-request overhead than REST for small queries.
+
+    .. code-block:: python
+
+        client = AsyncQdrantClient(url=qdrant_url, api_key=qdrant_api_key, prefer_grpc=True)
+
+        docs_retriever = QdrantRetriever(
+            name="docs-retriever",
+            client=client,
+            collection_name="docs",
+            embedding_func=embedding_func,
+            embedded_field_name="text",
+        )
+        faq_retriever = QdrantRetriever(
+            name="faq-retriever",
+            client=client,
+            collection_name="faq",
+            embedding_func=embedding_func,
+            embedded_field_name="text",
+        )
+
     :param name: The name of the task.
     :type name: str
     :param client: Qdrant client.
@@ -118,6 +229,9 @@ class QdrantRetriever(Task[str, str]):
     :type query_options: :class:`llmsmith.task.retrieval.vector.options.qdrant.QdrantQueryOptions`, optional
     :param reranker: Rerank the documents based on the query used to retrieve the documents.
     :type reranker: :class:`llmsmith.reranker.base.Reranker`, optional
+    :param embedding_batcher: Batches the query embeddings of concurrent executions into a single embedding function call.
+        Query is embedded using `embedding_func` directly if not provided.
+    :type embedding_batcher: :class:`llmsmith.task.retrieval.vector.embedding.EmbeddingBatcher`, optional
     """
 
     def __init__(
@@ -130,6 +244,7 @@ class QdrantRetriever(Task[str, str]):
         doc_processing_func: Callable[[List[str]], str] = default_doc_processor,
         query_options: QdrantQueryOptions = default_options,
         reranker: Reranker = None,
+        embedding_batcher: EmbeddingBatcher = None,
     ) -> None:
         super().__init__(name)
 
@@ -141,6 +256,7 @@ class QdrantRetriever(Task[str, str]):
             embedded_field_name=embedded_field_name,
             query_options=query_options,
             reranker=reranker,
+            embedding_batcher=embedding_batcher,
         )
 
         if not doc_processing_func:
@@ -152,7 +268,8 @@ class QdrantRetriever(Task[str, str]):
         """
         Executes the task of retrieving documents from the qdrant collection.
 
-        :param task_input: The input for the task.
+        :param task_input: The input for the task. Use :class:`llmsmith.task.retrieval.vector.base.TaskInputWithEmbedding`
+            to skip embedding the query, if its embedding is already available.
         :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
         :return: The output of the task, which includes the processed result and the raw output from Qdrant.
         :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
@@ -162,3 +279,27 @@ class QdrantRetriever(Task[str, str]):
 
         processed_res: str = self.doc_processing_func(task_res.content)
         return TaskOutput(content=processed_res, raw_output=task_res.raw_output)
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]]
+    ) -> List[TaskOutput[str]]:
+        """
+        Executes the task of retrieving documents from the qdrant collection for multiple inputs at once.
+        See :meth:`BaseQdrantTask.execute_many`.
+
+        :param task_inputs: The inputs for the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :return: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        task_results: List[TaskOutput[List[str]]] = await self._task.execute_many(
+            task_inputs
+        )
+
+        return [
+            TaskOutput(
+                content=self.doc_processing_func(task_res.content),
+                raw_output=task_res.raw_output,
+            )
+            for task_res in task_results
+        ]
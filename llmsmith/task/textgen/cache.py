@@ -0,0 +1,200 @@
+import dataclasses
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Mapping, Tuple, Union
+from uuid import uuid4
+import weakref
+
+from llmsmith.task.models import ChatResponse
+
+
+class ChatResponseCache:
+    """
+    In-memory LRU cache for LLM chat responses, keyed by the LLM client and the request sent to the LLM.
+    It should be used only for deterministic requests (like the ones with temperature set to 0),
+    where the same request is expected to produce the same response.
+
+    Requests which can't be serialized into a stable cache key (like the ones containing arbitrary SDK objects)
+    are sent to the LLM without caching.
+
+    .. code-block:: python
+
+        response_cache = ChatResponseCache(maxsize=1024, ttl=3600)
+
+        agent = GroqFunctionAgent(
+            name="groq-agent",
+            llm=llm,
+            llm_options=GroqTextGenOptions(model="llama3-70b-8192", temperature=0),
+            tools=tools,
+            response_cache=response_cache,
+        )
+
+    :param maxsize: Maximum number of responses to be cached. Defaults to 1024.
+    :type maxsize: int, optional
+    :param ttl: Time (in seconds) after which a cached response expires. Cached responses never expire if set to `None`. Defaults to 3600.
+    :type ttl: float, optional
+    :raises ValueError: If maxsize is less than 1, or if ttl is not above 0.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Union[float, None] = 3600) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize should be 1 or above")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl should be above 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._responses: OrderedDict[bytes, Tuple[float, ChatResponse]] = OrderedDict()
+        # Cache can be shared by tasks running in different threads (and event loops)
+        self._lock = threading.Lock()
+        # Identities of the clients without a stable (API key based) identity
+        self._client_ids: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def cached_chat(
+        self,
+        chat_func: Callable[..., Awaitable[ChatResponse]],
+        options: Any,
+        client: Any = None,
+        **chat_kwargs,
+    ) -> ChatResponse:
+        """
+        Returns the cached response for the chat request if available.
+        Otherwise, calls the LLM using `chat_func` and caches its response.
+
+        :param chat_func: Function which sends the chat request to the LLM.
+        :type chat_func: Callable[..., Awaitable[:class:`llmsmith.task.models.ChatResponse`]]
+        :param options: LLM options used for the chat request.
+        :type options: Any
+        :param client: LLM client used for the chat request. Clients with different API keys (or base URLs) don't share the cached responses.
+        :type client: Any, optional
+        :param chat_kwargs: Keyword arguments to be passed into `chat_func`.
+        :returns: chat response from the cache or the LLM.
+        :rtype: :class:`llmsmith.task.models.ChatResponse`
+        """
+        key = self._key(client, options, chat_kwargs)
+        if key is None:
+            return await chat_func(**chat_kwargs)
+
+        cached_response = self.get(key)
+        if cached_response is not None:
+            return cached_response
+
+        chat_response = await chat_func(**chat_kwargs)
+        self.put(key, chat_response)
+
+        return chat_response
+
+    def get(self, key: bytes) -> Union[ChatResponse, None]:
+        """
+        Returns the cached response against the key.
+
+        :param key: cache key
+        :type key: bytes
+        :returns: cached response. Returns `None` if the key is not available in the cache, or if the response has expired.
+        :rtype: :class:`llmsmith.task.models.ChatResponse`
+        """
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None:
+                return None
+
+            expires_at, chat_response = entry
+            if expires_at <= time.monotonic():
+                del self._responses[key]
+                return None
+
+            self._responses.move_to_end(key)
+
+        return chat_response
+
+    def put(self, key: bytes, chat_response: ChatResponse):
+        """
+        Caches the response against the key. The least recently used response is evicted if the cache is full.
+
+        :param key: cache key
+        :type key: bytes
+        :param chat_response: chat response from the LLM.
+        :type chat_response: :class:`llmsmith.task.models.ChatResponse`
+        """
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._responses[key] = (expires_at, chat_response)
+            self._responses.move_to_end(key)
+
+            if len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all the cached responses.
+        """
+        with self._lock:
+            self._responses.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def _key(self, client: Any, options: Any, chat_kwargs: dict) -> Union[bytes, None]:
+        """
+        Builds the cache key from the LLM client, the LLM options and the chat request.
+        Returns `None` if the request can't be serialized into a stable key.
+        """
+        try:
+            request = json.dumps(
+                [self._client_identity(client), options, chat_kwargs],
+                sort_keys=True,
+                default=_to_jsonable,
+            )
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.blake2b(request.encode(), digest_size=16).digest()
+
+    def _client_identity(self, client: Any) -> Union[str, None]:
+        if client is None:
+            return None
+
+        # Clients with the same API key and base URL return the same responses
+        api_key = getattr(client, "api_key", None)
+        if isinstance(api_key, str):
+            api_key_hash = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+            base_url = getattr(client, "base_url", None)
+            return f"{type(client).__qualname__}:{base_url}:{api_key_hash}"
+
+        # Other clients (like Gemini's GenerativeModel) are identified by the client object itself.
+        # A random id is used instead of `id(client)`, since object ids are reused once the objects are garbage collected.
+        with self._lock:
+            client_id = self._client_ids.get(client)
+            if client_id is None:
+                client_id = self._client_ids[client] = uuid4().hex
+
+        return client_id
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """
+    Converts the SDK specific objects in the chat request (like pydantic models and protobuf messages)
+    into JSON serializable values. Raises `TypeError` for the objects which can't be converted.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+
+    # pydantic models
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()
+
+    # proto-plus messages
+    to_dict = getattr(type(obj), "to_dict", None)
+    if callable(to_dict):
+        return to_dict(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
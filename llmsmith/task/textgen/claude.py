@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import AsyncIterator, List
 
 try:
     import anthropic
@@ -49,6 +49,11 @@ class ClaudeTextGenTask(Task[str, str]):
         self.llm: anthropic.AsyncAnthropic = llm
         self.llm_options: ClaudeTextGenOptions = llm_options
 
+        # Options are same for every request, hence computed only once
+        self._chat_completion_options: dict = _completion_create_options_dict(
+            llm_options
+        )
+
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
         Generates text using Anthropic Claude LLM using the given input.
@@ -59,29 +64,72 @@ class ClaudeTextGenTask(Task[str, str]):
         :returns: The output of the task.
         :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
         """
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
         if not isinstance(task_input.content, str):
-            log.debug(f"task_input value: {task_input}")
+            if debug_enabled:
+                log.debug(f"task_input value: {task_input}")
             raise ValueError("task_input.content should be of type 'str'")
 
         llm_input_content: str = task_input.content
 
         messages_payload: List[dict] = [{"role": "user", "content": llm_input_content}]
-        chat_completion_options: dict = _completion_create_options_dict(
-            self.llm_options
-        )
+        chat_completion_options: dict = self._chat_completion_options
 
-        log.debug(
-            f"Anthropic Claude chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
-        )
+        # Payloads and responses are formatted only if debug logs are enabled
+        if debug_enabled:
+            log.debug(
+                f"Anthropic Claude chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
 
         llm_reply: Message = await self.llm.messages.create(
             messages=messages_payload, **chat_completion_options
         )
 
-        log.debug(f"Anthropic Claude chat response: {llm_reply}")
+        if debug_enabled:
+            log.debug(f"Anthropic Claude chat response: {llm_reply}")
 
         output_content: str = llm_reply.content[0].text
 
-        log.debug(f"task_output value: {output_content}")
+        if debug_enabled:
+            log.debug(f"task_output value: {output_content}")
 
         return TaskOutput(content=output_content, raw_output=llm_reply)
+
+    async def stream(self, task_input: TaskInput[str]) -> AsyncIterator[str]:
+        """
+        Generates text using Anthropic Claude LLM using the given input, and yields the
+        generated text in chunks as soon as they are received from the LLM.
+        Unlike :meth:`execute`, the whole completion is not buffered before returning.
+
+        .. code-block:: python
+
+            async for text in text_gen_task.stream(TaskInput("query")):
+                print(text, end="")
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :raises ValueError: If the content of the task input is not a string.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        if not isinstance(task_input.content, str):
+            if debug_enabled:
+                log.debug(f"task_input value: {task_input}")
+            raise ValueError("task_input.content should be of type 'str'")
+
+        messages_payload: List[dict] = [{"role": "user", "content": task_input.content}]
+        chat_completion_options: dict = self._chat_completion_options
+
+        if debug_enabled:
+            log.debug(
+                f"Anthropic Claude chat stream request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
+
+        async with self.llm.messages.stream(
+            messages=messages_payload, **chat_completion_options
+        ) as llm_stream:
+            async for text in llm_stream.text_stream:
+                yield text
@@ -1,5 +1,6 @@
+import functools
 import logging
-from typing import List, Union
+from typing import AsyncIterator, List, Union
 from uuid import uuid4
 
 from llmsmith.task.textgen.errors import TextGenFailedException
@@ -8,6 +9,7 @@ from llmsmith.task.textgen.options.cohere import CohereTextGenOptions
 try:
     import cohere
     from cohere.types.non_streamed_chat_response import NonStreamedChatResponse
+    from cohere.types.streamed_chat_response import StreamedChatResponse_StreamEnd
     from cohere.types.chat_message import ChatMessage
     from cohere.types.tool import Tool
     from cohere.types.chat_request_tool_results_item import ChatRequestToolResultsItem
@@ -16,8 +18,9 @@ except ImportError:
         "The 'cohere' library is required to use Cohere LLMs. You can install it with `pip install \"llmsmith[cohere]\"`"
     )
 
-from llmsmith.task.base import Task
+from llmsmith.task.base import Task, _execute_concurrently
 from llmsmith.task.models import ChatResponse, FunctionCall, TaskInput, TaskOutput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.options.cohere import (
     _chat_options_dict,
 )
@@ -49,6 +52,9 @@ class BaseCohereChat:
         self.llm: cohere.AsyncClient = llm
         self.llm_options: CohereTextGenOptions = llm_options or default_options
 
+        # Options are same for every request, hence computed only once
+        self._chat_options: dict = _chat_options_dict(self.llm_options)
+
     async def chat(
         self,
         message: str,
@@ -72,9 +78,14 @@ class BaseCohereChat:
         :returns: chat response from the LLM.
         :rtype: :class:`llmsmith.task.models.ChatResponse`
         """
-        chat_options: dict = _chat_options_dict(self.llm_options)
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        chat_options: dict = self._chat_options
 
-        log.debug(f"Cohere chat request: PAYLOAD: {message}\n OPTIONS: {chat_options}")
+        if debug_enabled:
+            log.debug(
+                f"Cohere chat request: PAYLOAD: {message}\n OPTIONS: {chat_options}"
+            )
 
         llm_reply: NonStreamedChatResponse = await self.llm.chat(
             message=message,
@@ -85,7 +96,8 @@ class BaseCohereChat:
             **chat_options,
         )
 
-        log.debug(f"Cohere chat response: {llm_reply}")
+        if debug_enabled:
+            log.debug(f"Cohere chat response: {llm_reply}")
 
         if llm_reply.finish_reason != "COMPLETE":
             raise TextGenFailedException(
@@ -101,14 +113,65 @@ class BaseCohereChat:
                 id=tool_id, name=tool_call.name, args=tool_call.parameters or {}
             )
 
-        log.debug(f"chat response output value: {llm_reply.text}")
+        if debug_enabled:
+            log.debug(f"chat response output value: {llm_reply.text}")
 
         return ChatResponse(
             text=llm_reply.text, raw_output=llm_reply, function_calls=function_calls
         )
 
+    async def stream(
+        self,
+        message: str,
+        chat_history: Union[List[ChatMessage], None] = None,
+        conversation_id: str = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generates text using Cohere LLM using the given input, and yields the generated text
+        in chunks as soon as they are received from the LLM.
+
+        :param message: The input message for the chat.
+        :type message: str
+        :param chat_history: Chat history
+        :type chat_history: List[ChatMessage], optional
+        :raises TextGenFailedError: If AI fails to generate text based on the prompt.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        chat_options: dict = self._chat_options
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Cohere chat stream request: PAYLOAD: {message}\n OPTIONS: {chat_options}"
+            )
+
+        async for event in self.llm.chat_stream(
+            message=message,
+            chat_history=chat_history,
+            conversation_id=conversation_id,
+            **chat_options,
+        ):
+            if event.event_type == "text-generation":
+                yield event.text
+            elif event.event_type == "stream-end" and event.finish_reason != "COMPLETE":
+                raise TextGenFailedException(
+                    "Failed to generate text",
+                    failure_reason=self._block_reason_str(event),
+                )
+
+    async def warmup(self):
+        """
+        Opens a connection to Cohere API ahead of the first chat request (like during the app startup),
+        so that the first chat request doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        A cheap API key check is used for this.
+        """
+        await self.llm.check_api_key()
+
     @classmethod
-    def _block_reason_str(cls, llm_reply: NonStreamedChatResponse) -> str:
+    def _block_reason_str(
+        cls,
+        llm_reply: Union[NonStreamedChatResponse, StreamedChatResponse_StreamEnd],
+    ) -> str:
         if llm_reply.finish_reason == "ERROR_TOXIC":
             return "SAFETY_CHECK_FAILED"
 
@@ -134,6 +197,8 @@ class CohereTextGenTask(Task[str, str]):
     :type llm: :class:`cohere.AsyncClient`
     :param llm_options: A dictionary of options to pass to the Cohere LLM.
     :type llm_options: :class:`llmsmith.task.textgen.options.cohere.CohereTextGenOptions`, optional
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty.
     """
 
@@ -142,9 +207,23 @@ class CohereTextGenTask(Task[str, str]):
         name: str,
         llm: cohere.AsyncClient,
         llm_options: CohereTextGenOptions = default_options,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         super().__init__(name)
         self._chat = BaseCohereChat(llm, llm_options)
+        self._chat_func = self._chat.chat
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if (
+            response_cache is not None
+            and self._chat.llm_options.get("temperature") == 0
+        ):
+            self._chat_func = functools.partial(
+                response_cache.cached_chat,
+                self._chat.chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -162,8 +241,65 @@ class CohereTextGenTask(Task[str, str]):
 
         llm_input_content: str = task_input.content
 
-        chat_response = await self._chat.chat(message=llm_input_content)
+        chat_response = await self._chat_func(message=llm_input_content)
 
         return TaskOutput(
             content=chat_response.text, raw_output=chat_response.raw_output
         )
+
+    async def stream(self, task_input: TaskInput[str]) -> AsyncIterator[str]:
+        """
+        Generates text using Cohere LLM using the given input, and yields the
+        generated text in chunks as soon as they are received from the LLM.
+        Unlike :meth:`execute`, the whole completion is not buffered before returning.
+
+        .. code-block:: python
+
+            async for text in text_gen_task.stream(TaskInput("query")):
+                print(text, end="")
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :raises ValueError: If the content of the task input is not a string.
+        :raises TextGenFailedError: If AI fails to generate text based on the prompt.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        if not isinstance(task_input.content, str):
+            log.debug(f"task_input value: {task_input}")
+            raise ValueError("task_input.content should be of type 'str'")
+
+        async for text in self._chat.stream(message=task_input.content):
+            yield text
+
+    async def warmup(self):
+        """
+        Opens a connection to Cohere API ahead of the first execution (like during the app startup),
+        so that the first execution doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        The client (and hence its connection pool) should be shared across the tasks, instead of creating one per request.
+
+        .. code-block:: python
+
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                await text_gen_task.warmup()
+                yield
+        """
+        await self._chat.warmup()
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]], max_concurrency: int = 16
+    ) -> List[TaskOutput[str]]:
+        """
+        Generates text using Cohere LLM for multiple inputs concurrently, so that independent prompts
+        (like the ones in a map-reduce summarization) do not wait for each other.
+
+        :param task_inputs: The inputs to the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :param max_concurrency: Maximum number of concurrent requests to the LLM. Defaults to 16.
+        :type max_concurrency: int, optional
+        :raises ValueError: If the content of any task input is not a string, or if `max_concurrency` is less than 1.
+        :returns: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        return await _execute_concurrently(self, task_inputs, max_concurrency)
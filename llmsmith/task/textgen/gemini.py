@@ -1,5 +1,6 @@
+import functools
 import logging
-from typing import List, Union
+from typing import AsyncIterator, List, Union
 from uuid import uuid4
 
 from llmsmith.task.textgen.errors import PromptBlockedException, TextGenFailedException
@@ -7,7 +8,11 @@ from llmsmith.task.textgen.errors import PromptBlockedException, TextGenFailedEx
 try:
     from google.ai.generativelanguage_v1beta.types.content import FunctionCall
     from google.generativeai import GenerativeModel
-    from google.generativeai.types import GenerateContentResponse
+    from google.generativeai.types import (
+        AsyncGenerateContentResponse,
+        BlockedPromptException,
+        GenerateContentResponse,
+    )
     from google.generativeai.types.content_types import (
         ContentsType,
         FunctionLibraryType,
@@ -17,12 +22,14 @@ except ImportError:
         "The 'google.generativeai' library is required to use Gemini LLMs. You can install it with `pip install \"llmsmith[gemini]\"`"
     )
 
-from llmsmith.task.base import Task
+from llmsmith.task.base import Task, _execute_concurrently
 from llmsmith.task.models import ChatResponse, TaskInput, TaskOutput
 from llmsmith.task.models import FunctionCall as LLMFunctionCall
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.options.gemini import (
     GeminiTextGenOptions,
     _completion_create_options_dict,
+    get_temperature,
 )
 
 
@@ -50,6 +57,11 @@ class BaseGeminiChat:
         self.llm: GenerativeModel = llm
         self.llm_options: GeminiTextGenOptions = llm_options or default_options
 
+        # Options are same for every request, hence computed only once
+        self._chat_completion_options: dict = _completion_create_options_dict(
+            self.llm_options
+        )
+
     async def chat(
         self,
         messages_payload: ContentsType,
@@ -67,29 +79,23 @@ class BaseGeminiChat:
         :returns: chat response from the LLM.
         :rtype: :class:`llmsmith.task.models.ChatResponse`
         """
-        chat_completion_options: dict = _completion_create_options_dict(
-            self.llm_options
-        )
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
 
-        log.debug(
-            f"Google Gemini chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
-        )
+        chat_completion_options: dict = self._chat_completion_options
+
+        if debug_enabled:
+            log.debug(
+                f"Google Gemini chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
 
         llm_reply: GenerateContentResponse = await self.llm.generate_content_async(
             contents=messages_payload, tools=tools, **chat_completion_options
         )
 
-        log.debug(f"Google Gemini chat response: {llm_reply}")
+        if debug_enabled:
+            log.debug(f"Google Gemini chat response: {llm_reply}")
 
-        if (
-            llm_reply.prompt_feedback.block_reason
-            and llm_reply.prompt_feedback.block_reason
-            != llm_reply.prompt_feedback.BlockReason.BLOCK_REASON_UNSPECIFIED
-        ):
-            raise PromptBlockedException(
-                "Prompt blocked by the AI",
-                block_reason=BaseGeminiChat._block_reason_str(llm_reply),
-            )
+        BaseGeminiChat._raise_if_blocked(llm_reply)
 
         output_candidate = next(
             (c for c in llm_reply.candidates if c.finish_reason == c.FinishReason.STOP),
@@ -100,14 +106,15 @@ class BaseGeminiChat:
                 "Failed to generate text", failure_reason="NO_NATURAL_STOP_POINT"
             )
 
-        function_call: FunctionCall = next(
-            (
-                p.function_call
-                for p in output_candidate.content.parts
-                if p.function_call
-            ),
-            None,
-        )
+        # Function call (if any) takes precedence over the text, hence the parts are scanned only until a function call is found
+        function_call: Union[FunctionCall, None] = None
+        output_content: Union[str, None] = None
+        for part in output_candidate.content.parts:
+            if part.function_call:
+                function_call = part.function_call
+                break
+            if output_content is None and part.text:
+                output_content = part.text
 
         if function_call:
             tool_id = str(uuid4())
@@ -125,18 +132,67 @@ class BaseGeminiChat:
                 },
             )
 
-        output_content: str = next(
-            (p.text for p in output_candidate.content.parts if p.text), None
-        )
         if not output_content:
             raise TextGenFailedException(
                 "Failed to generate text", failure_reason="NO_TEXT_DATA"
             )
 
-        log.debug(f"chat response output value: {output_content}")
+        if debug_enabled:
+            log.debug(f"chat response output value: {output_content}")
 
         return ChatResponse(text=output_content, raw_output=llm_reply)
 
+    async def stream(self, messages_payload: ContentsType) -> AsyncIterator[str]:
+        """
+        Chat with Gemini LLM using the given input messages, and yields the generated text
+        in chunks as soon as they are received from the LLM.
+
+        :param messages_payload: The input messages for chat.
+        :type messages_payload: :class:`google.generativeai.types.content_types.ContentsType`
+        :raises PromptBlockedError: If the prompt is blocked by the AI.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        chat_completion_options: dict = self._chat_completion_options
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Google Gemini chat stream request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
+
+        llm_stream: AsyncGenerateContentResponse = (
+            await self.llm.generate_content_async(
+                contents=messages_payload, stream=True, **chat_completion_options
+            )
+        )
+
+        try:
+            async for chunk in llm_stream:
+                BaseGeminiChat._raise_if_blocked(chunk)
+
+                for candidate in chunk.candidates[:1]:
+                    for part in candidate.content.parts:
+                        if part.text:
+                            yield part.text
+        except BlockedPromptException as e:
+            # Gemini client raises its own exception when the first chunk itself is blocked
+            raise PromptBlockedException(
+                "Prompt blocked by the AI",
+                block_reason=BaseGeminiChat._block_reason_str(e.args[0]),
+            ) from e
+
+    @classmethod
+    def _raise_if_blocked(cls, llm_reply: GenerateContentResponse):
+        if (
+            llm_reply.prompt_feedback.block_reason
+            and llm_reply.prompt_feedback.block_reason
+            != llm_reply.prompt_feedback.BlockReason.BLOCK_REASON_UNSPECIFIED
+        ):
+            raise PromptBlockedException(
+                "Prompt blocked by the AI",
+                block_reason=cls._block_reason_str(llm_reply),
+            )
+
     @classmethod
     def _block_reason_str(cls, llm_reply: GenerateContentResponse) -> str:
         if (
@@ -158,6 +214,8 @@ class GeminiTextGenTask(Task[str, str]):
     :type llm: :class:`google.generativeai.GenerativeModel`
     :param llm_options: A dictionary of options to pass to the Gemini LLM.
     :type llm_options: :class:`llmsmith.task.textgen.options.gemini.GeminiTextGenOptions`, optional
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty.
     """
 
@@ -166,9 +224,20 @@ class GeminiTextGenTask(Task[str, str]):
         name: str,
         llm: GenerativeModel,
         llm_options: GeminiTextGenOptions = default_options,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         Task.__init__(self, name)
         self._chat = BaseGeminiChat(llm, llm_options)
+        self._chat_func = self._chat.chat
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if response_cache is not None and get_temperature(self._chat.llm_options) == 0:
+            self._chat_func = functools.partial(
+                response_cache.cached_chat,
+                self._chat.chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -189,8 +258,52 @@ class GeminiTextGenTask(Task[str, str]):
         llm_input_content: str = task_input.content
         messages_payload: List[dict] = [{"role": "user", "parts": [llm_input_content]}]
 
-        chat_response = await self._chat.chat(messages_payload)
+        chat_response = await self._chat_func(messages_payload=messages_payload)
 
         return TaskOutput(
             content=chat_response.text, raw_output=chat_response.raw_output
         )
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]], max_concurrency: int = 16
+    ) -> List[TaskOutput[str]]:
+        """
+        Generates text using Gemini LLM for multiple inputs concurrently, so that independent prompts
+        (like the ones in a map-reduce summarization) do not wait for each other.
+
+        :param task_inputs: The inputs to the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :param max_concurrency: Maximum number of concurrent requests to the LLM. Defaults to 16.
+        :type max_concurrency: int, optional
+        :raises ValueError: If the content of any task input is not a string, or if `max_concurrency` is less than 1.
+        :returns: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        return await _execute_concurrently(self, task_inputs, max_concurrency)
+
+    async def stream(self, task_input: TaskInput[str]) -> AsyncIterator[str]:
+        """
+        Generates text using Gemini LLM using the given input, and yields the
+        generated text in chunks as soon as they are received from the LLM.
+        Unlike :meth:`execute`, the whole completion is not buffered before returning.
+
+        .. code-block:: python
+
+            async for text in text_gen_task.stream(TaskInput("query")):
+                print(text, end="")
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :raises ValueError: If the content of the task input is not a string.
+        :raises PromptBlockedError: If the prompt is blocked by the AI.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        if not isinstance(task_input.content, str):
+            log.debug(f"task_input value: {task_input}")
+            raise ValueError("task_input.content should be of type 'str'")
+
+        messages_payload: List[dict] = [{"role": "user", "parts": [task_input.content]}]
+
+        async for text in self._chat.stream(messages_payload):
+            yield text
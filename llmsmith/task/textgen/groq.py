@@ -1,11 +1,12 @@
-import json
+import functools
 import logging
-from typing import List, Union
+from typing import AsyncIterator, List, Union
 
 from llmsmith.task.textgen.errors import TextGenFailedException
 
 try:
     import groq
+    from groq.lib.chat_completion_chunk import ChatCompletionChunk
     from groq.types.chat.chat_completion import ChatCompletion
     from groq.types.chat.completion_create_params import (
         Message,
@@ -16,12 +17,14 @@ except ImportError:
         "The 'groq' library is required to use LLMs in Groq. You can install it with `pip install \"llmsmith[groq]\"`"
     )
 
-from llmsmith.task.base import Task
+from llmsmith.task.base import Task, _execute_concurrently
 from llmsmith.task.models import ChatResponse, FunctionCall, TaskInput, TaskOutput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.options.groq import (
     GroqTextGenOptions,
     _completion_create_options_dict,
 )
+from llmsmith.utils import json_loads
 
 
 log = logging.getLogger(__name__)
@@ -50,6 +53,15 @@ class BaseGroqChat:
         self.llm: groq.AsyncGroq = llm
         self.llm_options: GroqTextGenOptions = llm_options or default_options
 
+        # Options are same for every request, hence computed only once
+        self._chat_completion_options: dict = _completion_create_options_dict(
+            self.llm_options
+        )
+        sys_prompt = (self.llm_options.get("system_prompt") or "").strip()
+        self._sys_prompt_message: Union[Message, None] = (
+            {"role": "system", "content": sys_prompt} if sys_prompt else None
+        )
+
     async def chat(
         self,
         messages_payload: List[Message],
@@ -58,7 +70,7 @@ class BaseGroqChat:
         """
         Generates text using Groq LLM using the given input.
 
-        :param messages_payload: The input messages for the chat.
+        :param messages_payload: The input messages for the chat. System message (if any) should be the first message.
         :type messages_payload: List[:class:`groq.types.chat.completion_create_params.Message`]
         :param tools: Tools (functions) which can be used by the LLM.
         :type tools: List[:class:`groq.types.chat.completion_create_params.Tool`], optional
@@ -66,33 +78,33 @@ class BaseGroqChat:
         :returns: chat response from the LLM.
         :rtype: :class:`llmsmith.task.models.ChatResponse`
         """
-        sys_prompt = (self.llm_options.get("system_prompt") or "").strip()
-        sys_prompt_in_payload = next(
-            (msg for msg in messages_payload if msg.get("role") == "system"), None
-        )
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
 
-        # Add system prompt if provided in llm options and not available in the messages payload
-        if sys_prompt and not sys_prompt_in_payload:
-            messages_payload.append({"role": "system", "content": sys_prompt})
+        self._add_system_prompt(messages_payload)
 
-        chat_completion_options: dict = _completion_create_options_dict(
-            self.llm_options
-        )
+        chat_completion_options: dict = self._chat_completion_options
 
-        log.debug(
-            f"Groq chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
-        )
+        if debug_enabled:
+            log.debug(
+                f"Groq chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
 
         llm_reply: ChatCompletion = await self.llm.chat.completions.create(
             messages=messages_payload, tools=tools, **chat_completion_options
         )
 
-        log.debug(f"Groq chat response: {llm_reply}")
+        if debug_enabled:
+            log.debug(f"Groq chat response: {llm_reply}")
 
-        output_choice_with_func_call = next(
-            (c for c in llm_reply.choices if c.finish_reason == "tool_calls"),
-            None,
-        )
+        # Choice with function calls (if any) takes precedence over the one with natural stop point
+        output_choice_with_func_call = None
+        output_choice = None
+        for choice in llm_reply.choices:
+            if choice.finish_reason == "tool_calls":
+                output_choice_with_func_call = choice
+                break
+            if output_choice is None and choice.finish_reason == "stop":
+                output_choice = choice
 
         if output_choice_with_func_call:
             return ChatResponse(
@@ -103,7 +115,7 @@ class BaseGroqChat:
                         id=tool.id,
                         name=tool.function.name,
                         args=(
-                            json.loads(tool.function.arguments)
+                            json_loads(tool.function.arguments)
                             if tool.function.arguments
                             else {}
                         ),
@@ -112,11 +124,6 @@ class BaseGroqChat:
                 },
             )
 
-        output_choice = next(
-            (c for c in llm_reply.choices if c.finish_reason == "stop"),
-            None,
-        )
-
         if not output_choice:
             raise TextGenFailedException(
                 "Failed to generate text", failure_reason="NO_NATURAL_STOP_POINT"
@@ -124,10 +131,57 @@ class BaseGroqChat:
 
         output_content: str = output_choice.message.content
 
-        log.debug(f"chat response output value: {output_content}")
+        if debug_enabled:
+            log.debug(f"chat response output value: {output_content}")
 
         return ChatResponse(text=output_content, raw_output=llm_reply)
 
+    async def stream(self, messages_payload: List[Message]) -> AsyncIterator[str]:
+        """
+        Generates text using Groq LLM using the given input, and yields the generated text
+        in chunks as soon as they are received from the LLM.
+
+        :param messages_payload: The input messages for the chat. System message (if any) should be the first message.
+        :type messages_payload: List[:class:`groq.types.chat.completion_create_params.Message`]
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        self._add_system_prompt(messages_payload)
+
+        chat_completion_options: dict = self._chat_completion_options
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Groq chat stream request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
+
+        llm_stream: groq.AsyncStream[
+            ChatCompletionChunk
+        ] = await self.llm.chat.completions.create(
+            messages=messages_payload, stream=True, **chat_completion_options
+        )
+
+        async for chunk in llm_stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def warmup(self):
+        """
+        Opens a connection to Groq API ahead of the first chat request (like during the app startup),
+        so that the first chat request doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        A cheap model listing request is used for this.
+        """
+        await self.llm.models.list()
+
+    def _add_system_prompt(self, messages_payload: List[Message]):
+        # Add system prompt (as the first message) if provided in llm options and not available in the messages payload.
+        # System message in the payload is expected to be the first message, hence only the first message is checked.
+        sys_prompt_message = self._sys_prompt_message
+        if sys_prompt_message and (
+            not messages_payload or messages_payload[0].get("role") != "system"
+        ):
+            messages_payload.insert(0, sys_prompt_message)
+
 
 class GroqTextGenTask(Task[str, str]):
     """
@@ -139,6 +193,8 @@ class GroqTextGenTask(Task[str, str]):
     :type llm: :class:`groq.AsyncGroq`
     :param llm_options: A dictionary of options to pass to the LLM in Groq Cloud.
     :type llm_options: :class:`llmsmith.task.textgen.options.groq.GroqTextGenOptions`, optional
+    :param response_cache: Cache for the LLM responses. Responses are cached only if the temperature is set to 0. Responses are not cached if not provided.
+    :type response_cache: :class:`llmsmith.task.textgen.cache.ChatResponseCache`, optional
     :raises ValueError: If the name is empty.
     """
 
@@ -147,9 +203,23 @@ class GroqTextGenTask(Task[str, str]):
         name: str,
         llm: groq.AsyncGroq,
         llm_options: GroqTextGenOptions = default_options,
+        response_cache: Union[ChatResponseCache, None] = None,
     ) -> None:
         super().__init__(name)
         self._chat = BaseGroqChat(llm, llm_options)
+        self._chat_func = self._chat.chat
+
+        # Responses are cached only for deterministic requests (temperature set to 0)
+        if (
+            response_cache is not None
+            and self._chat.llm_options.get("temperature") == 0
+        ):
+            self._chat_func = functools.partial(
+                response_cache.cached_chat,
+                self._chat.chat,
+                self._chat.llm_options,
+                client=self._chat.llm,
+            )
 
     async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
         """
@@ -168,8 +238,66 @@ class GroqTextGenTask(Task[str, str]):
         llm_input_content: str = task_input.content
         messages_payload: List[dict] = [{"role": "user", "content": llm_input_content}]
 
-        chat_response = await self._chat.chat(messages_payload)
+        chat_response = await self._chat_func(messages_payload=messages_payload)
 
         return TaskOutput(
             content=chat_response.text, raw_output=chat_response.raw_output
         )
+
+    async def stream(self, task_input: TaskInput[str]) -> AsyncIterator[str]:
+        """
+        Generates text using Groq LLM using the given input, and yields the
+        generated text in chunks as soon as they are received from the LLM.
+        Unlike :meth:`execute`, the whole completion is not buffered before returning.
+
+        .. code-block:: python
+
+            async for text in text_gen_task.stream(TaskInput("query")):
+                print(text, end="")
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :raises ValueError: If the content of the task input is not a string.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        if not isinstance(task_input.content, str):
+            log.debug(f"task_input value: {task_input}")
+            raise ValueError("task_input.content should be of type 'str'")
+
+        messages_payload: List[dict] = [{"role": "user", "content": task_input.content}]
+
+        async for text in self._chat.stream(messages_payload):
+            yield text
+
+    async def warmup(self):
+        """
+        Opens a connection to Groq API ahead of the first execution (like during the app startup),
+        so that the first execution doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        The client (and hence its connection pool) should be shared across the tasks, instead of creating one per request.
+
+        .. code-block:: python
+
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                await text_gen_task.warmup()
+                yield
+        """
+        await self._chat.warmup()
+
+    async def execute_many(
+        self, task_inputs: List[TaskInput[str]], max_concurrency: int = 16
+    ) -> List[TaskOutput[str]]:
+        """
+        Generates text using Groq LLM for multiple inputs concurrently, so that independent prompts
+        (like the ones in a map-reduce summarization) do not wait for each other.
+
+        :param task_inputs: The inputs to the task.
+        :type task_inputs: List[:class:`llmsmith.task.models.TaskInput[str]`]
+        :param max_concurrency: Maximum number of concurrent requests to the LLM. Defaults to 16.
+        :type max_concurrency: int, optional
+        :raises ValueError: If the content of any task input is not a string, or if `max_concurrency` is less than 1.
+        :returns: The outputs of the task, in the same order as the inputs.
+        :rtype: List[:class:`llmsmith.task.models.TaskOutput[str]`]
+        """
+        return await _execute_concurrently(self, task_inputs, max_concurrency)
@@ -1,12 +1,12 @@
-import json
 import logging
-from typing import List, Union
+from typing import AsyncIterator, List, Union
 
 from llmsmith.task.textgen.errors import TextGenFailedException
 
 try:
     import openai
     from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
     from openai.types.chat.chat_completion_message_param import (
         ChatCompletionMessageParam,
     )
@@ -22,6 +22,7 @@ from llmsmith.task.textgen.options.openai import (
     OpenAITextGenOptions,
     _completion_create_options_dict,
 )
+from llmsmith.utils import json_loads
 
 
 log = logging.getLogger(__name__)
@@ -50,6 +51,15 @@ class BaseOpenAIChat:
         self.llm: openai.AsyncOpenAI = llm
         self.llm_options: OpenAITextGenOptions = llm_options or default_options
 
+        # Options are same for every request, hence computed only once
+        self._chat_completion_options: dict = _completion_create_options_dict(
+            self.llm_options
+        )
+        sys_prompt = (self.llm_options.get("system_prompt") or "").strip()
+        self._sys_prompt_message: Union[ChatCompletionMessageParam, None] = (
+            {"role": "system", "content": sys_prompt} if sys_prompt else None
+        )
+
     async def chat(
         self,
         messages_payload: List[ChatCompletionMessageParam],
@@ -58,7 +68,7 @@ class BaseOpenAIChat:
         """
         Generates text using OpenAI LLM using the given input.
 
-        :param messages_payload: The input messages for the chat.
+        :param messages_payload: The input messages for the chat. System message (if any) should be the first message.
         :type messages_payload: List[:class:`openai.types.chat.chat_completion_message_param.ChatCompletionMessageParam`]
         :param tools: Tools (functions) which can be used by the LLM.
         :type tools: List[:class:`openai.types.chat.chat_completion_tool_param.ChatCompletionToolParam`], optional
@@ -66,43 +76,44 @@ class BaseOpenAIChat:
         :returns: chat response from the LLM.
         :rtype: :class:`llmsmith.task.models.ChatResponse`
         """
-        sys_prompt = (self.llm_options.get("system_prompt") or "").strip()
-        sys_prompt_in_payload = next(
-            (msg for msg in messages_payload if msg.get("role") == "system"), None
-        )
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
 
-        # Add system prompt if provided in llm options and not available in the messages payload
-        if sys_prompt and not sys_prompt_in_payload:
-            messages_payload.append({"role": "system", "content": sys_prompt})
+        self._add_system_prompt(messages_payload)
 
-        chat_completion_options: dict = _completion_create_options_dict(
-            self.llm_options
-        )
+        chat_completion_options: dict = self._chat_completion_options
 
-        log.debug(
-            f"OpenAI chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
-        )
+        if debug_enabled:
+            log.debug(
+                f"OpenAI chat request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
 
         llm_reply: ChatCompletion = await self.llm.chat.completions.create(
             messages=messages_payload, tools=tools, **chat_completion_options
         )
 
-        log.debug(f"OpenAI chat response: {llm_reply}")
+        if debug_enabled:
+            log.debug(f"OpenAI chat response: {llm_reply}")
 
-        output_choice_with_func_call = next(
-            (c for c in llm_reply.choices if c.finish_reason == "tool_calls"),
-            None,
-        )
+        # Choice with function calls (if any) takes precedence over the one with natural stop point
+        output_choice_with_func_call = None
+        output_choice = None
+        for choice in llm_reply.choices:
+            if choice.finish_reason == "tool_calls":
+                output_choice_with_func_call = choice
+                break
+            if output_choice is None and choice.finish_reason == "stop":
+                output_choice = choice
 
         if output_choice_with_func_call:
             return ChatResponse(
                 text=output_choice_with_func_call.message.content,
                 raw_output=llm_reply,
                 function_calls={
-                    tool.function.name: FunctionCall(
+                    tool.id: FunctionCall(
                         id=tool.id,
+                        name=tool.function.name,
                         args=(
-                            json.loads(tool.function.arguments)
+                            json_loads(tool.function.arguments)
                             if tool.function.arguments
                             else {}
                         ),
@@ -111,11 +122,6 @@ class BaseOpenAIChat:
                 },
             )
 
-        output_choice = next(
-            (c for c in llm_reply.choices if c.finish_reason == "stop"),
-            None,
-        )
-
         if not output_choice:
             raise TextGenFailedException(
                 "Failed to generate text", failure_reason="NO_NATURAL_STOP_POINT"
@@ -123,10 +129,62 @@ class BaseOpenAIChat:
 
         output_content: str = output_choice.message.content
 
-        log.debug(f"chat response output value: {output_content}")
+        if debug_enabled:
+            log.debug(f"chat response output value: {output_content}")
 
         return ChatResponse(text=output_content, raw_output=llm_reply)
 
+    async def stream(
+        self, messages_payload: List[ChatCompletionMessageParam]
+    ) -> AsyncIterator[str]:
+        """
+        Generates text using OpenAI LLM using the given input, and yields the generated text
+        in chunks as soon as they are received from the LLM.
+
+        :param messages_payload: The input messages for the chat. System message (if any) should be the first message.
+        :type messages_payload: List[:class:`openai.types.chat.chat_completion_message_param.ChatCompletionMessageParam`]
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        self._add_system_prompt(messages_payload)
+
+        chat_completion_options: dict = self._chat_completion_options
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"OpenAI chat stream request: PAYLOAD: {messages_payload}\n OPTIONS: {chat_completion_options}"
+            )
+
+        llm_stream: openai.AsyncStream[
+            ChatCompletionChunk
+        ] = await self.llm.chat.completions.create(
+            messages=messages_payload, stream=True, **chat_completion_options
+        )
+
+        async for chunk in llm_stream:
+            # Last chunk may not have any choices (like the one with usage stats)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def warmup(self):
+        """
+        Opens a connection to OpenAI API ahead of the first chat request (like during the app startup),
+        so that the first chat request doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+        A cheap model listing request is used for this.
+        """
+        await self.llm.models.list()
+
+    def _add_system_prompt(self, messages_payload: List[ChatCompletionMessageParam]):
+        # Add system prompt (as the first message) if provided in llm options and not available in the messages payload.
+        # Keeping the system prompt at the start gives a stable prompt prefix across requests, which is reused
+        # by OpenAI's (automatic) prompt caching. System message in the payload is expected to be the first message,
+        # hence only the first message is checked.
+        sys_prompt_message = self._sys_prompt_message
+        if sys_prompt_message and (
+            not messages_payload or messages_payload[0].get("role") != "system"
+        ):
+            messages_payload.insert(0, sys_prompt_message)
+
 
 class OpenAITextGenTask(Task[str, str]):
     """
@@ -172,3 +230,43 @@ class OpenAITextGenTask(Task[str, str]):
         return TaskOutput(
             content=chat_response.text, raw_output=chat_response.raw_output
         )
+
+    async def warmup(self):
+        """
+        Opens a connection to OpenAI API ahead of the first execution (like during the app startup),
+        so that the first execution doesn't have to wait for the connection setup (DNS lookup, TLS handshake).
+
+        .. code-block:: python
+
+            @asynccontextmanager
+            async def lifespan(app: FastAPI):
+                await text_gen_task.warmup()
+                yield
+        """
+        await self._chat.warmup()
+
+    async def stream(self, task_input: TaskInput[str]) -> AsyncIterator[str]:
+        """
+        Generates text using OpenAI LLM using the given input, and yields the
+        generated text in chunks as soon as they are received from the LLM.
+        Unlike :meth:`execute`, the whole completion is not buffered before returning.
+
+        .. code-block:: python
+
+            async for text in text_gen_task.stream(TaskInput("query")):
+                print(text, end="")
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :raises ValueError: If the content of the task input is not a string.
+        :returns: Async iterator of the generated text chunks.
+        :rtype: AsyncIterator[str]
+        """
+        if not isinstance(task_input.content, str):
+            log.debug(f"task_input value: {task_input}")
+            raise ValueError("task_input.content should be of type 'str'")
+
+        messages_payload: List[dict] = [{"role": "user", "content": task_input.content}]
+
+        async for text in self._chat.stream(messages_payload):
+            yield text
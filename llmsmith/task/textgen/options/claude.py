@@ -32,11 +32,14 @@ class ClaudeTextGenOptions(TypedDict):
     timeout: Union[float, None]
 
 
+_COMPLETION_CREATE_OPT_KEYS = frozenset(ClaudeTextGenOptions.__annotations__)
+
+
 def _completion_create_options_dict(options: ClaudeTextGenOptions) -> dict:
     opt = {
-        attr: options.get(attr)
-        for attr in ClaudeTextGenOptions.__annotations__
-        if options.get(attr)
+        attr: value
+        for attr, value in options.items()
+        if value and attr in _COMPLETION_CREATE_OPT_KEYS
     }
     if not opt.get("model"):
         opt["model"] = "claude-3-opus-20240229"
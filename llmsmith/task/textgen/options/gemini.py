@@ -28,3 +28,20 @@ class GeminiTextGenOptions(TypedDict):
 
 def _completion_create_options_dict(options: GeminiTextGenOptions) -> dict:
     return {attr: options.get(attr) for attr in GeminiTextGenOptions.__annotations__}
+
+
+def get_temperature(options: GeminiTextGenOptions) -> Union[float, None]:
+    """
+    Returns the temperature set in the generation config of the Gemini LLM options.
+
+    :param options: Gemini LLM options.
+    :type options: :class:`llmsmith.task.textgen.options.gemini.GeminiTextGenOptions`
+    :returns: temperature. Returns `None` if the temperature is not set.
+    :rtype: float
+    """
+    # Generation config can be either a dict or a `GenerationConfig` object
+    gen_config = options.get("generation_config") or {}
+    if isinstance(gen_config, dict):
+        return gen_config.get("temperature")
+
+    return getattr(gen_config, "temperature", None)
@@ -0,0 +1,215 @@
+import logging
+import time
+from typing import Dict, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(
+        "The 'numpy' library is required to use semantic cache. You can install it with `pip install \"llmsmith[numpy]\"`"
+    )
+
+from llmsmith.task.base import Task
+from llmsmith.task.models import TaskInput, TaskOutput
+from llmsmith.task.retrieval.vector.base import EmbeddingFunc, _run_embedding_func
+
+
+log = logging.getLogger(__name__)
+
+
+class SemanticCacheTextGenTask(Task[str, str]):
+    """
+    Wrapper on top of a text generation task, which caches the task outputs against the embeddings of the task inputs.
+    When the input is semantically similar to a previously cached input (i.e. cosine similarity of their embeddings
+    is above the threshold), the cached output is returned without calling the LLM.
+    Identical inputs are served from the cache without computing the embeddings.
+
+    The cache should be used only for deterministic text generation tasks (like the ones with temperature set to 0),
+    where the same (or similar) input is expected to produce the same output.
+
+    .. code-block:: python
+
+        text_gen_task = OpenAITextGenTask(
+            name="openai-answer-generator",
+            llm=llm,
+            llm_options=OpenAITextGenOptions(model="gpt-3.5-turbo", temperature=0),
+        )
+
+        cached_text_gen_task = SemanticCacheTextGenTask(
+            name="cached-openai-answer-generator",
+            task=text_gen_task,
+            embedding_func=embedding_func,
+        )
+
+    :param name: The name of the task.
+    :type name: str
+    :param task: The text generation task to be cached.
+    :type task: :class:`llmsmith.task.base.Task`
+    :param embedding_func: Embedding function
+    :type embedding_func: :class:`llmsmith.task.retrieval.vector.base.EmbeddingFunc`
+    :param similarity_threshold: Minimum cosine similarity for a cached input to be considered as a match. Defaults to 0.87.
+    :type similarity_threshold: float, optional
+    :param maxsize: Maximum number of outputs to be cached. The least recently used output is evicted if the cache is full. Defaults to 1024.
+    :type maxsize: int, optional
+    :param ttl: Time (in seconds) after which a cached output expires. Cached outputs never expire if set to `None`. Defaults to 3600.
+    :type ttl: float, optional
+    :raises ValueError: If the name is empty, or if any of the other params fails validation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        task: Task[str, str],
+        embedding_func: EmbeddingFunc,
+        similarity_threshold: float = 0.87,
+        maxsize: int = 1024,
+        ttl: Union[float, None] = 3600,
+    ) -> None:
+        super().__init__(name)
+
+        if not task:
+            raise ValueError("Task ('task') is required")
+        if not embedding_func:
+            raise ValueError("Embedding function ('embedding_func') is required")
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("similarity_threshold should be in the range (0, 1]")
+        if maxsize <= 0:
+            raise ValueError("maxsize should be 1 or above")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl should be above 0")
+
+        self._task = task
+        self.embedding_func = embedding_func
+        self.similarity_threshold = similarity_threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        # Cache entries are stored in fixed slots, so that all the cached embeddings
+        # can be compared against the input embedding in a single matrix-vector product.
+        # The embeddings matrix is allocated once the embedding dimension is known. It is stored in float32,
+        # which halves the memory scanned per lookup (compared to float64) without affecting the similarity threshold checks.
+        # An exact scan over (at most) `maxsize` entries is fast enough, hence an ANN index is not used.
+        self._embeddings: Union[np.ndarray, None] = None
+        self._inputs: List[Union[str, None]] = [None] * maxsize
+        self._outputs: List[Union[TaskOutput[str], None]] = [None] * maxsize
+        self._expires_at = np.full(maxsize, -np.inf)
+        self._last_used = np.full(maxsize, -np.inf)
+        self._slots_by_input: Dict[str, int] = {}
+
+    async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
+        """
+        Returns the cached output for the input if available. Otherwise, executes the wrapped task and caches its output.
+
+        :param task_input: The input to the task.
+        :type task_input: :class:`llmsmith.task.models.TaskInput[str]`
+        :returns: The output of the task.
+        :rtype: :class:`llmsmith.task.models.TaskOutput[str]`
+        """
+        content = task_input.content
+        now = time.monotonic()
+
+        # Exact match
+        slot = self._slots_by_input.get(content)
+        if slot is not None and self._expires_at[slot] > now:
+            return self._hit(slot, now)
+
+        embedding = self._normalize(
+            (await _run_embedding_func(self.embedding_func, [content]))[0]
+        )
+
+        # Semantic match
+        slot = self._most_similar_slot(embedding, now)
+        if slot is not None:
+            return self._hit(slot, now)
+
+        self.misses += 1
+
+        task_output = await self._task.execute(task_input)
+        self._put(content, embedding, task_output, time.monotonic())
+
+        return task_output
+
+    def clear(self):
+        """
+        Removes all the cached outputs.
+        """
+        self._inputs = [None] * self.maxsize
+        self._outputs = [None] * self.maxsize
+        self._expires_at.fill(-np.inf)
+        self._last_used.fill(-np.inf)
+        self._slots_by_input.clear()
+
+    def _hit(self, slot: int, now: float) -> TaskOutput[str]:
+        self.hits += 1
+        self._last_used[slot] = now
+
+        return self._outputs[slot]
+
+    def _most_similar_slot(self, embedding: np.ndarray, now: float) -> Union[int, None]:
+        """
+        Returns the slot of the cached input which is most similar to the given input embedding,
+        if its similarity is above the threshold.
+        """
+        if self._embeddings is None or embedding.shape[0] != self._embeddings.shape[1]:
+            return None
+
+        # Embeddings are normalized, hence the dot product is the cosine similarity
+        similarities = self._embeddings @ embedding
+        similarities[self._expires_at <= now] = -np.inf
+
+        slot = int(np.argmax(similarities))
+        if similarities[slot] < self.similarity_threshold:
+            return None
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Semantic cache hit: input: {self._inputs[slot]} | similarity: {similarities[slot]}"
+            )
+
+        return slot
+
+    def _put(
+        self,
+        content: str,
+        embedding: np.ndarray,
+        task_output: TaskOutput[str],
+        now: float,
+    ):
+        if self._embeddings is None or embedding.shape[0] != self._embeddings.shape[1]:
+            # Embedding dimension has changed, hence the existing entries can't be compared anymore
+            self.clear()
+            self._embeddings = np.zeros(
+                (self.maxsize, embedding.shape[0]), dtype=np.float32
+            )
+
+        # Existing (expired) entry for the same input is replaced first,
+        # followed by other expired entries and then the least recently used ones.
+        slot = self._slots_by_input.get(content)
+        if slot is None:
+            expired_slots = np.flatnonzero(self._expires_at <= now)
+            slot = (
+                int(expired_slots[0])
+                if expired_slots.size
+                else int(np.argmin(self._last_used))
+            )
+
+        evicted_input = self._inputs[slot]
+        if evicted_input is not None:
+            self._slots_by_input.pop(evicted_input, None)
+
+        self._embeddings[slot] = embedding
+        self._inputs[slot] = content
+        self._outputs[slot] = task_output
+        self._expires_at[slot] = np.inf if self.ttl is None else now + self.ttl
+        self._last_used[slot] = now
+        self._slots_by_input[content] = slot
+
+    @classmethod
+    def _normalize(cls, embedding: List[Union[float, int]]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+
+        return vector / norm if norm else vector
@@ -0,0 +1,40 @@
+import json
+from typing import Any
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes an object to a JSON formatted string.
+    Uses `orjson` if it is installed, and falls back to the standard `json` module otherwise.
+
+    :param obj: object to be serialized.
+    :type obj: Any
+    :returns: JSON formatted string.
+    :rtype: str
+    """
+    if orjson:
+        return orjson.dumps(obj).decode()
+
+    return json.dumps(obj)
+
+
+def json_loads(s: str) -> Any:
+    """
+    Deserializes a JSON formatted string to a Python object.
+    Uses `orjson` if it is installed, and falls back to the standard `json` module otherwise.
+
+    :param s: JSON formatted string.
+    :type s: str
+    :returns: deserialized object.
+    :rtype: Any
+    """
+    if orjson:
+        return orjson.loads(s)
+
+    return json.loads(s)
@@ -127,6 +127,49 @@ class CohereFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
 
         assert output.content == "llm response"
 
+    async def test_execute_for_async_function_call_in_llm_response(self):
+        mock_client = mock.AsyncMock()
+        mock.patch(
+            "llmsmith.task.textgen.cohere.cohere.AsyncClient",
+            side_effect=mock_client,
+        )
+
+        res_generator = cohere_response_with_function_call()
+
+        def mock_res(**_):
+            a = next(res_generator)
+            return a
+
+        async def some_func():
+            return 1
+
+        mock_client.chat.side_effect = mock_res
+        text_gen_task = CohereFunctionAgent(
+            name="test",
+            llm=mock_client,
+            llm_options=None,
+            tools=[
+                CohereTool(
+                    declaration={
+                        "name": "some_func",
+                        "description": "Returns the result of some function.",
+                    },
+                    callable=some_func,
+                )
+            ],
+            max_turns=5,
+        )
+
+        output = await text_gen_task.execute(TaskInput("query"))
+
+        assert output.content == "llm response"
+        assert mock_client.chat.call_args.kwargs["tool_results"] == [
+            {
+                "call": ToolCall(name="some_func", parameters={}),
+                "outputs": [{"answer": 1}],
+            }
+        ]
+
 
 def cohere_response_with_function_call():
     """Generator for yielding dummy responses in loop"""
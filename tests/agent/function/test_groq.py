@@ -15,6 +15,8 @@ from llmsmith.agent.errors import MaxTurnsReachedException
 from llmsmith.agent.function.groq import GroqFunctionAgent
 from llmsmith.agent.tool.groq import GroqTool
 from llmsmith.task.models import TaskInput
+from llmsmith.task.textgen.cache import ChatResponseCache
+from llmsmith.task.textgen.options.groq import GroqTextGenOptions
 
 
 class GroqFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
@@ -82,6 +84,53 @@ class GroqFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
             timeout=None,
         )
 
+    async def test_execute_for_cached_response_with_zero_temperature(self):
+        mock_client = mock.AsyncMock()
+        mock.patch(
+            "llmsmith.task.textgen.groq.groq.AsyncGroq",
+            side_effect=mock_client,
+        )
+
+        mock_client.chat.completions.create.return_value = ChatCompletion(
+            id="1",
+            choices=[
+                Choice(
+                    index=1,
+                    finish_reason="stop",
+                    logprobs=ChoiceLogprobs(content=None),
+                    message=ChoiceMessage(content="llm response", role="assistant"),
+                )
+            ],
+            created=1,
+            model="llama3-70b-8192",
+            object="chat.completion",
+        )
+        agent_task = GroqFunctionAgent(
+            name="test",
+            llm=mock_client,
+            llm_options=GroqTextGenOptions(model="llama3-70b-8192", temperature=0),
+            max_turns=5,
+            response_cache=ChatResponseCache(),
+        )
+
+        output_1 = await agent_task.execute(TaskInput("cached query"))
+        output_2 = await agent_task.execute(TaskInput("cached query"))
+
+        assert output_1.content == "llm response"
+        assert output_2.content == "llm response"
+        assert mock_client.chat.completions.create.call_count == 1
+
+        # Responses are not cached without a response cache
+        uncached_agent_task = GroqFunctionAgent(
+            name="test",
+            llm=mock_client,
+            llm_options=GroqTextGenOptions(model="llama3-70b-8192", temperature=0),
+            max_turns=5,
+        )
+        await uncached_agent_task.execute(TaskInput("cached query"))
+
+        assert mock_client.chat.completions.create.call_count == 2
+
     async def test_execute_for_max_turns_reached(self):
         mock_client = mock.AsyncMock()
         mock.patch(
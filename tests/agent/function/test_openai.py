@@ -1,4 +1,5 @@
 import unittest
+from typing import List
 from unittest import mock
 
 from openai.types.beta import Assistant, Thread
@@ -14,7 +15,12 @@ from openai.types.beta.threads.run import (
     RequiredActionSubmitToolOutputs,
 )
 from openai.types.beta.threads.required_action_function_tool_call import Function
-from openai.pagination import AsyncCursorPage
+from openai.types.beta.assistant_stream_event import (
+    AssistantStreamEvent,
+    ThreadMessageCompleted,
+    ThreadRunCompleted,
+    ThreadRunRequiresAction,
+)
 import pytest
 
 from llmsmith.agent.errors import MaxTurnsReachedException
@@ -90,9 +96,13 @@ class OpenAIFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
 
         mock_client.beta.assistants.create.return_value = assistant
         mock_client.beta.threads.create.return_value = thread
-        mock_client.beta.threads.runs.create_and_poll.return_value = run
-        mock_client.beta.threads.messages.list.return_value = AsyncCursorPage(
-            data=[msg]
+        mock_client.beta.threads.runs.stream = mock.MagicMock(
+            return_value=MockRunStream(
+                [
+                    ThreadMessageCompleted(data=msg, event="thread.message.completed"),
+                    ThreadRunCompleted(data=run, event="thread.run.completed"),
+                ]
+            )
         )
 
         agent_task = await OpenAIFunctionAgent.create(
@@ -107,17 +117,12 @@ class OpenAIFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
             thread_id=thread.id, role="user", content="query"
         )
 
-        mock_client.beta.threads.runs.create_and_poll.assert_called_with(
+        mock_client.beta.threads.runs.stream.assert_called_with(
             thread_id=thread.id,
             assistant_id=assistant.id,
         )
 
-        mock_client.beta.threads.messages.list.assert_called_with(
-            thread_id=thread.id,
-            run_id=run.id,
-            order="desc",
-            limit=1,
-        )
+        assert not mock_client.beta.threads.messages.list.called
 
     async def test_execute_for_max_turns_reached(self):
         mock_client = mock.AsyncMock()
@@ -176,10 +181,13 @@ class OpenAIFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
 
         mock_client.beta.assistants.create.return_value = assistant
         mock_client.beta.threads.create.return_value = thread
-        mock_client.beta.threads.runs.create_and_poll.return_value = run
-
-        mock_client.beta.threads.runs.submit_tool_outputs_and_poll.side_effect = (
-            mock_res
+        mock_client.beta.threads.runs.stream = mock.MagicMock(
+            return_value=MockRunStream(
+                [ThreadRunRequiresAction(data=run, event="thread.run.requires_action")]
+            )
+        )
+        mock_client.beta.threads.runs.submit_tool_outputs_stream = mock.MagicMock(
+            side_effect=mock_res
         )
 
         agent_task = await OpenAIFunctionAgent.create(
@@ -247,29 +255,16 @@ class OpenAIFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
                 type="submit_tool_outputs",
             ),
         )
-        msg = Message(
-            id="msg-001",
-            assistant_id=assistant.id,
-            created_at=1,
-            content=[
-                TextContentBlock(text=Text(annotations=[], value="hello"), type="text")
-            ],
-            object="thread.message",
-            role="assistant",
-            run_id=run.id,
-            thread_id=thread.id,
-            status="completed",
-        )
 
         mock_client.beta.assistants.create.return_value = assistant
         mock_client.beta.threads.create.return_value = thread
-        mock_client.beta.threads.runs.create_and_poll.return_value = run
-        mock_client.beta.threads.messages.list.return_value = AsyncCursorPage(
-            data=[msg]
+        mock_client.beta.threads.runs.stream = mock.MagicMock(
+            return_value=MockRunStream(
+                [ThreadRunRequiresAction(data=run, event="thread.run.requires_action")]
+            )
         )
-
-        mock_client.beta.threads.runs.submit_tool_outputs_and_poll.side_effect = (
-            mock_res
+        mock_client.beta.threads.runs.submit_tool_outputs_stream = mock.MagicMock(
+            side_effect=mock_res
         )
 
         agent_task = await OpenAIFunctionAgent.create(
@@ -284,6 +279,35 @@ class OpenAIFunctionAgentTest(unittest.IsolatedAsyncioTestCase):
 
         assert output.content == "hello"
 
+        submit_call_kwargs = (
+            mock_client.beta.threads.runs.submit_tool_outputs_stream.call_args.kwargs
+        )
+        assert submit_call_kwargs["thread_id"] == thread.id
+        assert submit_call_kwargs["run_id"] == run.id
+        assert list(submit_call_kwargs["tool_outputs"]) == [
+            {"tool_call_id": "func-001", "output": "1"}
+        ]
+
+        # final message is picked from the run stream, hence no extra round-trips
+        assert not mock_client.beta.threads.messages.list.called
+
+
+class MockRunStream:
+    """Mock for the async stream manager returned by the OpenAI run streaming APIs"""
+
+    def __init__(self, events: List[AssistantStreamEvent]) -> None:
+        self.events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+
 
 def openai_run_response(assistant: Assistant, thread: Thread):
     """Generator for yielding dummy responses in loop"""
@@ -300,5 +324,26 @@ def openai_run_response(assistant: Assistant, thread: Thread):
         tools=[],
     )
 
-    for res in [run]:
+    msg = Message(
+        id="msg-001",
+        assistant_id=assistant.id,
+        created_at=1,
+        content=[
+            TextContentBlock(text=Text(annotations=[], value="hello"), type="text")
+        ],
+        object="thread.message",
+        role="assistant",
+        run_id=run.id,
+        thread_id=thread.id,
+        status="completed",
+    )
+
+    for res in [
+        MockRunStream(
+            [
+                ThreadMessageCompleted(data=msg, event="thread.message.completed"),
+                ThreadRunCompleted(data=run, event="thread.run.completed"),
+            ]
+        )
+    ]:
         yield res
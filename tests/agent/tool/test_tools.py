@@ -0,0 +1,49 @@
+import unittest
+
+import pytest
+
+from llmsmith.agent.tool.cohere import CohereTool
+from llmsmith.agent.tool.groq import GroqTool
+from llmsmith.agent.tool.openai import OpenAIAssistantTool
+
+
+def some_func():
+    return 1
+
+
+class ToolTest(unittest.TestCase):
+    def test_tool_with_missing_callable(self):
+        with pytest.raises(ValueError):
+            GroqTool(
+                declaration={"type": "function", "function": {"name": "some_func"}},
+                callable=None,
+            )
+
+    def test_tool_with_dict_declaration(self):
+        tool = CohereTool(
+            declaration={"name": "some_func", "description": "Returns 1."},
+            callable=some_func,
+        )
+
+        assert tool.declaration.name == "some_func"
+        assert tool.callable is some_func
+
+    def test_tool_does_not_allow_extra_attributes(self):
+        tool = GroqTool(
+            declaration={"type": "function", "function": {"name": "some_func"}},
+            callable=some_func,
+        )
+
+        with pytest.raises(AttributeError):
+            tool.extra = 1
+
+    def test_assistant_tool_without_callable(self):
+        tool = OpenAIAssistantTool(declaration={"type": "retrieval"}, callable=None)
+
+        assert tool.callable is None
+
+        with pytest.raises(ValueError):
+            OpenAIAssistantTool(
+                declaration={"type": "function", "function": {"name": "some_func"}},
+                callable=None,
+            )
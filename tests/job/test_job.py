@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+
+import pytest
+
+from llmsmith.job.job import ConcurrentJob, SequentialJob
+from llmsmith.task.base import Task
+from llmsmith.task.models import TaskInput, TaskOutput
+
+
+class EchoTask(Task[str, str]):
+    """Task which returns its input in upper case"""
+
+    async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
+        return TaskOutput(content=task_input.content.upper(), raw_output=None)
+
+
+class FailingTask(Task[str, str]):
+    """Task which always fails"""
+
+    async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
+        raise RuntimeError("task failed")
+
+
+class SlowTask(Task[str, str]):
+    """Task which never completes on its own"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.cancelled = False
+
+    async def execute(self, task_input: TaskInput[str]) -> TaskOutput[str]:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class SequentialJobTest(unittest.IsolatedAsyncioTestCase):
+    async def test_run_with_placeholders(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("first"))
+        job.add_task(
+            EchoTask("second"),
+            input_template="in: {{first.input}} | out: {{first.output}} | root: {{root}}",
+        )
+
+        await job.run("hello")
+
+        assert (
+            job.task_input("second").content == "in: hello | out: HELLO | root: hello"
+        )
+        assert (
+            job.task_output("second").content == "IN: HELLO | OUT: HELLO | ROOT: HELLO"
+        )
+
+    async def test_run_with_unknown_placeholders(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("first"), input_template="{{root}} {{unknown.output}}")
+
+        await job.run("hello")
+
+        assert job.task_input("first").content == "hello {{unknown.output}}"
+
+    async def test_run_does_not_substitute_placeholders_in_values(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("first"))
+        job.add_task(EchoTask("second"), input_template="{{root}} {{first.input}}")
+
+        await job.run("{{first.input}}")
+
+        assert job.task_input("second").content == "{{first.input}} {{first.input}}"
+
+    async def test_run_with_dotted_task_names(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("step.one"))
+        job.add_task(EchoTask("step.two"), input_template="{{step.one.output}}")
+
+        await job.run("hello")
+
+        assert job.task_input("step.two").content == "HELLO"
+
+    async def test_run_multiple_times(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("first"), input_template=None)
+        job.add_task(EchoTask("second"), input_template="{{first.output}}!")
+
+        await job.run("hello")
+        await job.run("bye")
+
+        assert job.task_input("first").content == "bye"
+        assert job.task_output("second").content == "BYE!"
+
+    def test_add_task_with_duplicate_name(self):
+        job = SequentialJob()
+        job.add_task(EchoTask("first"))
+
+        with pytest.raises(ValueError):
+            job.add_task(EchoTask("first"))
+
+        assert len(job._tasks) == 1
+
+    def test_add_task_with_invalid_type(self):
+        job = SequentialJob()
+
+        with pytest.raises(TypeError):
+            job.add_task("first")
+
+        assert not job._tasks
+
+
+class ConcurrentJobTest(unittest.IsolatedAsyncioTestCase):
+    async def test_run(self):
+        job = ConcurrentJob()
+        job.add_task(EchoTask("first"))
+        job.add_task(EchoTask("second"))
+
+        await job.run("hello")
+
+        assert job.task_output("first").content == "HELLO"
+        assert job.task_output("second").content == "HELLO"
+        assert job.task_output("third") is None
+
+    async def test_run_cancels_remaining_tasks_on_failure(self):
+        slow_task = SlowTask("slow")
+        job = ConcurrentJob()
+        job.add_task(slow_task)
+        job.add_task(FailingTask("failing"))
+
+        with pytest.raises(RuntimeError):
+            await job.run("hello")
+
+        assert slow_task.cancelled
+        assert job.task_output("slow") is None
@@ -1,3 +1,5 @@
+import asyncio
+import gc
 import unittest
 from unittest import mock
 
@@ -6,6 +8,8 @@ from cohere.types.rerank_response_results_item import (
     RerankResponseResultsItem,
 )
 
+import pytest
+
 from llmsmith.reranker.cohere import CohereReranker
 from llmsmith.reranker.options.cohere import CohereRerankerOptions
 
@@ -76,3 +80,130 @@ class CohereRerankerTest(unittest.IsolatedAsyncioTestCase):
         )
 
         assert output == ["doc2", "doc1"]
+
+    async def test_rerank_for_concurrent_identical_requests(self):
+        mock_client = mock.AsyncMock()
+
+        async def mock_rerank(**_):
+            await asyncio.sleep(0.01)
+            return RerankResponse(
+                id="1",
+                results=[
+                    RerankResponseResultsItem(index=1, relevance_score=1),
+                    RerankResponseResultsItem(index=0, relevance_score=0.9),
+                ],
+            )
+
+        mock_client.rerank.side_effect = mock_rerank
+        reranker = CohereReranker(mock_client)
+
+        outputs = await asyncio.gather(
+            reranker.rerank("query", ["doc1", "doc2"]),
+            reranker.rerank("query", ["doc1", "doc2"]),
+        )
+
+        assert outputs == [["doc2", "doc1"], ["doc2", "doc1"]]
+        assert outputs[0] is not outputs[1]
+        mock_client.rerank.assert_called_once()
+
+        # completed requests are not reused
+        await reranker.rerank("query", ["doc1", "doc2"])
+        assert mock_client.rerank.call_count == 2
+
+    async def test_rerank_for_abandoned_failed_request(self):
+        mock_client = mock.AsyncMock()
+        rerank_started = asyncio.Event()
+        fail_rerank = asyncio.Event()
+
+        async def mock_rerank(**_):
+            rerank_started.set()
+            await fail_rerank.wait()
+            raise RuntimeError("rerank failed")
+
+        mock_client.rerank.side_effect = mock_rerank
+        reranker = CohereReranker(mock_client)
+        loop = asyncio.get_running_loop()
+        exception_handler = mock.Mock()
+        loop.set_exception_handler(exception_handler)
+
+        caller = asyncio.ensure_future(reranker.rerank("query", ["doc1", "doc2"]))
+        await rerank_started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        fail_rerank.set()
+        # let the abandoned request fail
+        for _ in range(3):
+            await asyncio.sleep(0)
+        gc.collect()
+
+        assert reranker._in_flight == {}
+        assert not exception_handler.called
+
+    async def test_rerank_with_max_concurrency(self):
+        mock_client = mock.AsyncMock()
+        concurrent_requests = 0
+        max_concurrent_requests = 0
+
+        async def mock_rerank(**_):
+            nonlocal concurrent_requests, max_concurrent_requests
+            concurrent_requests += 1
+            max_concurrent_requests = max(max_concurrent_requests, concurrent_requests)
+            await asyncio.sleep(0.01)
+            concurrent_requests -= 1
+            return RerankResponse(
+                id="1",
+                results=[RerankResponseResultsItem(index=0, relevance_score=1)],
+            )
+
+        mock_client.rerank.side_effect = mock_rerank
+        reranker = CohereReranker(mock_client, max_concurrency=2)
+
+        await asyncio.gather(
+            *[reranker.rerank(f"query-{i}", ["doc1"]) for i in range(5)]
+        )
+
+        assert mock_client.rerank.call_count == 5
+        assert max_concurrent_requests == 2
+
+    def test_init_with_invalid_max_concurrency(self):
+        with pytest.raises(ValueError):
+            CohereReranker(mock.AsyncMock(), max_concurrency=0)
+
+    async def test_warmup(self):
+        mock_client = mock.AsyncMock()
+        reranker = CohereReranker(mock_client)
+
+        await reranker.warmup()
+
+        mock_client.check_api_key.assert_called_once()
+        assert not mock_client.rerank.called
+
+    async def test_rerank_many(self):
+        mock_client = mock.AsyncMock()
+
+        async def mock_rerank(query, documents, **_):
+            return RerankResponse(
+                id=query,
+                results=[
+                    RerankResponseResultsItem(index=idx, relevance_score=1)
+                    for idx in reversed(range(len(documents)))
+                ],
+            )
+
+        mock_client.rerank.side_effect = mock_rerank
+        reranker = CohereReranker(mock_client, max_concurrency=1)
+
+        reranked = await reranker.rerank_many(
+            ["query1", "query2"], [["doc1", "doc2"], ["doc3", "doc4", "doc5"]]
+        )
+
+        assert reranked == [["doc2", "doc1"], ["doc5", "doc4", "doc3"]]
+        assert mock_client.rerank.call_count == 2
+
+    async def test_rerank_many_with_mismatched_inputs(self):
+        reranker = CohereReranker(mock.AsyncMock())
+
+        with pytest.raises(ValueError):
+            await reranker.rerank_many(["query1", "query2"], [["doc1"]])
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 import unittest
 from unittest import mock
@@ -5,7 +6,9 @@ from unittest import mock
 from chromadb import QueryResult
 
 from llmsmith.task.models import TaskInput
+from llmsmith.task.retrieval.vector.base import TaskInputWithEmbedding
 from llmsmith.task.retrieval.vector.chromadb import ChromaDBRetriever
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 
 
 class ChromaDBRetrieverTest(unittest.IsolatedAsyncioTestCase):
@@ -87,6 +90,67 @@ class ChromaDBRetrieverTest(unittest.IsolatedAsyncioTestCase):
         )
         assert output.content == "retrieved_doc2\n---\nretrieved_doc1"
 
+    @mock.patch("llmsmith.task.retrieval.vector.chromadb.Collection")
+    async def test_execute_with_embedding_batcher(self, mock_collection):
+        mock_collection.query.side_effect = lambda query_embeddings, **kwargs: (
+            QueryResult(documents=[[f"retrieved_doc{query_embeddings[0][0]}"]])
+        )
+        embedding_func = mock.Mock(return_value=[[1], [2]])
+        retriever = ChromaDBRetriever(
+            name="test",
+            collection=mock_collection,
+            embedding_func=embedding_func,
+            embedding_batcher=EmbeddingBatcher(embedding_func, max_batch_size=2),
+        )
+
+        outputs = await asyncio.gather(
+            retriever.execute(TaskInput("query1")),
+            retriever.execute(TaskInput("query2")),
+        )
+
+        embedding_func.assert_called_once_with(["query1", "query2"])
+        assert mock_collection.query.call_count == 2
+        assert [output.content for output in outputs] == [
+            "retrieved_doc1",
+            "retrieved_doc2",
+        ]
+
+    @mock.patch("llmsmith.task.retrieval.vector.chromadb.Collection")
+    async def test_execute_with_precomputed_embedding(self, mock_collection):
+        mock_collection.query.return_value = QueryResult(documents=[["retrieved_doc1"]])
+        embedding_func = mock.Mock()
+        retriever = ChromaDBRetriever(
+            name="test",
+            collection=mock_collection,
+            embedding_func=embedding_func,
+        )
+
+        output = await retriever.execute(
+            TaskInputWithEmbedding(content="query", embedding=[3])
+        )
+
+        assert not embedding_func.called
+        assert mock_collection.query.call_args.kwargs["query_embeddings"] == [[3]]
+        assert output.content == "retrieved_doc1"
+
+    @mock.patch("llmsmith.task.retrieval.vector.chromadb.Collection")
+    async def test_execute_with_async_embedding_func(self, mock_collection):
+        mock_collection.query.return_value = QueryResult(documents=[["retrieved_doc1"]])
+
+        async def embedding_func(texts):
+            return [[2] for _ in texts]
+
+        retriever = ChromaDBRetriever(
+            name="test",
+            collection=mock_collection,
+            embedding_func=embedding_func,
+        )
+
+        output = await retriever.execute(TaskInput("query"))
+
+        assert mock_collection.query.call_args.kwargs["query_embeddings"] == [[2]]
+        assert output.content == "retrieved_doc1"
+
     def _chroma_doc_proc_func(self, docs: List[str]) -> str:
         processed_docs = []
         for idx, doc in enumerate(docs):
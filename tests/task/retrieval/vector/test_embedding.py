@@ -0,0 +1,194 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from llmsmith.task.retrieval.vector.embedding import (
+    CachingEmbeddingFunc,
+    EmbeddingBatcher,
+)
+
+
+class EmbeddingBatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_embed_one_for_concurrent_texts(self):
+        embedding_func = mock.Mock(side_effect=lambda x: [[len(text)] for text in x])
+        embedding_batcher = EmbeddingBatcher(embedding_func, max_batch_size=2)
+
+        embeddings = await asyncio.gather(
+            embedding_batcher.embed_one("a"),
+            embedding_batcher.embed_one("bb"),
+            embedding_batcher.embed_one("ccc"),
+        )
+
+        assert embeddings == [[1], [2], [3]]
+        assert embedding_func.call_args_list == [
+            mock.call(["a", "bb"]),
+            mock.call(["ccc"]),
+        ]
+
+    async def test_embed_one_for_single_text(self):
+        embedding_func = mock.Mock(return_value=[[1]])
+        embedding_batcher = EmbeddingBatcher(embedding_func, max_wait_time=0)
+
+        embedding = await embedding_batcher.embed_one("a")
+
+        assert embedding == [1]
+        embedding_func.assert_called_once_with(["a"])
+
+    async def test_embed_one_for_failed_embedding(self):
+        embedding_func = mock.Mock(side_effect=RuntimeError("failed"))
+        embedding_batcher = EmbeddingBatcher(embedding_func)
+
+        results = await asyncio.gather(
+            embedding_batcher.embed_one("a"),
+            embedding_batcher.embed_one("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        embedding_func.assert_called_once_with(["a", "b"])
+
+    async def test_embed_one_propagates_embedding_func_error_to_waiters(self):
+        error = RuntimeError("failed")
+
+        async def embedding_func(texts):
+            raise error
+
+        embedding_batcher = EmbeddingBatcher(embedding_func, max_batch_size=2)
+
+        results = await asyncio.gather(
+            embedding_batcher.embed_one("a"),
+            embedding_batcher.embed_one("b"),
+            embedding_batcher.embed_one("c"),
+            return_exceptions=True,
+        )
+
+        assert results == [error, error, error]
+        await asyncio.sleep(0)
+        assert not embedding_batcher._tasks
+
+    async def test_embed_one_for_missing_embeddings(self):
+        embedding_batcher = EmbeddingBatcher(lambda x: [[1]])
+
+        results = await asyncio.gather(
+            embedding_batcher.embed_one("a"),
+            embedding_batcher.embed_one("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_init_with_invalid_params(self):
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(None)
+
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(lambda x: x, max_batch_size=0)
+
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(lambda x: x, max_wait_time=-1)
+
+
+class CachingEmbeddingFuncTest(unittest.TestCase):
+    def test_call_embeds_only_missing_texts(self):
+        embedding_func = mock.Mock(side_effect=lambda x: [[len(text)] for text in x])
+        caching_embedding_func = CachingEmbeddingFunc(embedding_func)
+
+        assert caching_embedding_func(["a", "bb"]) == [[1], [2]]
+        assert caching_embedding_func(["bb", "ccc", "ccc"]) == [[2], [3], [3]]
+
+        assert embedding_func.call_args_list == [
+            mock.call(["a", "bb"]),
+            mock.call(["ccc"]),
+        ]
+        assert caching_embedding_func.hits == 1
+        assert caching_embedding_func.misses == 3
+
+    def test_concurrent_calls_share_embedding(self):
+        def embed(texts):
+            time.sleep(0.05)
+            return [[len(text)] for text in texts]
+
+        embedding_func = mock.Mock(side_effect=embed)
+        caching_embedding_func = CachingEmbeddingFunc(embedding_func)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(caching_embedding_func, [["query"]] * 4, timeout=5)
+            )
+
+        assert results == [[[5]]] * 4
+        embedding_func.assert_called_once_with(["query"])
+        assert caching_embedding_func._in_flight == {}
+
+    def test_concurrent_calls_share_failed_embedding(self):
+        def embed(texts):
+            time.sleep(0.05)
+            raise RuntimeError("failed")
+
+        embedding_func = mock.Mock(side_effect=embed)
+        caching_embedding_func = CachingEmbeddingFunc(embedding_func)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(caching_embedding_func, ["query"]) for _ in range(2)
+            ]
+
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+        embedding_func.assert_called_once_with(["query"])
+        assert caching_embedding_func._in_flight == {}
+
+    def test_call_for_missing_embeddings(self):
+        caching_embedding_func = CachingEmbeddingFunc(lambda x: [[1]])
+
+        with pytest.raises(ValueError):
+            caching_embedding_func(["a", "b"])
+
+        assert len(caching_embedding_func._cache) == 0
+        assert caching_embedding_func._in_flight == {}
+
+    def test_call_evicts_least_recently_used(self):
+        embedding_func = mock.Mock(side_effect=lambda x: [[len(text)] for text in x])
+        caching_embedding_func = CachingEmbeddingFunc(embedding_func, maxsize=2)
+
+        caching_embedding_func(["a"])
+        caching_embedding_func(["bb"])
+        caching_embedding_func(["a"])
+        caching_embedding_func(["ccc"])
+        caching_embedding_func(["a", "bb"])
+
+        assert embedding_func.call_args_list == [
+            mock.call(["a"]),
+            mock.call(["bb"]),
+            mock.call(["ccc"]),
+            mock.call(["bb"]),
+        ]
+
+    def test_clear(self):
+        embedding_func = mock.Mock(return_value=[[1]])
+        caching_embedding_func = CachingEmbeddingFunc(embedding_func)
+
+        caching_embedding_func(["a"])
+        caching_embedding_func.clear()
+        caching_embedding_func(["a"])
+
+        assert embedding_func.call_count == 2
+
+    def test_init_with_invalid_params(self):
+        with pytest.raises(ValueError):
+            CachingEmbeddingFunc(None)
+
+        with pytest.raises(ValueError):
+            CachingEmbeddingFunc(lambda x: x, maxsize=0)
+
+    def test_init_with_coroutine_embedding_func(self):
+        async def embedding_func(texts):
+            return [[1] for _ in texts]
+
+        with pytest.raises(ValueError):
+            CachingEmbeddingFunc(embedding_func)
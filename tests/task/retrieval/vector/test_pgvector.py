@@ -0,0 +1,201 @@
+import unittest
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from llmsmith.task.models import TaskInput
+from llmsmith.task.retrieval.vector.base import TaskInputWithEmbedding
+from llmsmith.task.retrieval.vector.options.pgvector import PgVectorQueryOptions
+from llmsmith.task.retrieval.vector.pgvector import PgVectorRetriever
+
+
+class PgVectorRetrieverTest(unittest.IsolatedAsyncioTestCase):
+    async def test_execute_with_default_options(self):
+        mock_engine, mock_conn = self._mock_engine(["retrieved_doc1", "retrieved_doc2"])
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=lambda x: [[1, 2]],
+        )
+
+        output = await retriever.execute(TaskInput("query"))
+
+        stmt = mock_conn.execute.call_args.args[0].compile(
+            dialect=postgresql.psycopg.dialect()
+        )
+        assert " ".join(str(stmt).split()) == (
+            "SELECT * FROM docs ORDER BY docs.embedding <=> %(embedding_val)s "
+            "LIMIT %(param_1)s::INTEGER"
+        )
+        assert stmt.params == {"embedding_val": None, "param_1": 10}
+        assert mock_conn.execute.call_args.args[1] == {"embedding_val": [1, 2]}
+        assert output.content == "retrieved_doc1\n---\nretrieved_doc2"
+        assert output.raw_output == [
+            {"content": "retrieved_doc1", "id": 0},
+            {"content": "retrieved_doc2", "id": 1},
+        ]
+
+    async def test_execute_with_l2_distance(self):
+        mock_engine, mock_conn = self._mock_engine(["retrieved_doc1"])
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=lambda x: [[1, 2]],
+            query_options=PgVectorQueryOptions(distance_function="l2", limit=5),
+        )
+
+        await retriever.execute(TaskInput("query"))
+
+        stmt = mock_conn.execute.call_args.args[0].compile(
+            dialect=postgresql.psycopg.dialect()
+        )
+        assert "ORDER BY docs.embedding <-> %(embedding_val)s" in str(stmt)
+        assert stmt.params["param_1"] == 5
+
+    async def test_execute_many(self):
+        mock_engine, mock_conn = self._mock_engine([])
+        mock_conn.execute.return_value = [
+            mock.Mock(
+                _mapping={
+                    "content": doc,
+                    "id": idx,
+                    "_llmsmith_query_idx": query_idx,
+                    "_llmsmith_distance": 0.1,
+                }
+            )
+            for idx, (query_idx, doc) in enumerate(
+                [(0, "retrieved_doc1"), (0, "retrieved_doc2"), (1, "retrieved_doc3")]
+            )
+        ]
+        embedding_func = mock.Mock(return_value=[[1, 2], [3, 4], [5, 6]])
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=embedding_func,
+            query_options=PgVectorQueryOptions(limit=2),
+        )
+
+        outputs = await retriever.execute_many(
+            [TaskInput("query1"), TaskInput("query2"), TaskInput("query3")]
+        )
+
+        embedding_func.assert_called_once_with(["query1", "query2", "query3"])
+        mock_conn.execute.assert_called_once()
+        stmt = mock_conn.execute.call_args.args[0].compile(
+            dialect=postgresql.psycopg.dialect()
+        )
+        assert " ".join(str(stmt).split()) == (
+            "(SELECT *, 0 AS _llmsmith_query_idx, docs.embedding <=> %(embedding_val_0)s AS _llmsmith_distance "
+            "FROM docs ORDER BY docs.embedding <=> %(embedding_val_0)s LIMIT %(param_1)s::INTEGER) "
+            "UNION ALL "
+            "(SELECT *, 1 AS _llmsmith_query_idx, docs.embedding <=> %(embedding_val_1)s AS _llmsmith_distance "
+            "FROM docs ORDER BY docs.embedding <=> %(embedding_val_1)s LIMIT %(param_2)s::INTEGER) "
+            "UNION ALL "
+            "(SELECT *, 2 AS _llmsmith_query_idx, docs.embedding <=> %(embedding_val_2)s AS _llmsmith_distance "
+            "FROM docs ORDER BY docs.embedding <=> %(embedding_val_2)s LIMIT %(param_3)s::INTEGER) "
+            "ORDER BY _llmsmith_query_idx, _llmsmith_distance"
+        )
+        assert [output.content for output in outputs] == [
+            "retrieved_doc1\n---\nretrieved_doc2",
+            "retrieved_doc3",
+            "",
+        ]
+        assert outputs[0].raw_output == [
+            {"content": "retrieved_doc1", "id": 0},
+            {"content": "retrieved_doc2", "id": 1},
+        ]
+        assert outputs[2].raw_output == []
+
+    async def test_execute_many_with_precomputed_embeddings(self):
+        mock_engine, mock_conn = self._mock_engine([])
+        embedding_func = mock.Mock(return_value=[[3, 4]])
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=embedding_func,
+        )
+
+        await retriever.execute_many(
+            [
+                TaskInputWithEmbedding(content="query1", embedding=[1, 2]),
+                TaskInput("query2"),
+                TaskInputWithEmbedding(content="query3", embedding=[5, 6]),
+            ]
+        )
+
+        embedding_func.assert_called_once_with(["query2"])
+        assert mock_conn.execute.call_args.args[1] == {
+            "embedding_val_0": [1, 2],
+            "embedding_val_1": [3, 4],
+            "embedding_val_2": [5, 6],
+        }
+
+    def test_init_with_unsupported_distance_function(self):
+        with pytest.raises(ValueError):
+            PgVectorRetriever(
+                name="test",
+                db_engine=mock.MagicMock(),
+                table_name="docs",
+                text_colname="content",
+                embedding_colname="embedding",
+                embedding_func=lambda x: [[1]],
+                query_options=PgVectorQueryOptions(distance_function="dot"),
+            )
+
+    async def test_warmup(self):
+        mock_engine = mock.MagicMock()
+        mock_conn = mock.AsyncMock()
+        mock_engine.connect.return_value.__aenter__.return_value = mock_conn
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=lambda x: [[1]],
+        )
+
+        await retriever.warmup(connections=3)
+
+        assert mock_engine.connect.call_count == 3
+        assert mock_conn.execute.call_count == 3
+
+    async def test_warmup_with_invalid_connections(self):
+        mock_engine = mock.MagicMock()
+        retriever = PgVectorRetriever(
+            name="test",
+            db_engine=mock_engine,
+            table_name="docs",
+            text_colname="content",
+            embedding_colname="embedding",
+            embedding_func=lambda x: [[1]],
+        )
+
+        with pytest.raises(ValueError):
+            await retriever.warmup(connections=0)
+
+        assert not mock_engine.connect.called
+
+    def _mock_engine(self, docs):
+        mock_engine = mock.MagicMock()
+        mock_conn = mock.AsyncMock()
+        mock_engine.connect.return_value.__aenter__.return_value = mock_conn
+        mock_conn.execute.return_value = [
+            mock.Mock(_mapping={"content": doc, "id": idx})
+            for idx, doc in enumerate(docs)
+        ]
+
+        return mock_engine, mock_conn
@@ -164,6 +164,57 @@ class PineconeRetrieverTest(unittest.IsolatedAsyncioTestCase):
 
         assert output.content == "retrieved_doc2\n---\nretrieved_doc1"
 
+    async def test_execute_many(self):
+        mock_index = mock.Mock()
+        mock_index.query.side_effect = [
+            QueryResponse(
+                matches=[ScoredVector(id="id1", metadata={"doc": "retrieved_doc1"})]
+            ),
+            QueryResponse(
+                matches=[ScoredVector(id="id2", metadata={"doc": "retrieved_doc2"})]
+            ),
+        ]
+        embedding_func = mock.Mock(return_value=[[1], [2]])
+        retriever = PineconeRetriever(
+            name="test",
+            index=mock_index,
+            embedding_func=embedding_func,
+            text_field_name="doc",
+        )
+
+        outputs = await retriever.execute_many(
+            [TaskInput("query1"), TaskInput("query2")]
+        )
+
+        embedding_func.assert_called_once_with(["query1", "query2"])
+        assert [call.kwargs["vector"] for call in mock_index.query.call_args_list] == [
+            [[1]],
+            [[2]],
+        ]
+        assert [output.content for output in outputs] == [
+            "retrieved_doc1",
+            "retrieved_doc2",
+        ]
+
+    async def test_execute_with_async_index(self):
+        mock_index = mock.Mock()
+        mock_index.query = mock.AsyncMock(
+            return_value=QueryResponse(
+                matches=[ScoredVector(id="id1", metadata={"doc": "retrieved_doc1"})]
+            )
+        )
+        retriever = PineconeRetriever(
+            name="test",
+            index=mock_index,
+            embedding_func=lambda x: [[1]],
+            text_field_name="doc",
+        )
+
+        output = await retriever.execute(TaskInput("query"))
+
+        mock_index.query.assert_awaited_once()
+        assert output.content == "retrieved_doc1"
+
     def _pinecone_custom_doc_processor(self, docs: List[str]) -> str:
         processed_docs = []
         for idx, doc in enumerate(docs):
@@ -1,10 +1,14 @@
+import asyncio
 from typing import List
 import unittest
 from unittest import mock
 
+import numpy as np
 from qdrant_client.conversions.common_types import ScoredPoint
 
 from llmsmith.task.models import TaskInput
+from llmsmith.task.retrieval.vector.base import TaskInputWithEmbedding
+from llmsmith.task.retrieval.vector.embedding import EmbeddingBatcher
 from llmsmith.task.retrieval.vector.qdrant import QdrantRetriever
 
 
@@ -138,6 +142,158 @@ class QdrantRetrieverTest(unittest.IsolatedAsyncioTestCase):
 
         assert output.content == "retrieved_doc2\n---\nretrieved_doc1"
 
+    async def test_execute_with_embedding_batcher(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search.return_value = [
+            ScoredPoint(id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}),
+        ]
+        embedding_func = mock.Mock(return_value=[[1], [2]])
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=embedding_func,
+            embedded_field_name="doc",
+            embedding_batcher=EmbeddingBatcher(embedding_func),
+        )
+
+        await asyncio.gather(
+            retriever.execute(TaskInput("query1")),
+            retriever.execute(TaskInput("query2")),
+        )
+
+        embedding_func.assert_called_once_with(["query1", "query2"])
+        assert [
+            call.kwargs["query_vector"] for call in mock_client.search.call_args_list
+        ] == [[1], [2]]
+
+    async def test_execute_many(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search_batch.return_value = [
+            [
+                ScoredPoint(
+                    id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}
+                )
+            ],
+            [
+                ScoredPoint(
+                    id=2, version=1, score=1.0, payload={"doc": "retrieved_doc2"}
+                )
+            ],
+        ]
+        mock_reranker = mock.AsyncMock()
+        mock_reranker.rerank_many.return_value = [["reranked_doc1"], ["reranked_doc2"]]
+        embedding_func = mock.Mock(return_value=[[1], [2]])
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=embedding_func,
+            embedded_field_name="doc",
+            reranker=mock_reranker,
+        )
+
+        outputs = await retriever.execute_many(
+            [TaskInput("query1"), TaskInput("query2")]
+        )
+
+        embedding_func.assert_called_once_with(["query1", "query2"])
+        search_kwargs = mock_client.search_batch.call_args.kwargs
+        assert search_kwargs["collection_name"] == "test_collection"
+        assert [request.vector for request in search_kwargs["requests"]] == [[1], [2]]
+        assert all(request.limit == 10 for request in search_kwargs["requests"])
+        mock_reranker.rerank_many.assert_called_with(
+            ["query1", "query2"], [["retrieved_doc1"], ["retrieved_doc2"]]
+        )
+        assert [output.content for output in outputs] == [
+            "reranked_doc1",
+            "reranked_doc2",
+        ]
+
+    async def test_execute_for_points_without_payload(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search.return_value = [
+            ScoredPoint(id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}),
+            ScoredPoint(id=2, version=1, score=0.9, payload=None),
+            ScoredPoint(id=3, version=1, score=0.8, payload={"other": "value"}),
+        ]
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=lambda x: [[1]],
+            embedded_field_name="doc",
+            doc_processing_func=lambda docs: docs,
+        )
+
+        output = await retriever.execute(TaskInput("query"))
+
+        assert output.content == ["retrieved_doc1", "", ""]
+
+    async def test_execute_with_precomputed_embedding(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search.return_value = [
+            ScoredPoint(id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}),
+        ]
+        embedding_func = mock.Mock()
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=embedding_func,
+            embedded_field_name="doc",
+        )
+
+        output = await retriever.execute(
+            TaskInputWithEmbedding(content="query", embedding=[3])
+        )
+
+        assert not embedding_func.called
+        assert mock_client.search.call_args.kwargs["query_vector"] == [3]
+        assert output.content == "retrieved_doc1"
+
+    async def test_execute_with_async_embedding_func(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search.return_value = [
+            ScoredPoint(id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}),
+        ]
+
+        async def embedding_func(texts):
+            return [[2] for _ in texts]
+
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=embedding_func,
+            embedded_field_name="doc",
+        )
+
+        output = await retriever.execute(TaskInput("query"))
+
+        assert mock_client.search.call_args.kwargs["query_vector"] == [2]
+        assert output.content == "retrieved_doc1"
+
+    async def test_execute_with_numpy_embedding(self):
+        mock_client = mock.AsyncMock()
+        mock_client.search.return_value = [
+            ScoredPoint(id=1, version=1, score=1.0, payload={"doc": "retrieved_doc1"}),
+        ]
+
+        retriever = QdrantRetriever(
+            name="test",
+            client=mock_client,
+            collection_name="test_collection",
+            embedding_func=lambda texts: [np.array([0.5, 1.5]) for _ in texts],
+            embedded_field_name="doc",
+        )
+
+        await retriever.execute(TaskInput("query"))
+
+        query_vector = mock_client.search.call_args.kwargs["query_vector"]
+        assert isinstance(query_vector, list)
+        assert query_vector == [0.5, 1.5]
+
     def _qdrant_custom_doc_processor(self, docs: List[str]) -> str:
         processed_docs = []
         for idx, doc in enumerate(docs):
@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+
+import pytest
+
+from llmsmith.task.circuit_breaker import CircuitBreakerTask
+from llmsmith.task.errors import CircuitBreakerOpenException
+from llmsmith.task.models import TaskInput, TaskOutput
+
+
+def patch_monotonic(value: float):
+    return mock.patch(
+        "llmsmith.task.circuit_breaker.time.monotonic", return_value=value
+    )
+
+
+class CircuitBreakerTaskTest(unittest.IsolatedAsyncioTestCase):
+    def test_init_with_invalid_params(self):
+        for params in [{"failure_threshold": 0}, {"reset_timeout": 0}]:
+            with self.subTest(params=params):
+                with pytest.raises(ValueError):
+                    CircuitBreakerTask(name="test", task=mock.AsyncMock(), **params)
+
+    async def test_execute_opens_circuit_after_consecutive_failures(self):
+        task = mock.AsyncMock()
+        task.execute.side_effect = ConnectionError("failed")
+        breaker_task = CircuitBreakerTask(
+            name="test", task=task, failure_threshold=2, reset_timeout=10
+        )
+
+        with patch_monotonic(100):
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    await breaker_task.execute(TaskInput("query"))
+
+            assert breaker_task.is_open
+
+            with pytest.raises(CircuitBreakerOpenException) as exc_info:
+                await breaker_task.execute(TaskInput("query"))
+
+        assert exc_info.value.retry_after == 10
+        assert task.execute.call_count == 2
+
+    async def test_execute_closes_circuit_after_successful_trial(self):
+        task = mock.AsyncMock()
+        task.execute.side_effect = [
+            ConnectionError("failed"),
+            TaskOutput(content="llm response", raw_output=None),
+        ]
+        breaker_task = CircuitBreakerTask(
+            name="test", task=task, failure_threshold=1, reset_timeout=10
+        )
+
+        with patch_monotonic(100):
+            with pytest.raises(ConnectionError):
+                await breaker_task.execute(TaskInput("query"))
+
+        with patch_monotonic(110):
+            output = await breaker_task.execute(TaskInput("query"))
+
+        assert output.content == "llm response"
+        assert not breaker_task.is_open
+
+    async def test_execute_reopens_circuit_after_failed_trial(self):
+        task = mock.AsyncMock()
+        task.execute.side_effect = ConnectionError("failed")
+        breaker_task = CircuitBreakerTask(
+            name="test", task=task, failure_threshold=1, reset_timeout=10
+        )
+
+        with patch_monotonic(100):
+            with pytest.raises(ConnectionError):
+                await breaker_task.execute(TaskInput("query"))
+
+        with patch_monotonic(110):
+            with pytest.raises(ConnectionError):
+                await breaker_task.execute(TaskInput("query"))
+
+            with pytest.raises(CircuitBreakerOpenException):
+                await breaker_task.execute(TaskInput("query"))
+
+        assert task.execute.call_count == 2
+
+    async def test_execute_ignores_other_exceptions(self):
+        task = mock.AsyncMock()
+        task.execute.side_effect = ValueError("invalid input")
+        breaker_task = CircuitBreakerTask(
+            name="test",
+            task=task,
+            failure_threshold=1,
+            failure_exceptions=(ConnectionError,),
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await breaker_task.execute(TaskInput("query"))
+
+        assert not breaker_task.is_open
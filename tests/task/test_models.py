@@ -0,0 +1,36 @@
+import copy
+import pickle
+import unittest
+
+from llmsmith.task.models import ChatResponse, FunctionCall, TaskInput, TaskOutput
+from llmsmith.task.retrieval.vector.base import TaskInputWithEmbedding
+
+
+class TaskModelsTest(unittest.TestCase):
+    def test_copy_and_pickle_round_trip(self):
+        models = [
+            TaskInput("query"),
+            TaskInputWithEmbedding(content="query", embedding=[0.5, 1.5]),
+            TaskOutput(content="output", raw_output={"raw": "output"}),
+            FunctionCall(id="1", name="some_func", args={"arg": 1}),
+            ChatResponse(
+                text="reply",
+                raw_output=None,
+                function_calls={"1": FunctionCall(id="1", name="some_func", args={})},
+            ),
+        ]
+
+        for model in models:
+            with self.subTest(model=type(model).__name__):
+                assert copy.copy(model) == model
+                assert copy.deepcopy(model) == model
+                assert pickle.loads(pickle.dumps(model)) == model
+
+    def test_task_output_is_mutable(self):
+        task_output = TaskOutput(content="output", raw_output=None)
+        task_output.content = "modified output"
+
+        assert task_output.content == "modified output"
+
+    def test_chat_response_without_function_calls(self):
+        assert ChatResponse(text="reply", raw_output=None).function_calls is None
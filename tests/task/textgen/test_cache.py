@@ -0,0 +1,104 @@
+import unittest
+from unittest import mock
+
+import pytest
+
+from llmsmith.task.models import ChatResponse
+from llmsmith.task.textgen.cache import ChatResponseCache
+
+
+class ChatResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    def test_init_with_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ChatResponseCache(maxsize=0)
+
+        with pytest.raises(ValueError):
+            ChatResponseCache(ttl=0)
+
+    async def test_cached_chat_for_same_request(self):
+        cache = ChatResponseCache()
+        chat_func = mock.AsyncMock(
+            return_value=ChatResponse(text="llm response", raw_output=None)
+        )
+
+        res_1 = await cache.cached_chat(chat_func, {"temperature": 0}, message="hi")
+        res_2 = await cache.cached_chat(chat_func, {"temperature": 0}, message="hi")
+
+        assert res_1.text == "llm response"
+        assert res_2 is res_1
+        chat_func.assert_called_once_with(message="hi")
+
+    async def test_cached_chat_for_different_requests(self):
+        cache = ChatResponseCache()
+        chat_func = mock.AsyncMock(
+            return_value=ChatResponse(text="llm response", raw_output=None)
+        )
+
+        await cache.cached_chat(chat_func, {"temperature": 0}, message="hi")
+        await cache.cached_chat(chat_func, {"temperature": 0}, message="hello")
+        await cache.cached_chat(
+            chat_func, {"model": "x", "temperature": 0}, message="hi"
+        )
+
+        assert chat_func.call_count == 3
+        assert len(cache) == 3
+
+    def test_put_evicts_least_recently_used_response(self):
+        cache = ChatResponseCache(maxsize=2)
+
+        cache.put(b"a", ChatResponse(text="a", raw_output=None))
+        cache.put(b"b", ChatResponse(text="b", raw_output=None))
+        cache.get(b"a")
+        cache.put(b"c", ChatResponse(text="c", raw_output=None))
+
+        assert cache.get(b"a").text == "a"
+        assert cache.get(b"b") is None
+        assert cache.get(b"c").text == "c"
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    async def test_cached_chat_for_different_clients(self):
+        cache = ChatResponseCache()
+        chat_func = mock.AsyncMock(
+            return_value=ChatResponse(text="llm response", raw_output=None)
+        )
+        client_1 = mock.Mock(api_key="key-1", base_url="https://llm")
+        client_2 = mock.Mock(api_key="key-2", base_url="https://llm")
+        client_3 = mock.Mock(api_key="key-1", base_url="https://llm")
+
+        await cache.cached_chat(chat_func, {}, client=client_1, message="hi")
+        await cache.cached_chat(chat_func, {}, client=client_2, message="hi")
+        await cache.cached_chat(chat_func, {}, client=client_3, message="hi")
+
+        # Clients with the same API key and base URL share the cached responses
+        assert chat_func.call_count == 2
+
+    async def test_cached_chat_for_non_serializable_request(self):
+        cache = ChatResponseCache()
+        chat_func = mock.AsyncMock(
+            return_value=ChatResponse(text="llm response", raw_output=None)
+        )
+
+        await cache.cached_chat(chat_func, {}, message=object())
+        await cache.cached_chat(chat_func, {}, message=object())
+
+        assert chat_func.call_count == 2
+        assert len(cache) == 0
+
+    async def test_cached_chat_for_expired_response(self):
+        cache = ChatResponseCache(ttl=10)
+        chat_func = mock.AsyncMock(
+            return_value=ChatResponse(text="llm response", raw_output=None)
+        )
+
+        with mock.patch("llmsmith.task.textgen.cache.time.monotonic") as monotonic:
+            monotonic.return_value = 100
+            await cache.cached_chat(chat_func, {}, message="hi")
+            monotonic.return_value = 105
+            await cache.cached_chat(chat_func, {}, message="hi")
+            monotonic.return_value = 111
+            await cache.cached_chat(chat_func, {}, message="hi")
+
+        assert chat_func.call_count == 2
@@ -1,4 +1,5 @@
 import unittest
+from typing import List
 from unittest import mock
 
 from anthropic.types.message import Message
@@ -93,3 +94,62 @@ class ClaudeTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
         )
 
         assert output.content == "hello"
+
+    async def test_stream(self):
+        mock_client = mock.AsyncMock()
+        mock.patch(
+            "llmsmith.task.textgen.claude.anthropic.AsyncAnthropic",
+            side_effect=mock_client,
+        )
+
+        mock_client.messages.stream = mock.MagicMock(
+            return_value=MockMessageStream(["hel", "lo"])
+        )
+        text_gen_task = ClaudeTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        chunks = [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        mock_client.messages.stream.assert_called_with(
+            messages=[{"role": "user", "content": "query"}],
+            model="claude-3-opus-20240229",
+            max_tokens=1024,
+            temperature=0.3,
+        )
+
+        assert chunks == ["hel", "lo"]
+
+    async def test_stream_with_invalid_input_value(self):
+        mock_client = mock.AsyncMock()
+        mock_client.messages.stream = mock.MagicMock()
+
+        text_gen_task = ClaudeTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        with pytest.raises(ValueError):
+            async for _ in text_gen_task.stream(TaskInput(123)):
+                pass
+
+        assert not mock_client.messages.stream.called
+
+
+class MockMessageStream:
+    """Mock for the async stream manager returned by the Anthropic messages streaming API"""
+
+    def __init__(self, texts: List[str]) -> None:
+        self.texts = texts
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+    @property
+    async def text_stream(self):
+        for text in self.texts:
+            yield text
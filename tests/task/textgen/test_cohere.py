@@ -1,7 +1,13 @@
+import asyncio
 import unittest
 from unittest import mock
 
 from cohere import NonStreamedChatResponse
+from cohere.types.streamed_chat_response import (
+    StreamedChatResponse_StreamEnd,
+    StreamedChatResponse_StreamStart,
+    StreamedChatResponse_TextGeneration,
+)
 import pytest
 
 from llmsmith.task.models import TaskInput
@@ -215,3 +221,108 @@ class CohereTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
         )
 
         assert output.content == "llm response"
+
+    async def test_execute_many_with_max_concurrency(self):
+        mock_client = mock.AsyncMock()
+        in_progress = 0
+        max_in_progress = 0
+
+        async def chat(message, **kwargs):
+            nonlocal in_progress, max_in_progress
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+            await asyncio.sleep(0.01)
+            in_progress -= 1
+            return NonStreamedChatResponse(
+                text=f"reply to {message}", finish_reason="COMPLETE"
+            )
+
+        mock_client.chat.side_effect = chat
+
+        text_gen_task = CohereTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        outputs = await text_gen_task.execute_many(
+            [TaskInput(f"query{i}") for i in range(5)], max_concurrency=2
+        )
+
+        assert [output.content for output in outputs] == [
+            f"reply to query{i}" for i in range(5)
+        ]
+        assert max_in_progress == 2
+
+        with pytest.raises(ValueError):
+            await text_gen_task.execute_many([TaskInput("query")], max_concurrency=0)
+
+    async def test_warmup(self):
+        mock_client = mock.AsyncMock()
+        text_gen_task = CohereTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        await text_gen_task.warmup()
+
+        mock_client.check_api_key.assert_called_once()
+        assert not mock_client.chat.called
+
+    async def test_stream(self):
+        mock_client = mock.MagicMock()
+        mock_client.chat_stream.return_value = _aiter(
+            [
+                StreamedChatResponse_StreamStart(generation_id="1"),
+                StreamedChatResponse_TextGeneration(text="hel"),
+                StreamedChatResponse_TextGeneration(text="lo"),
+                StreamedChatResponse_StreamEnd(
+                    finish_reason="COMPLETE",
+                    response=NonStreamedChatResponse(
+                        text="hello", finish_reason="COMPLETE"
+                    ),
+                ),
+            ]
+        )
+        text_gen_task = CohereTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        chunks = [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert chunks == ["hel", "lo"]
+        mock_client.chat_stream.assert_called_once_with(
+            message="query",
+            chat_history=None,
+            conversation_id=None,
+            model="command-r-plus",
+            temperature=0.3,
+        )
+
+    async def test_stream_for_failed_safety_check(self):
+        mock_client = mock.MagicMock()
+        mock_client.chat_stream.return_value = _aiter(
+            [
+                StreamedChatResponse_TextGeneration(text="hel"),
+                StreamedChatResponse_StreamEnd(
+                    finish_reason="ERROR_TOXIC",
+                    response=NonStreamedChatResponse(
+                        text="hel", finish_reason="ERROR_TOXIC"
+                    ),
+                ),
+            ]
+        )
+        text_gen_task = CohereTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        with pytest.raises(TextGenFailedException) as err:
+            [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert err.value.failure_reason == "SAFETY_CHECK_FAILED"
+
+
+async def _aiter(items: list):
+    for item in items:
+        yield item
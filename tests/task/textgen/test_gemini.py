@@ -1,7 +1,11 @@
 import unittest
 from unittest import mock
 
-from google.generativeai.types import GenerateContentResponse, HarmBlockThreshold
+from google.generativeai.types import (
+    AsyncGenerateContentResponse,
+    GenerateContentResponse,
+    HarmBlockThreshold,
+)
 from google.ai.generativelanguage_v1beta.types.generative_service import (
     GenerateContentResponse as ContentResponse,
 )
@@ -312,3 +316,68 @@ class GeminiTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
             tools=None,
             request_options=None,
         )
+
+    async def test_stream_with_default_llm_options(self):
+        mock_client = mock.AsyncMock()
+        mock_client.generate_content_async.return_value = (
+            await AsyncGenerateContentResponse.from_aiterator(
+                _aiter([_content_response("hel"), _content_response("lo")])
+            )
+        )
+        text_gen_task = GeminiTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        chunks = [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert chunks == ["hel", "lo"]
+        mock_client.generate_content_async.assert_called_with(
+            contents=[{"role": "user", "parts": ["query"]}],
+            stream=True,
+            generation_config=None,
+            safety_settings=None,
+            request_options=None,
+        )
+
+    async def test_stream_for_blocked_prompt(self):
+        mock_client = mock.AsyncMock()
+        blocked_response = _content_response("blocked")
+        blocked_response.prompt_feedback.block_reason = (
+            blocked_response.prompt_feedback.BlockReason.SAFETY
+        )
+        mock_client.generate_content_async.return_value = (
+            await AsyncGenerateContentResponse.from_aiterator(
+                _aiter([blocked_response])
+            )
+        )
+        text_gen_task = GeminiTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        with pytest.raises(PromptBlockedException) as err:
+            [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert err.value.block_reason == "SAFETY_CHECK_FAILED"
+
+
+async def _aiter(items: list):
+    for item in items:
+        yield item
+
+
+def _content_response(text: str) -> ContentResponse:
+    content_part = Part()
+    content_part.text = text
+    content = Content()
+    content.parts = [content_part]
+    candidate = Candidate()
+    candidate.index = 0
+    candidate.content = content
+
+    content_res = ContentResponse()
+    content_res.prompt_feedback = ContentResponse.PromptFeedback()
+    content_res.candidates = [candidate]
+
+    return content_res
@@ -7,9 +7,13 @@ from groq.types.chat.chat_completion import (
     ChoiceMessage,
     ChoiceLogprobs,
 )
+from groq.lib.chat_completion_chunk import ChatCompletionChunk, ChoiceDelta
+from groq.lib.chat_completion_chunk import Choice as ChunkChoice
+from groq.lib.chat_completion_chunk import ChoiceLogprobs as ChunkChoiceLogprobs
 import pytest
 
 from llmsmith.task.models import TaskInput
+from llmsmith.task.textgen.cache import ChatResponseCache
 from llmsmith.task.textgen.errors import TextGenFailedException
 from llmsmith.task.textgen.groq import GroqTextGenTask
 from llmsmith.task.textgen.options.groq import GroqTextGenOptions
@@ -167,8 +171,8 @@ class GroqTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
 
         mock_client.chat.completions.create.assert_called_with(
             messages=[
-                {"role": "user", "content": "query"},
                 {"role": "system", "content": "sys prompt"},
+                {"role": "user", "content": "query"},
             ],
             tools=None,
             model="test-gpt",
@@ -189,3 +193,101 @@ class GroqTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
         )
 
         assert output.content == "hello"
+
+    async def test_execute_with_response_cache(self):
+        mock_client = mock.AsyncMock()
+        mock_client.chat.completions.create.return_value = ChatCompletion(
+            id="1",
+            choices=[
+                Choice(
+                    index=1,
+                    finish_reason="stop",
+                    logprobs=ChoiceLogprobs(content=None),
+                    message=ChoiceMessage(content="hello", role="assistant"),
+                )
+            ],
+            created=1,
+            model="llama3-70b-8192",
+            object="chat.completion",
+        )
+        response_cache = ChatResponseCache()
+
+        deterministic_task = GroqTextGenTask(
+            name="test",
+            llm=mock_client,
+            llm_options=GroqTextGenOptions(model="test-gpt", temperature=0),
+            response_cache=response_cache,
+        )
+        output_1 = await deterministic_task.execute(TaskInput("query"))
+        output_2 = await deterministic_task.execute(TaskInput("query"))
+
+        assert output_1.content == output_2.content == "hello"
+        assert mock_client.chat.completions.create.call_count == 1
+
+        non_deterministic_task = GroqTextGenTask(
+            name="test",
+            llm=mock_client,
+            llm_options=GroqTextGenOptions(model="test-gpt", temperature=0.7),
+            response_cache=response_cache,
+        )
+        await non_deterministic_task.execute(TaskInput("query"))
+        await non_deterministic_task.execute(TaskInput("query"))
+
+        assert mock_client.chat.completions.create.call_count == 3
+        assert len(response_cache) == 1
+
+    async def test_warmup(self):
+        mock_client = mock.AsyncMock()
+        text_gen_task = GroqTextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        await text_gen_task.warmup()
+
+        mock_client.models.list.assert_called_once()
+        assert not mock_client.chat.completions.create.called
+
+    async def test_stream_with_system_prompt(self):
+        mock_client = mock.AsyncMock()
+        mock_client.chat.completions.create.return_value = _aiter(
+            [_chunk("hel"), _chunk(""), _chunk("lo")]
+        )
+        text_gen_task = GroqTextGenTask(
+            name="test",
+            llm=mock_client,
+            llm_options=GroqTextGenOptions(model="test-gpt", system_prompt="be brief"),
+        )
+
+        chunks = [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert chunks == ["hel", "lo"]
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["messages"] == [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "query"},
+        ]
+
+
+async def _aiter(items: list):
+    for item in items:
+        yield item
+
+
+def _chunk(content: str) -> ChatCompletionChunk:
+    # Groq specific (usage) fields are not required for the tests, hence validation is skipped
+    return ChatCompletionChunk.construct(
+        id="1",
+        choices=[
+            ChunkChoice(
+                index=0,
+                delta=ChoiceDelta(content=content, role="assistant"),
+                finish_reason="",
+                logprobs=ChunkChoiceLogprobs(content=None),
+            )
+        ],
+        created=1,
+        model="llama3-70b-8192",
+        object="chat.completion.chunk",
+    )
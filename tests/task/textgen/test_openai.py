@@ -2,12 +2,19 @@ import unittest
 from unittest import mock
 
 from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.chat.chat_completion_message_tool_call import (
+    ChatCompletionMessageToolCall,
+    Function,
+)
 import pytest
 
 from llmsmith.task.models import TaskInput
 from llmsmith.task.textgen.errors import TextGenFailedException
-from llmsmith.task.textgen.openai import OpenAITextGenTask
+from llmsmith.task.textgen.openai import BaseOpenAIChat, OpenAITextGenTask
 from llmsmith.task.textgen.options.openai import OpenAITextGenOptions
 
 
@@ -160,8 +167,8 @@ class OpenAITextGenTaskTest(unittest.IsolatedAsyncioTestCase):
 
         mock_client.chat.completions.create.assert_called_with(
             messages=[
-                {"role": "user", "content": "query"},
                 {"role": "system", "content": "sys prompt"},
+                {"role": "user", "content": "query"},
             ],
             model="test-gpt",
             frequency_penalty=None,
@@ -182,3 +189,117 @@ class OpenAITextGenTaskTest(unittest.IsolatedAsyncioTestCase):
         )
 
         assert output.content == "hello"
+
+    async def test_stream_with_default_llm_options(self):
+        mock_client = mock.AsyncMock()
+        mock_client.chat.completions.create.return_value = MockStream(
+            [_chunk("hel"), _chunk(None), _chunk("lo"), _chunk(None, choices=False)]
+        )
+        text_gen_task = OpenAITextGenTask(
+            name="test",
+            llm=mock_client,
+            llm_options=OpenAITextGenOptions(
+                model="gpt-4", temperature=0, system_prompt="be brief"
+            ),
+        )
+
+        chunks = [text async for text in text_gen_task.stream(TaskInput("query"))]
+
+        assert chunks == ["hel", "lo"]
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["model"] == "gpt-4"
+        assert call_kwargs["messages"] == [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "query"},
+        ]
+
+    async def test_stream_with_invalid_input_value(self):
+        mock_client = mock.AsyncMock()
+        text_gen_task = OpenAITextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        with pytest.raises(ValueError):
+            [text async for text in text_gen_task.stream(TaskInput(123))]
+
+        assert not mock_client.chat.completions.create.called
+
+    async def test_warmup(self):
+        mock_client = mock.AsyncMock()
+        text_gen_task = OpenAITextGenTask(
+            name="test",
+            llm=mock_client,
+        )
+
+        await text_gen_task.warmup()
+
+        mock_client.models.list.assert_called_once()
+        assert not mock_client.chat.completions.create.called
+
+    async def test_chat_with_tool_calls(self):
+        mock_client = mock.AsyncMock()
+        mock_client.chat.completions.create.return_value = ChatCompletion(
+            id="1",
+            choices=[
+                Choice(
+                    index=0,
+                    finish_reason="stop",
+                    message=ChatCompletionMessage(content="hello", role="assistant"),
+                ),
+                Choice(
+                    index=1,
+                    finish_reason="tool_calls",
+                    message=ChatCompletionMessage(
+                        content=None,
+                        role="assistant",
+                        tool_calls=[
+                            ChatCompletionMessageToolCall(
+                                id="call_1",
+                                type="function",
+                                function=Function(
+                                    name="get_weather", arguments='{"city": "Paris"}'
+                                ),
+                            )
+                        ],
+                    ),
+                ),
+            ],
+            created=1,
+            model="gpt-3.5-turbo",
+            object="chat.completion",
+        )
+
+        chat_response = await BaseOpenAIChat(mock_client).chat(
+            [{"role": "user", "content": "query"}]
+        )
+
+        function_call = chat_response.function_calls["call_1"]
+        assert function_call.name == "get_weather"
+        assert function_call.args == {"city": "Paris"}
+
+
+class MockStream:
+    """Mock for the async stream returned by the OpenAI chat completions API"""
+
+    def __init__(self, chunks: list) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _chunk(content, choices=True) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="1",
+        choices=(
+            [ChunkChoice(index=0, delta=ChoiceDelta(content=content))]
+            if choices
+            else []
+        ),
+        created=1,
+        model="gpt-4",
+        object="chat.completion.chunk",
+    )
@@ -0,0 +1,132 @@
+import unittest
+from unittest import mock
+
+import pytest
+
+from llmsmith.task.models import TaskInput, TaskOutput
+from llmsmith.task.textgen.semantic_cache import SemanticCacheTextGenTask
+
+
+EMBEDDINGS = {
+    "what is the capital of france?": [1.0, 0.0, 0.0],
+    "what's the capital of france?": [0.95, 0.1, 0.0],
+    "how tall is mount everest?": [0.0, 1.0, 0.0],
+    "how deep is the pacific ocean?": [0.0, 0.0, 1.0],
+}
+
+
+def embedding_func(texts):
+    return [EMBEDDINGS[text] for text in texts]
+
+
+def text_gen_task():
+    task = mock.AsyncMock()
+    task.execute.side_effect = lambda task_input: TaskOutput(
+        content=f"answer to {task_input.content}", raw_output=None
+    )
+    return task
+
+
+class SemanticCacheTextGenTaskTest(unittest.IsolatedAsyncioTestCase):
+    def test_init_with_invalid_params(self):
+        for params in [
+            {"similarity_threshold": 0},
+            {"similarity_threshold": 1.5},
+            {"maxsize": 0},
+            {"ttl": 0},
+        ]:
+            with self.subTest(params=params):
+                with pytest.raises(ValueError):
+                    SemanticCacheTextGenTask(
+                        name="test",
+                        task=text_gen_task(),
+                        embedding_func=embedding_func,
+                        **params,
+                    )
+
+    async def test_execute_for_same_input(self):
+        task = text_gen_task()
+        embedding_func_mock = mock.Mock(side_effect=embedding_func)
+        cached_task = SemanticCacheTextGenTask(
+            name="test", task=task, embedding_func=embedding_func_mock
+        )
+
+        output_1 = await cached_task.execute(
+            TaskInput("what is the capital of france?")
+        )
+        output_2 = await cached_task.execute(
+            TaskInput("what is the capital of france?")
+        )
+
+        assert output_2 is output_1
+        task.execute.assert_called_once()
+        # exact matches are served without computing the embeddings
+        embedding_func_mock.assert_called_once()
+        assert (cached_task.hits, cached_task.misses) == (1, 1)
+
+    async def test_execute_for_similar_input(self):
+        task = text_gen_task()
+        cached_task = SemanticCacheTextGenTask(
+            name="test", task=task, embedding_func=embedding_func
+        )
+
+        output_1 = await cached_task.execute(
+            TaskInput("what is the capital of france?")
+        )
+        output_2 = await cached_task.execute(TaskInput("what's the capital of france?"))
+
+        assert output_2 is output_1
+        task.execute.assert_called_once()
+
+    async def test_execute_for_different_input(self):
+        task = text_gen_task()
+        cached_task = SemanticCacheTextGenTask(
+            name="test", task=task, embedding_func=embedding_func
+        )
+
+        await cached_task.execute(TaskInput("what is the capital of france?"))
+        output = await cached_task.execute(TaskInput("how tall is mount everest?"))
+
+        assert output.content == "answer to how tall is mount everest?"
+        assert task.execute.call_count == 2
+        assert (cached_task.hits, cached_task.misses) == (0, 2)
+
+    async def test_execute_evicts_least_recently_used_output(self):
+        task = text_gen_task()
+        cached_task = SemanticCacheTextGenTask(
+            name="test", task=task, embedding_func=embedding_func, maxsize=2
+        )
+
+        await cached_task.execute(TaskInput("what is the capital of france?"))
+        await cached_task.execute(TaskInput("how tall is mount everest?"))
+        await cached_task.execute(TaskInput("what is the capital of france?"))
+        await cached_task.execute(TaskInput("how deep is the pacific ocean?"))
+
+        assert task.execute.call_count == 3
+
+        await cached_task.execute(TaskInput("what is the capital of france?"))
+        assert task.execute.call_count == 3
+
+        await cached_task.execute(TaskInput("how tall is mount everest?"))
+        assert task.execute.call_count == 4
+
+    async def test_execute_for_expired_output(self):
+        task = text_gen_task()
+        cached_task = SemanticCacheTextGenTask(
+            name="test", task=task, embedding_func=embedding_func, ttl=10
+        )
+
+        with mock.patch(
+            "llmsmith.task.textgen.semantic_cache.time.monotonic", return_value=100
+        ):
+            await cached_task.execute(TaskInput("what is the capital of france?"))
+
+        with mock.patch(
+            "llmsmith.task.textgen.semantic_cache.time.monotonic", return_value=111
+        ):
+            output = await cached_task.execute(
+                TaskInput("what's the capital of france?")
+            )
+
+        assert output.content == "answer to what's the capital of france?"
+        assert task.execute.call_count == 2
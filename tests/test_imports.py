@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import unittest
+
+
+PROVIDER_SDKS = {
+    "cohere": "cohere",
+    "gemini": "google.generativeai",
+    "groq": "groq",
+    "openai": "openai",
+}
+
+TOOL_PROVIDER_SDKS = {
+    "cohere": "cohere",
+    "gemini": "google.ai.generativelanguage_v1beta",
+    "groq": "groq",
+    "openai": "openai",
+}
+
+TEXTGEN_PROVIDER_SDKS = {
+    "claude": "anthropic",
+    "cohere": "cohere",
+    "gemini": "google.generativeai",
+    "groq": "groq",
+    "openai": "openai",
+}
+
+
+def loaded_sdks(module: str, sdks: list) -> list:
+    """Imports the given module in a fresh interpreter and returns the provider SDKs loaded by it"""
+
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(sdk for sdk in {sdks} if sdk in sys.modules))"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return [sdk for sdk in res.stdout.strip().split(",") if sdk]
+
+
+class ImportsTest(unittest.TestCase):
+    def test_function_agent_imports_only_its_provider_sdk(self):
+        for provider, sdk in PROVIDER_SDKS.items():
+            with self.subTest(provider=provider):
+                assert loaded_sdks(
+                    f"llmsmith.agent.function.{provider}", list(PROVIDER_SDKS.values())
+                ) == [sdk]
+
+    def test_tool_imports_only_its_provider_sdk(self):
+        for provider, sdk in TOOL_PROVIDER_SDKS.items():
+            with self.subTest(provider=provider):
+                assert loaded_sdks(
+                    f"llmsmith.agent.tool.{provider}", list(TOOL_PROVIDER_SDKS.values())
+                ) == [sdk]
+
+    def test_textgen_imports_only_its_provider_sdk(self):
+        for provider, sdk in TEXTGEN_PROVIDER_SDKS.items():
+            with self.subTest(provider=provider):
+                assert loaded_sdks(
+                    f"llmsmith.task.textgen.{provider}",
+                    list(TEXTGEN_PROVIDER_SDKS.values()),
+                ) == [sdk]
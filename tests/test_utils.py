@@ -0,0 +1,20 @@
+import json
+import unittest
+from unittest import mock
+
+from llmsmith.utils import json_dumps, json_loads
+
+
+class JsonUtilsTest(unittest.TestCase):
+    def test_json_dumps_and_loads(self):
+        obj = {"city": "Kochi", "days": 3, "tags": ["beach", "food"]}
+
+        assert json.loads(json_dumps(obj)) == obj
+        assert json_loads(json.dumps(obj)) == obj
+
+    def test_json_dumps_and_loads_without_orjson(self):
+        obj = {"city": "Kochi", "days": 3}
+
+        with mock.patch("llmsmith.utils.orjson", None):
+            assert json_dumps(obj) == json.dumps(obj)
+            assert json_loads(json.dumps(obj)) == obj